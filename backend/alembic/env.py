@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from app.db.database import Base
 from app.core.config import settings
-from app.models.page import Page  # 모든 모델 import
+import app.models  # noqa: F401  모든 모델 import (metadata 등록)
 
 # Alembic Config 객체
 config = context.config
@@ -0,0 +1,54 @@
+"""Add github_outbox table for write-behind commits
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'github_outbox',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('page_id', sa.Integer(), nullable=True),
+
+        # 작업 내용
+        sa.Column('operation', sa.String(length=20), nullable=False),
+        sa.Column('path', sa.String(length=255), nullable=False),
+        sa.Column('new_path', sa.String(length=255), nullable=True),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('base_sha', sa.String(length=40), nullable=True),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('author', sa.String(length=100), nullable=True),
+
+        # 처리 상태
+        sa.Column('status', sa.String(length=20), server_default='pending', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('next_attempt_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+
+        # 날짜
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('processed_at', sa.TIMESTAMP(timezone=True), nullable=True),
+
+        sa.CheckConstraint("operation IN ('upsert', 'delete', 'move')", name='outbox_operation_check'),
+        sa.CheckConstraint("status IN ('pending', 'done', 'failed')", name='outbox_status_check'),
+        sa.ForeignKeyConstraint(['page_id'], ['pages.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_index('idx_github_outbox_pending', 'github_outbox', ['status', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_github_outbox_pending', table_name='github_outbox')
+    op.drop_table('github_outbox')
@@ -0,0 +1,46 @@
+"""Add keyset pagination indexes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+KEYSET_INDEXES = [
+    ('idx_pages_status_updated_id', ['status', 'updated_at', 'id']),
+    ('idx_pages_status_created_id', ['status', 'created_at', 'id']),
+    ('idx_pages_status_title_id', ['status', 'title', 'id']),
+    ('idx_pages_status_views_id', ['status', 'view_count', 'id']),
+]
+
+
+def upgrade() -> None:
+    # view_count는 커서 비교(row comparison)에 쓰이므로 NULL을 허용하지 않음
+    op.execute("UPDATE pages SET view_count = 0 WHERE view_count IS NULL")
+    op.alter_column('pages', 'view_count',
+                    existing_type=sa.Integer(),
+                    existing_server_default='0',
+                    nullable=False)
+
+    # (status, 정렬 컬럼, id) 복합 인덱스
+    for name, columns in KEYSET_INDEXES:
+        op.create_index(name, 'pages', columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name='pages')
+
+    op.alter_column('pages', 'view_count',
+                    existing_type=sa.Integer(),
+                    existing_server_default='0',
+                    nullable=True)
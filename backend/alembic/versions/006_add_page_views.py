@@ -0,0 +1,33 @@
+"""Add page_views daily aggregate table
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'page_views',
+        sa.Column('page_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('views', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['page_id'], ['pages.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('page_id', 'day')
+    )
+
+    op.create_index('idx_page_views_day', 'page_views', ['day'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_page_views_day', table_name='page_views')
+    op.drop_table('page_views')
@@ -0,0 +1,45 @@
+"""Add page_related materialization
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'page_related',
+        sa.Column('page_id', sa.Integer(), nullable=False),
+        sa.Column('related_page_id', sa.Integer(), nullable=False),
+        sa.Column('common_tags', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['page_id'], ['pages.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['related_page_id'], ['pages.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('page_id', 'related_page_id')
+    )
+
+    op.create_index('idx_page_related_rank', 'page_related', ['page_id', 'common_tags', 'related_page_id'], unique=False)
+    op.create_index('idx_page_related_related', 'page_related', ['related_page_id'], unique=False)
+
+    # 기존 태그 데이터로 초기 채움
+    op.execute("""
+        INSERT INTO page_related (page_id, related_page_id, common_tags)
+        SELECT a.page_id, b.page_id, COUNT(*)
+        FROM page_tags a
+        JOIN page_tags b ON b.tag_id = a.tag_id AND b.page_id != a.page_id
+        GROUP BY a.page_id, b.page_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_page_related_related', table_name='page_related')
+    op.drop_index('idx_page_related_rank', table_name='page_related')
+    op.drop_table('page_related')
@@ -0,0 +1,30 @@
+"""Add partial index for hard-delete timestamps
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 목록 Last-Modified 계산 시 max(created_at)을 인덱스 끝에서 바로 읽음
+    op.create_index(
+        'idx_github_outbox_deleted',
+        'github_outbox',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("operation = 'delete'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_github_outbox_deleted', table_name='github_outbox')
@@ -0,0 +1,56 @@
+"""Add weighted full-text search vector
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+# app.models.page.SEARCH_VECTOR_EXPRESSION과 동일하게 유지
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(tags_text, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    # 태그 이름 (생성 컬럼은 다른 테이블을 참조할 수 없으므로 비정규화)
+    op.add_column('pages', sa.Column('tags_text', sa.Text(), nullable=True))
+    op.execute("""
+        UPDATE pages p
+        SET tags_text = t.names
+        FROM (
+            SELECT pt.page_id, string_agg(replace(tags.name, '/', ' '), ' ' ORDER BY tags.name) AS names
+            FROM page_tags pt
+            JOIN tags ON tags.id = pt.tag_id
+            GROUP BY pt.page_id
+        ) t
+        WHERE p.id = t.page_id
+    """)
+
+    op.add_column('pages', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        nullable=True
+    ))
+
+    op.execute('CREATE INDEX idx_pages_search_vector ON pages USING gin (search_vector);')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_pages_search_vector;')
+    op.drop_column('pages', 'search_vector')
+    op.drop_column('pages', 'tags_text')
@@ -0,0 +1,35 @@
+"""Add page_ngrams short-query index
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+기존 문서의 n-gram은 scripts/reindex_pages.py로 채웁니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'page_ngrams',
+        sa.Column('gram', sa.String(length=2), nullable=False),
+        sa.Column('page_id', sa.Integer(), nullable=False),
+        sa.Column('title_freq', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('content_freq', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['page_id'], ['pages.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('gram', 'page_id')
+    )
+
+    op.create_index('idx_page_ngrams_page', 'page_ngrams', ['page_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_page_ngrams_page', table_name='page_ngrams')
+    op.drop_table('page_ngrams')
@@ -0,0 +1,32 @@
+"""Add choseong search columns
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+기존 문서의 초성 값은 scripts/reindex_pages.py로 채웁니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('pages', sa.Column('title_choseong', sa.Text(), nullable=True))
+    op.add_column('pages', sa.Column('tags_choseong', sa.Text(), nullable=True))
+
+    # 초성 부분 일치(LIKE '%ㅅㅂㅎ%')용 trigram 인덱스 (3자 이상, 1~2자는 page_ngrams)
+    op.execute('CREATE INDEX idx_pages_title_choseong_trgm ON pages USING gin (title_choseong gin_trgm_ops);')
+    op.execute('CREATE INDEX idx_pages_tags_choseong_trgm ON pages USING gin (tags_choseong gin_trgm_ops);')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_pages_tags_choseong_trgm;')
+    op.execute('DROP INDEX IF EXISTS idx_pages_title_choseong_trgm;')
+    op.drop_column('pages', 'tags_choseong')
+    op.drop_column('pages', 'title_choseong')
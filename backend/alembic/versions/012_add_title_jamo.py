@@ -0,0 +1,28 @@
+"""Add jamo-decomposed title for typo-tolerant search
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18
+
+기존 문서의 자모 값은 scripts/reindex_pages.py로 채웁니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('pages', sa.Column('title_jamo', sa.Text(), nullable=True))
+
+    # 자모 유사도(%, <%)용 trigram 인덱스
+    op.execute('CREATE INDEX idx_pages_title_jamo_trgm ON pages USING gin (title_jamo gin_trgm_ops);')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS idx_pages_title_jamo_trgm;')
+    op.drop_column('pages', 'title_jamo')
@@ -0,0 +1,32 @@
+"""Add github_pushes table for idempotent push webhooks
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'github_pushes',
+        sa.Column('commit_sha', sa.String(length=40), nullable=False),
+        sa.Column('ref', sa.String(length=255), nullable=False),
+        sa.Column('delivery_id', sa.String(length=100), nullable=True),
+        sa.Column('pusher', sa.String(length=100), nullable=True),
+        sa.Column('paths', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('received_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('commit_sha')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('github_pushes')
@@ -0,0 +1,33 @@
+"""Add conflict status to github_outbox
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18
+
+GitHub 파일이 작업의 base_sha와 다르면 덮어쓰지 않고 conflict로 보류합니다.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('outbox_status_check', 'github_outbox', type_='check')
+    op.create_check_constraint(
+        'outbox_status_check', 'github_outbox',
+        "status IN ('pending', 'done', 'failed', 'conflict')"
+    )
+
+
+def downgrade() -> None:
+    # 보류된 작업은 실패로 돌림
+    op.execute("UPDATE github_outbox SET status = 'failed' WHERE status = 'conflict'")
+    op.drop_constraint('outbox_status_check', 'github_outbox', type_='check')
+    op.create_check_constraint(
+        'outbox_status_check', 'github_outbox',
+        "status IN ('pending', 'done', 'failed')"
+    )
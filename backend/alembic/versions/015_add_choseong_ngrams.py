@@ -0,0 +1,29 @@
+"""Add choseong n-gram counts to page_ngrams
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18
+
+1~2자 초성 검색어는 trigram 인덱스(011)를 쓸 수 없으므로 page_ngrams로 조회합니다.
+기존 문서는 scripts/reindex_pages.py --all로 채웁니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('page_ngrams', sa.Column('title_choseong_freq', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('page_ngrams', sa.Column('tags_choseong_freq', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    # 초성 n-gram만 있는 행 정리
+    op.execute('DELETE FROM page_ngrams WHERE title_freq = 0 AND content_freq = 0;')
+    op.drop_column('page_ngrams', 'tags_choseong_freq')
+    op.drop_column('page_ngrams', 'title_choseong_freq')
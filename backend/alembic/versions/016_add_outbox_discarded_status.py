@@ -0,0 +1,33 @@
+"""Add discarded status to github_outbox
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-18
+
+충돌을 GitHub 내용으로 해결(theirs)하면 보류된 작업을 discarded로 기록합니다.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('outbox_status_check', 'github_outbox', type_='check')
+    op.create_check_constraint(
+        'outbox_status_check', 'github_outbox',
+        "status IN ('pending', 'done', 'failed', 'conflict', 'discarded')"
+    )
+
+
+def downgrade() -> None:
+    # 버린 작업은 반영할 필요가 없으므로 완료로 돌림
+    op.execute("UPDATE github_outbox SET status = 'done' WHERE status = 'discarded'")
+    op.drop_constraint('outbox_status_check', 'github_outbox', type_='check')
+    op.create_check_constraint(
+        'outbox_status_check', 'github_outbox',
+        "status IN ('pending', 'done', 'failed', 'conflict')"
+    )
@@ -1,106 +1,302 @@
 """
 Pages API - 위키 문서 CRUD
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
+from sqlalchemy import select, delete, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload, load_only, undefer_group
 from typing import Optional
 from datetime import datetime
-from github import GithubException
 import structlog
 
 from app.db.database import get_db
 from app.models.page import Page
-from app.models.tag import Tag
+from app.models.tag import Tag, page_tags, page_related
 from app.schemas.page import (
     PageResponse,
     PageListResponse,
     PageDetail,
+    PageSummary,
     PageCreate,
     PageUpdate
 )
-from app.services.github_client import github_client
+from app.services import outbox, http_cache, invalidation
+from app.services.cache import page_cache, mark_pages_changed
+from app.services.github_client import github_client, git_blob_sha
+from app.services.hangul import tags_choseong
+from app.services.markdown_render import RENDER_VERSION
 from app.services.markdown_utils import create_markdown, extract_metadata_from_page
+from app.services.page_indexer import index_page, replace_ngrams
+from app.services.view_counter import view_counter
+from app.services.pagination import encode_cursor, decode_cursor, apply_keyset, count_rows
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
 
-async def sync_tags(db: AsyncSession, page: Page, tag_names: list[str]):
+async def sync_tags(db: AsyncSession, page: Page, tag_names: list[str]) -> tuple[set[int], set[int]]:
     """
     문서의 태그를 동기화합니다.
 
+    태그 수와 무관하게 고정된 수의 SQL 문으로 처리합니다.
+    (태그 일괄 upsert → 기존/신규 diff → page_tags 추가/삭제 → usage_count 원자적 증감)
+
     Args:
         db: 데이터베이스 세션
-        page: Page 객체
+        page: Page 객체 (flush되어 id가 있어야 함)
         tag_names: 태그 이름 리스트 (예: ["종족/엘프", "클래스/팔라딘"])
+
+    Returns:
+        (추가된 태그 ID 집합, 제거된 태그 ID 집합)
     """
-    if not tag_names:
-        page.tags = []
-        return
-
-    # 기존 태그들을 조회하거나 새로 생성
-    tags = []
-    for tag_name in tag_names:
-        # 태그 조회
-        query = select(Tag).where(Tag.name == tag_name)
-        result = await db.execute(query)
-        tag = result.scalar_one_or_none()
-
-        if not tag:
-            # 태그 생성
-            tag = Tag(
-                name=tag_name,
-                display_name=tag_name.split('/')[-1],  # "종족/엘프" → "엘프"
-                usage_count=0
-            )
-            db.add(tag)
-            logger.info("tag_created", tag_name=tag_name)
+    added, removed, affected_ids = await sync_tags_bulk(db, [(page, tag_names)])
+
+    # 태그 집합이 바뀌면 관련 문서 materialization 갱신 + 캐시 무효화
+    if added or removed:
+        mark_pages_changed(db, [page.id, *affected_ids], projects=[page.project_id])
+        invalidation.emit(db, "tags", ids=sorted(added | removed))
+
+    logger.info("tags_synced", page_slug=page.slug, tags=page.tags_text,
+                added=len(added), removed=len(removed))
+
+    return added, removed
+
+
+async def sync_tags_bulk(
+    db: AsyncSession, items: list[tuple[Page, list[str]]]
+) -> tuple[set[int], set[int], set[int]]:
+    """
+    여러 문서의 태그를 한 번에 동기화 (캐시 무효화는 호출자가 등록)
+
+    문서 수와 태그 수에 무관하게 고정된 수의 SQL 문으로 처리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        items: (Page 객체, 태그 이름 리스트) 목록 (flush되어 id가 있어야 함)
+
+    Returns:
+        (새로 연결된 태그 ID, 연결이 끊긴 태그 ID, 관련 문서 목록이 바뀌었을 수 있는 다른 문서 ID)
+    """
+    # 중복/공백 제거 (입력 순서 유지)
+    names_by_page = {
+        page.id: list(dict.fromkeys(name.strip() for name in tag_names if name and name.strip()))
+        for page, tag_names in items
+    }
+    all_names = sorted({name for names in names_by_page.values() for name in names})
+
+    # 1. 없는 태그 일괄 생성 + 전체 태그 ID 조회
+    tag_ids: dict[str, int] = {}
+    if all_names:
+        created = await db.execute(
+            pg_insert(Tag)
+            .values([
+                {
+                    "name": name,
+                    "display_name": name.split('/')[-1],  # "종족/엘프" → "엘프"
+                    "usage_count": 0,
+                }
+                for name in all_names
+            ])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+            .returning(Tag.name)
+        )
+        created_names = created.scalars().all()
+        if created_names:
+            logger.info("tags_created", tag_names=created_names)
+
+        result = await db.execute(select(Tag.id, Tag.name).where(Tag.name.in_(all_names)))
+        tag_ids = {name: tag_id for tag_id, name in result.all()}
+
+    # 2. 기존 태그와 비교
+    result = await db.execute(
+        select(page_tags.c.page_id, page_tags.c.tag_id)
+        .where(page_tags.c.page_id.in_(list(names_by_page)))
+    )
+    old_ids: dict[int, set[int]] = {page_id: set() for page_id in names_by_page}
+    for page_id, tag_id in result.all():
+        old_ids[page_id].add(tag_id)
+
+    added_pairs: list[dict] = []
+    removed_pairs: list[tuple[int, int]] = []
+    deltas: dict[int, int] = {}
+    changed_pages: list[int] = []
+    for page_id, names in names_by_page.items():
+        new_ids = {tag_ids[name] for name in names}
+        added = new_ids - old_ids[page_id]
+        removed = old_ids[page_id] - new_ids
+        if added or removed:
+            changed_pages.append(page_id)
+        added_pairs.extend({"page_id": page_id, "tag_id": tag_id} for tag_id in added)
+        removed_pairs.extend((page_id, tag_id) for tag_id in removed)
+        for tag_id in added:
+            deltas[tag_id] = deltas.get(tag_id, 0) + 1
+        for tag_id in removed:
+            deltas[tag_id] = deltas.get(tag_id, 0) - 1
+
+    # 3. 연결 추가/삭제
+    if removed_pairs:
+        await db.execute(
+            delete(page_tags)
+            .where(tuple_(page_tags.c.page_id, page_tags.c.tag_id).in_(removed_pairs))
+        )
+    if added_pairs:
+        await db.execute(pg_insert(page_tags).values(added_pairs).on_conflict_do_nothing())
+
+    # 4. usage_count 원자적 증감 (태그별 증감량을 한 번에)
+    deltas = {tag_id: delta for tag_id, delta in deltas.items() if delta}
+    if deltas:
+        await db.execute(
+            text("""
+                UPDATE tags
+                SET usage_count = greatest(coalesce(tags.usage_count, 0) + d.delta, 0)
+                FROM unnest(CAST(:ids AS integer[]), CAST(:deltas AS integer[])) AS d(id, delta)
+                WHERE tags.id = d.id
+            """),
+            {"ids": list(deltas), "deltas": list(deltas.values())}
+        )
+
+    # 검색 벡터용 태그 이름 ("종족/엘프" → "종족 엘프", 파서가 경로 토큰으로 묶지 않도록)
+    for page, _ in items:
+        page.tags_text = " ".join(name.replace("/", " ") for name in names_by_page[page.id]) or None
+        page.tags_choseong = tags_choseong(page.tags_text)
+
+    # 5. 태그 집합이 바뀐 문서의 관련 문서 materialization 갱신
+    affected_ids = await refresh_related(db, changed_pages) if changed_pages else set()
+
+    added_tags = {pair["tag_id"] for pair in added_pairs}
+    removed_tags = {tag_id for _, tag_id in removed_pairs}
+    return added_tags, removed_tags, affected_ids
+
+
+async def refresh_related(db: AsyncSession, page_ids: list[int]) -> set[int]:
+    """
+    문서들의 관련 문서 행(page_related)을 양방향으로 다시 계산합니다.
+
+    태그를 공유하는 문서만 훑으므로 비용은 쓰기 시점에 한 번만 듭니다.
 
-        tags.append(tag)
+    Args:
+        db: 데이터베이스 세션
+        page_ids: 태그가 바뀐 문서 ID
 
-    # 기존 태그의 usage_count 감소 (새 페이지가 아닌 경우만)
-    if page.id:  # 페이지가 이미 DB에 존재하는 경우
-        # 먼저 기존 태그들을 명시적으로 로드
-        await db.refresh(page, ["tags"])
-        for old_tag in page.tags:
-            old_tag.usage_count = max(0, old_tag.usage_count - 1)
+    Returns:
+        관련 문서 목록이 바뀌었을 수 있는 다른 문서 ID (이전 + 현재 관련 문서)
+    """
+    ids = sorted(set(page_ids))
+    removed = await db.execute(
+        delete(page_related)
+        .where(page_related.c.page_id.in_(ids))
+        .returning(page_related.c.related_page_id)
+    )
+    affected = set(removed.scalars().all())
+    await db.execute(
+        delete(page_related).where(page_related.c.related_page_id.in_(ids))
+    )
+    inserted = await db.execute(
+        text("""
+            WITH common AS (
+                SELECT mine.page_id, other.page_id AS other_id, COUNT(*) AS common_tags
+                FROM page_tags mine
+                JOIN page_tags other ON other.tag_id = mine.tag_id AND other.page_id != mine.page_id
+                WHERE mine.page_id = ANY(CAST(:page_ids AS integer[]))
+                GROUP BY mine.page_id, other.page_id
+            )
+            INSERT INTO page_related (page_id, related_page_id, common_tags)
+            -- 함께 바뀐 두 문서의 쌍은 양쪽에서 한 번씩 나오므로 UNION으로 중복 제거
+            SELECT page_id, other_id, common_tags FROM common
+            UNION
+            SELECT other_id, page_id, common_tags FROM common
+            -- 태그를 공유하는 문서가 동시에 저장되면 같은 쌍을 먼저 넣을 수 있음
+            ON CONFLICT (page_id, related_page_id) DO UPDATE SET common_tags = EXCLUDED.common_tags
+            RETURNING page_id
+        """),
+        {"page_ids": ids}
+    )
+    affected.update(inserted.scalars().all())
+    affected.difference_update(ids)
+    return affected
 
-    # 새 태그들의 usage_count 증가
-    for tag in tags:
-        tag.usage_count += 1
 
-    # 페이지에 태그 할당
-    page.tags = tags
-    await db.flush()
+# 문서 상세의 관련 문서 수
+RELATED_LIMIT = 5
 
-    logger.info("tags_synced", page_slug=page.slug, tags=tag_names)
 
+# 정렬 가능한 컬럼 (keyset 인덱스가 있는 컬럼만 허용)
+SORT_COLUMNS = {
+    "created_at": Page.created_at,
+    "updated_at": Page.updated_at,
+    "title": Page.title,
+    "view_count": Page.view_count,
+}
 
-@router.get("", response_model=PageListResponse)
+
+@router.get("", response_model=PageListResponse, response_model_exclude_unset=True)
 async def get_pages(
+    request: Request,
+    response: Response,
     project_id: Optional[str] = Query(None, description="프로젝트(세계관) 필터"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     status: str = Query("active", description="문서 상태"),
     sort: str = Query("updated_at", description="정렬 기준"),
     order: str = Query("desc", description="정렬 순서 (asc/desc)"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor가 없을 때만 사용)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 문서 수"),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$", description="전체 개수 계산 방식"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: title,summary,tags)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    문서 목록 조회
+    문서 목록 조회 (본문 제외)
 
     - **project_id**: 프로젝트 필터 (예: dagosian)
     - **category**: 카테고리 필터 (예: characters/player)
     - **status**: active, archived, draft
     - **sort**: 정렬 기준 (created_at, updated_at, title, view_count)
     - **order**: asc (오름차순) / desc (내림차순)
-    - **page**: 페이지 번호 (1부터 시작)
+    - **cursor**: 다음 페이지 커서 (깊은 페이지도 첫 페이지와 같은 비용)
+    - **page**: 페이지 번호 (1부터 시작, 하위 호환용 OFFSET 방식)
     - **limit**: 페이지당 문서 수 (최대 100)
+    - **count**: exact (COUNT), estimated (플래너 추정치), none (생략)
+    - **fields**: 필요한 필드만 응답 (id, slug는 항상 포함)
+
+    ETag/Last-Modified는 project_id/category 범위의 마지막 변경 시각 기준이며,
+    If-None-Match(우선) 또는 If-Modified-Since 이후 변경이 없으면 304를 반환합니다.
+    Last-Modified는 그 초가 지난 뒤에만 보냅니다. (초 단위라 같은 초의 변경을 구분 못 함)
+    (sort=view_count는 조회수만 바뀌어도 순서가 바뀌므로 검증 헤더 없음)
     """
 
+    try:
+        requested_fields = PageSummary.parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "INVALID_FIELDS", "message": str(e)}
+        )
+
+    sort = sort if sort in SORT_COLUMNS else "updated_at"
+
+    # 조건부 요청: 필터 범위에 변경이 없으면 목록 조회 생략
+    # 조회수는 updated_at을 바꾸지 않으므로 조회수 정렬은 검증하지 않음
+    if sort != "view_count":
+        updated, deleted = await http_cache.pages_version(db, project_id, category)
+        last_modified = max((value for value in (updated, deleted) if value is not None), default=None)
+        if last_modified is not None:
+            # ETag는 마이크로초 정밀도 (같은 초 안의 변경도 구분), 응답을 바꾸는 쿼리 파라미터 포함
+            etag = http_cache.make_etag(
+                "pages", updated and updated.isoformat(), deleted and deleted.isoformat(),
+                project_id, category, status, sort, order, cursor, page, limit, count, fields,
+            )
+            validators = {"ETag": etag}
+            if http_cache.http_date_settled(last_modified):
+                validators["Last-Modified"] = http_cache.format_http_date(last_modified)
+            if http_cache.is_not_modified(request.headers, etag, last_modified):
+                return http_cache.not_modified(validators)
+            response.headers.update(validators)
+            response.headers["Cache-Control"] = http_cache.CACHE_CONTROL
+
     # 쿼리 빌드
     query = select(Page).where(Page.status == status)
 
@@ -112,50 +308,111 @@ async def get_pages(
     if category:
         query = query.where(Page.category == category)
 
-    # 정렬
-    sort_column = getattr(Page, sort, Page.updated_at)
-    if order == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    # 전체 개수 조회 (정렬/커서 적용 전 조건 기준)
+    total = await count_rows(db, query, count)
 
-    # 페이지네이션
-    offset = (page - 1) * limit
-    query = query.offset(offset).limit(limit)
+    # 정렬 + 커서 (sort_column, id)
+    order = "desc" if order == "desc" else "asc"
+    sort_column = SORT_COLUMNS[sort]
 
-    # 실행
-    result = await db.execute(query)
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, sort, order, sort_column)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "INVALID_CURSOR", "message": str(e)}
+            )
+    query = apply_keyset(query, sort_column, Page.id, order, after)
+
+    # 페이지네이션 (다음 페이지 유무 확인을 위해 1개 더 조회)
+    if after is None and page > 1:
+        query = query.offset((page - 1) * limit)
+    query = query.limit(limit + 1)
+
+    # 실행 (요청한 컬럼만 로드, 태그는 selectin 한 번으로 일괄 로드)
+    result = await db.execute(query.options(*list_load_options(requested_fields, sort_column)))
     pages = result.scalars().all()
 
-    # 전체 개수 조회
-    count_query = select(func.count(Page.id)).where(Page.status == status)
-    if project_id:
-        count_query = count_query.where(Page.project_id == project_id)
-    if category:
-        count_query = count_query.where(Page.category == category)
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    next_cursor = None
+    if len(pages) > limit:
+        pages = pages[:limit]
+        last = pages[-1]
+        next_cursor = encode_cursor(sort, order, getattr(last, sort), last.id)
 
     return PageListResponse(
         total=total,
-        pages=[PageResponse.model_validate(page) for page in pages]
+        total_estimated=count == "estimated",
+        next_cursor=next_cursor,
+        pages=[PageSummary.from_page(page, requested_fields) for page in pages]
     )
 
 
+def list_load_options(fields: Optional[set[str]], *extra_columns) -> list:
+    """
+    목록 조회용 로더 옵션
+
+    본문(content, content_html)은 모델에서 지연 로드되고, fields가 있으면
+    요청한 컬럼만 SELECT 합니다.
+    """
+    if fields is None:
+        return [selectinload(Page.tags)]
+
+    columns = [getattr(Page, name) for name in fields if name != "tags"]
+    options = [load_only(*columns, *extra_columns)]
+    if "tags" in fields:
+        options.append(selectinload(Page.tags))
+    return options
+
+
 @router.get("/{slug:path}", response_model=PageDetail)
 async def get_page(
     slug: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
     """
     문서 상세 조회
 
     - **slug**: 문서 식별자 (예: characters/player/elon)
+
+    ETag는 문서 버전(github_sha, updated_at, GitHub 동기화 정보)과 관련 문서 구성으로 만들며,
+    If-None-Match가 일치하면 본문 조회 없이 304를 반환합니다.
     """
 
-    # 문서 조회
-    from sqlalchemy.orm import selectinload
-    query = select(Page).options(selectinload(Page.tags)).where(Page.slug == slug)
+    # 캐시 적중: DB 접근 없이 응답
+    cached = page_cache.get(slug)
+    if cached is not None:
+        etag, payload, recorded = cached
+        view_counter.record(payload["id"])
+        validators = {"ETag": etag, "Cache-Control": http_cache.CACHE_CONTROL}
+        if http_cache.etag_matches(request.headers.get("if-none-match"), etag):
+            return http_cache.not_modified({"ETag": etag})
+        # 캐시 이후 이 프로세스에서 기록된 조회수만큼 보정
+        views = payload["view_count"] + view_counter.recorded(payload["id"]) - recorded
+        return JSONResponse({**payload, "view_count": views}, headers=validators)
+
+    # 조회 도중 무효화가 일어나면 캐시에 저장하지 않음
+    generation = page_cache.generation
+
+    # 버전만 먼저 조회 (본문/태그/관련 문서 제외)
+    etag = None
+    version = await _page_version(db, slug)
+    if version is not None:
+        etag = http_cache.make_etag(
+            version.github_sha, version.updated_at.isoformat(), version.last_synced_at, version.github_url,
+            version.related, RENDER_VERSION
+        )
+        if http_cache.etag_matches(request.headers.get("if-none-match"), etag):
+            view_counter.record(version.id)
+            return http_cache.not_modified({"ETag": etag})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = http_cache.CACHE_CONTROL
+
+    # 문서 조회 (본문 포함)
+    query = select(Page).options(selectinload(Page.tags), undefer_group("body")).where(Page.slug == slug)
     result = await db.execute(query)
     page = result.scalar_one_or_none()
 
@@ -168,13 +425,8 @@ async def get_page(
             }
         )
 
-    # 조회수 증가 (별도 쿼리로 처리하여 tags relationship 유지)
-    await db.execute(
-        text("UPDATE pages SET view_count = view_count + 1 WHERE id = :id"),
-        {"id": page.id}
-    )
-    await db.commit()
-    page.view_count += 1  # 로컬 객체도 업데이트
+    # 조회수 증가 (메모리 버퍼에 기록, 주기적으로 일괄 반영)
+    view_counter.record(page.id)
 
     # 관련 문서 추천 (같은 태그를 가진 문서들)
     related_pages = await _get_related_pages(db, page)
@@ -193,7 +445,7 @@ async def get_page(
         "tags": [tag.name for tag in page.tags],
         "created_at": page.created_at,
         "updated_at": page.updated_at,
-        "view_count": page.view_count,
+        "view_count": page.view_count + view_counter.pending(page.id),
         "github_sha": page.github_sha,
         "content_html": page.content_html,
         "github_url": page.github_url,
@@ -201,87 +453,73 @@ async def get_page(
     }
     page_detail = PageDetail.model_validate(page_dict)
 
-    # 관련 문서들도 tags를 수동으로 변환
-    related_pages_list = []
-    for p in related_pages:
-        related_dict = {
-            "id": p.id,
-            "slug": p.slug,
-            "title": p.title,
-            "category": p.category,
-            "author": p.author,
-            "project_id": p.project_id,
-            "content": p.content,
-            "summary": p.summary,
-            "status": p.status,
-            "tags": [tag.name for tag in p.tags],
-            "created_at": p.created_at,
-            "updated_at": p.updated_at,
-            "view_count": p.view_count,
-            "github_sha": p.github_sha,
-        }
-        related_pages_list.append(PageResponse.model_validate(related_dict))
+    # 관련 문서는 목록 항목(본문 제외)으로 변환
+    page_detail.related_pages = [PageSummary.from_page(p) for p in related_pages]
 
-    page_detail.related_pages = related_pages_list
+    if etag is not None:
+        payload = page_detail.model_dump(mode="json")
+        page_cache.set(slug, (etag, payload, view_counter.recorded(page.id)), generation=generation)
 
     return page_detail
 
 
-async def _get_related_pages(db: AsyncSession, current_page: Page, limit: int = 5) -> list[Page]:
+async def _page_version(db: AsyncSession, slug: str):
     """
-    태그 기반 관련 문서 추천
+    문서 ETag 계산용 버전 정보 조회
 
-    Args:
-        db: 데이터베이스 세션
-        current_page: 현재 문서
-        limit: 추천 문서 수
+    관련 문서 목록(순서, 공통 태그 수, 각 문서의 updated_at)도 요약해서
+    관련 문서가 바뀌면 ETag도 바뀌도록 합니다. GitHub 반영(_mark_synced)은
+    updated_at을 유지하고 github_url/last_synced_at만 바꾸므로 두 값도 포함합니다.
 
     Returns:
-        관련 문서 리스트 (공통 태그 수 기준 정렬)
+        (id, github_sha, updated_at, last_synced_at, github_url, related) 행 또는 None
     """
-    if not current_page.tags:
-        return []
-
-    # 현재 문서의 태그 ID들
-    current_tag_ids = [tag.id for tag in current_page.tags]
-
-    # 같은 태그를 가진 다른 문서들 조회 (공통 태그 수로 정렬)
-    # SQL: 각 문서가 현재 문서와 공유하는 태그 수를 계산
-    from app.models.tag import page_tags
-
-    query = text("""
-        SELECT p.*, COUNT(pt.tag_id) as common_tags
-        FROM pages p
-        JOIN page_tags pt ON p.id = pt.page_id
-        WHERE pt.tag_id IN :tag_ids
-          AND p.id != :current_id
-          AND p.status = 'active'
-        GROUP BY p.id
-        ORDER BY common_tags DESC
-        LIMIT :limit
-    """)
-
     result = await db.execute(
-        query,
-        {"tag_ids": tuple(current_tag_ids), "current_id": current_page.id, "limit": limit}
+        text("""
+            SELECT p.id, p.github_sha, p.updated_at, p.last_synced_at, p.github_url,
+                   (
+                       SELECT string_agg(r.version, ',')
+                       FROM (
+                           SELECT pr.related_page_id || ':' || pr.common_tags || ':' || rp.updated_at AS version
+                           FROM page_related pr
+                           JOIN pages rp ON rp.id = pr.related_page_id
+                           WHERE pr.page_id = p.id AND rp.status = 'active'
+                           ORDER BY pr.common_tags DESC, pr.related_page_id DESC
+                           LIMIT :related_limit
+                       ) r
+                   ) AS related
+            FROM pages p
+            WHERE p.slug = :slug
+        """),
+        {"slug": slug, "related_limit": RELATED_LIMIT}
     )
-    rows = result.fetchall()
+    return result.one_or_none()
 
-    # Page 객체로 변환
-    if not rows:
-        return []
 
-    from sqlalchemy.orm import selectinload
+async def _get_related_pages(db: AsyncSession, current_page: Page, limit: int = RELATED_LIMIT) -> list[Page]:
+    """
+    태그 기반 관련 문서 추천
 
-    page_ids = [row.id for row in rows]
-    pages_query = select(Page).options(selectinload(Page.tags)).where(Page.id.in_(page_ids))
-    pages_result = await db.execute(pages_query)
-    pages_dict = {p.id: p for p in pages_result.scalars().all()}
+    sync_tags가 미리 계산해 둔 page_related를 인덱스 순서로 읽습니다.
 
-    # rows 순서대로 정렬 (common_tags 순)
-    related = [pages_dict[row.id] for row in rows if row.id in pages_dict]
+    Args:
+        db: 데이터베이스 세션
+        current_page: 현재 문서
+        limit: 추천 문서 수
 
-    return related
+    Returns:
+        관련 문서 리스트 (공통 태그 수 기준 정렬)
+    """
+    query = (
+        select(Page)
+        .join(page_related, page_related.c.related_page_id == Page.id)
+        .where(page_related.c.page_id == current_page.id, Page.status == "active")
+        .order_by(page_related.c.common_tags.desc(), page_related.c.related_page_id.desc())
+        .limit(limit)
+        .options(selectinload(Page.tags))
+    )
+    result = await db.execute(query)
+    return list(result.scalars().all())
 
 
 @router.post("", response_model=PageResponse, status_code=201)
@@ -292,8 +530,8 @@ async def create_page(
     """
     새 문서 생성
 
-    1. GitHub에 Markdown 파일 커밋
-    2. PostgreSQL에 메타데이터 캐싱
+    1. PostgreSQL에 문서 저장 + GitHub 반영 작업 등록 (한 트랜잭션)
+    2. GitHub 커밋은 outbox 디스패처가 비동기로 처리
     """
 
     # slug 생성 (제공되지 않으면 title에서 생성)
@@ -318,17 +556,8 @@ async def create_page(
         metadata = extract_metadata_from_page(page_data.model_dump())
         markdown_content = create_markdown(metadata, page_data.content)
 
-        # 2. GitHub에 커밋
-        github_result = github_client.create_file(
-            path=slug,
-            content=markdown_content,
-            message=f"Create {page_data.title}",
-            author_name=page_data.author
-        )
-
-        logger.info("page_created_in_github", slug=slug, sha=github_result["sha"])
-
-        # 3. PostgreSQL에 캐싱
+        # 2. PostgreSQL에 저장
+        # github_sha는 GitHub이 저장할 blob SHA를 미리 계산 (반영 완료 시 last_synced_at 기록)
         new_page = Page(
             slug=slug,
             title=page_data.title,
@@ -338,20 +567,36 @@ async def create_page(
             content=page_data.content,
             summary=page_data.summary,
             status=page_data.status,
-            github_sha=github_result["sha"],
-            github_url=github_result["url"],
-            last_synced_at=datetime.now()
+            github_sha=git_blob_sha(markdown_content),
+            github_url=github_client.html_url(slug),
         )
 
         db.add(new_page)
         await db.flush()  # flush하여 new_page.id 생성
 
-        # 4. 태그 동기화
+        # 3. 태그 동기화
         if page_data.tags:
             await sync_tags(db, new_page, page_data.tags)
 
+        # 렌더링된 HTML, n-gram 색인 등 파생 데이터 계산 (태그 초성 포함이므로 태그 동기화 이후)
+        await index_page(db, new_page)
+
+        # 4. GitHub 반영 작업 등록
+        outbox.enqueue(
+            db,
+            operation="upsert",
+            path=slug,
+            message=f"Create {page_data.title}",
+            page_id=new_page.id,
+            content=markdown_content,
+            author=page_data.author,
+        )
+
+        mark_pages_changed(db, [new_page.id], [slug], projects=[new_page.project_id])
+
         await db.commit()
         await db.refresh(new_page, ["tags"])  # 명시적으로 tags 관계 로드
+        outbox.outbox_dispatcher.notify()
 
         logger.info("page_created", slug=slug, id=new_page.id, tags=page_data.tags)
 
@@ -374,16 +619,6 @@ async def create_page(
         }
         return PageResponse.model_validate(page_dict)
 
-    except GithubException as e:
-        logger.error("github_error", slug=slug, status=e.status, error=str(e))
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "code": "GITHUB_ERROR",
-                "message": "GitHub 저장에 실패했습니다. 잠시 후 다시 시도해주세요.",
-                "retry_after": 5
-            }
-        )
     except Exception as e:
         logger.error("page_create_failed", slug=slug, error=str(e))
         await db.rollback()
@@ -405,11 +640,19 @@ async def update_page(
     """
     문서 수정
 
-    동시성 제어: expected_sha로 낙관적 락
+    동시성 제어: expected_sha로 낙관적 락 (다르면 409 CONFLICT)
+    GitHub 커밋은 outbox 디스패처가 비동기로 처리
+
+    force=true는 expected_sha 검사만 건너뜁니다. GitHub 파일이 직전 버전과 다르면
+    (GitHub에서 직접 수정) 덮어쓰지 않고 반영 작업을 conflict로 보류하며,
+    GET /api/sync/conflicts에서 확인할 수 있습니다.
+
+    conflict로 보류된 작업이 있는 문서는 해결(POST /api/sync/conflicts/{id}/resolve)
+    전까지 409 GITHUB_CONFLICT (GitHub 내용을 택하면 이후 수정도 버려지므로)
     """
 
-    # 1. 기존 문서 조회
-    query = select(Page).where(Page.slug == slug)
+    # 1. 기존 문서 조회 (본문 포함: 충돌 응답과 Markdown 생성에 사용)
+    query = select(Page).options(undefer_group("body")).where(Page.slug == slug)
     result = await db.execute(query)
     existing_page = result.scalar_one_or_none()
 
@@ -422,7 +665,23 @@ async def update_page(
             }
         )
 
-    # 2. 동시성 체크 (force=False일 때만)
+    # 2. GitHub 버전 충돌이 해결되지 않은 문서는 수정하지 않음 (force와 무관)
+    conflict = await outbox.conflicted_entry(db, slug)
+    if conflict is not None:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": "GITHUB_CONFLICT",
+                "message": "GitHub에서 직접 수정된 내용과 충돌해 반영이 보류된 문서입니다",
+                "details": {
+                    "conflict_id": conflict.id,
+                    "base_sha": conflict.base_sha,
+                    "last_error": conflict.last_error,
+                }
+            }
+        )
+
+    # 3. 동시성 체크 (force=False일 때만)
     if not page_data.force and page_data.expected_sha:
         if existing_page.github_sha != page_data.expected_sha:
             logger.warning("conflict_detected", slug=slug,
@@ -445,10 +704,10 @@ async def update_page(
             )
 
     try:
-        # 3. 업데이트할 필드 준비
+        # 4. 업데이트할 필드 준비
         update_data = page_data.model_dump(exclude_unset=True, exclude={"expected_sha", "force"})
 
-        # 4. Frontmatter 생성
+        # 5. Frontmatter 생성
         metadata_dict = {
             "title": update_data.get("title", existing_page.title),
             "category": update_data.get("category", existing_page.category),
@@ -460,41 +719,46 @@ async def update_page(
         content_text = update_data.get("content", existing_page.content)
         markdown_content = create_markdown(metadata_dict, content_text)
 
-        # 5. GitHub 업데이트
-        # force=True면 최신 SHA를 먼저 가져옴
-        current_sha = existing_page.github_sha
-        if page_data.force:
-            github_file = github_client.get_file(slug)
-            if github_file:
-                current_sha = github_file["sha"]
-
-        github_result = github_client.update_file(
+        # 6. GitHub 반영 작업 등록
+        # base_sha는 직전 버전의 SHA (force는 DB 충돌 검사만 건너뜀, GitHub 파일이 다르면 conflict로 보류)
+        outbox.enqueue(
+            db,
+            operation="upsert",
             path=slug,
-            content=markdown_content,
             message=f"Update {update_data.get('title', existing_page.title)}",
-            sha=current_sha,
-            author_name=update_data.get("author", existing_page.author)
+            page_id=existing_page.id,
+            content=markdown_content,
+            base_sha=existing_page.github_sha,
+            author=update_data.get("author", existing_page.author),
         )
 
-        logger.info("page_updated_in_github", slug=slug,
-                   old_sha=current_sha, new_sha=github_result["sha"])
-
-        # 6. PostgreSQL 업데이트
+        # 7. PostgreSQL 업데이트 (프로젝트 이동 시 양쪽 검색 캐시 무효화)
+        old_project_id = existing_page.project_id
         for field, value in update_data.items():
             if field != 'tags':  # tags는 별도 처리
                 setattr(existing_page, field, value)
 
-        existing_page.github_sha = github_result["sha"]
-        existing_page.github_url = github_result["url"]
-        existing_page.last_synced_at = datetime.now()
+        existing_page.github_sha = git_blob_sha(markdown_content)
         existing_page.updated_at = datetime.now()
 
-        # 7. 태그 동기화 (tags가 제공된 경우)
+        # 8. 태그 동기화 (tags가 제공된 경우)
         if page_data.tags is not None:
             await sync_tags(db, existing_page, page_data.tags)
 
+        # 제목/본문이 바뀌었으면 렌더링된 HTML, n-gram 색인 등 파생 데이터 재계산
+        if "content" in update_data or "title" in update_data or existing_page.content_html is None:
+            await index_page(db, existing_page)
+        elif page_data.tags is not None:
+            # 태그만 바뀌면 렌더링 없이 n-gram 색인(태그 초성)만 교체
+            await replace_ngrams(
+                db, existing_page.id, existing_page.title, existing_page.content, existing_page.tags_choseong
+            )
+
+        mark_pages_changed(db, [existing_page.id], [slug], projects=[old_project_id, existing_page.project_id])
+
         await db.commit()
         await db.refresh(existing_page, ["tags"])  # 명시적으로 tags 관계 로드
+        outbox.outbox_dispatcher.notify()
 
         logger.info("page_updated", slug=slug, tags=page_data.tags)
 
@@ -517,30 +781,83 @@ async def update_page(
         }
         return PageResponse.model_validate(page_dict)
 
-    except GithubException as e:
-        if e.status == 409:
-            # GitHub에서도 충돌 감지
-            raise HTTPException(
-                status_code=409,
-                detail={
-                    "code": "CONFLICT",
-                    "message": "GitHub에서 충돌이 감지되었습니다"
-                }
-            )
-        logger.error("github_error", slug=slug, status=e.status, error=str(e))
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "code": "GITHUB_ERROR",
-                "message": "GitHub 저장에 실패했습니다"
-            }
-        )
     except Exception as e:
         logger.error("page_update_failed", slug=slug, error=str(e))
         await db.rollback()
         raise
 
 
+def _archive_page(db: AsyncSession, page: Page) -> str:
+    """
+    문서를 archived/ 아래로 옮기고 GitHub 이동 작업을 등록합니다.
+
+    Returns:
+        새 slug
+    """
+    archived_slug = f"archived/{page.slug}"
+    mark_pages_changed(db, [page.id], [page.slug], projects=[page.project_id])
+
+    # 기존 blob SHA를 재사용하는 단일 트리 커밋으로 이동
+    outbox.enqueue(
+        db,
+        operation="move",
+        path=page.slug,
+        new_path=archived_slug,
+        message=f"Archive {page.title}",
+        page_id=page.id,
+        base_sha=page.github_sha,
+    )
+
+    # DB에서는 status만 변경
+    page.status = "archived"
+    page.slug = archived_slug
+    page.github_url = github_client.html_url(archived_slug)
+
+    return archived_slug
+
+
+@router.post("/archive", status_code=200)
+async def archive_pages(
+    category: str = Query(..., description="보관할 카테고리 (예: characters/npc)"),
+    project_id: Optional[str] = Query(None, description="프로젝트(세계관) 필터"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    카테고리 단위 일괄 보관
+
+    - **category**: 카테고리의 모든 active 문서를 archived 폴더로 이동
+    - **project_id**: 프로젝트 필터
+
+    GitHub에는 outbox 디스패처가 하나의 커밋으로 반영
+    """
+
+    query = select(Page).where(Page.category == category, Page.status == "active")
+    if project_id:
+        query = query.where(Page.project_id == project_id)
+    result = await db.execute(query)
+    pages = result.scalars().all()
+
+    if not pages:
+        return {"message": "보관할 문서가 없습니다", "archived": []}
+
+    try:
+        archived = [{"old_slug": page.slug, "new_slug": _archive_page(db, page)} for page in pages]
+        await db.commit()
+        outbox.outbox_dispatcher.notify()
+
+        logger.info("pages_archived", category=category, project_id=project_id, count=len(archived))
+
+        return {
+            "message": f"{len(archived)}개 문서가 보관되었습니다",
+            "archived": archived
+        }
+
+    except Exception as e:
+        logger.error("page_archive_failed", category=category, error=str(e))
+        await db.rollback()
+        raise
+
+
 @router.delete("/{slug:path}", status_code=200)
 async def delete_page(
     slug: str,
@@ -552,6 +869,8 @@ async def delete_page(
 
     - soft=True: archived 폴더로 이동 (기본값)
     - soft=False: 완전 삭제
+
+    GitHub 반영은 outbox 디스패처가 비동기로 처리
     """
 
     # 1. 문서 조회
@@ -571,19 +890,9 @@ async def delete_page(
     try:
         if soft:
             # 소프트 삭제: archived 폴더로 이동
-            archived_slug = f"archived/{slug}"
-
-            github_client.move_file(
-                old_path=slug,
-                new_path=archived_slug,
-                message=f"Archive {page.title}",
-                sha=page.github_sha
-            )
-
-            # DB에서는 status만 변경
-            page.status = "archived"
-            page.slug = archived_slug
+            archived_slug = _archive_page(db, page)
             await db.commit()
+            outbox.outbox_dispatcher.notify()
 
             logger.info("page_archived", old_slug=slug, new_slug=archived_slug)
 
@@ -593,29 +902,24 @@ async def delete_page(
             }
         else:
             # 하드 삭제
-            github_client.delete_file(
+            outbox.enqueue(
+                db,
+                operation="delete",
                 path=slug,
                 message=f"Delete {page.title}",
-                sha=page.github_sha
+                base_sha=page.github_sha,
             )
 
             # DB에서 삭제
+            mark_pages_changed(db, [page.id], [slug], projects=[page.project_id])
             await db.delete(page)
             await db.commit()
+            outbox.outbox_dispatcher.notify()
 
             logger.info("page_deleted", slug=slug)
 
             return {"message": "문서가 삭제되었습니다"}
 
-    except GithubException as e:
-        logger.error("github_delete_failed", slug=slug, status=e.status, error=str(e))
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "code": "GITHUB_ERROR",
-                "message": "GitHub 삭제에 실패했습니다"
-            }
-        )
     except Exception as e:
         logger.error("page_delete_failed", slug=slug, error=str(e))
         await db.rollback()
@@ -7,6 +7,7 @@ from sqlalchemy import select, func
 from app.db.database import get_db
 from app.models.project import Project
 from app.models.page import Page
+from app.services import invalidation
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
@@ -79,6 +80,7 @@ async def create_project(
     # Create new project
     new_project = Project(**project_data.model_dump())
     db.add(new_project)
+    invalidation.emit(db, "projects", id=new_project.id)
     await db.commit()
     await db.refresh(new_project)
 
@@ -105,6 +107,7 @@ async def update_project(
     for key, value in update_data.items():
         setattr(project, key, value)
 
+    invalidation.emit(db, "projects", id=project_id)
     await db.commit()
     await db.refresh(project)
 
@@ -126,6 +129,7 @@ async def delete_project(
         raise HTTPException(status_code=404, detail="Project not found")
 
     await db.delete(project)
+    invalidation.emit(db, "projects", id=project_id, deleted=True)
     await db.commit()
 
     return None
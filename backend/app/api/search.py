@@ -1,21 +1,85 @@
 """
-검색 API - PostgreSQL Trigram 기반
+검색 API - PostgreSQL 전문 검색(tsvector) + Trigram
 """
+import json
+import re
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text, or_
-from typing import Optional, List
+from sqlalchemy import select, func, text
+from typing import Optional, List, Tuple, Dict
 import time
 import structlog
 
 from app.db.database import get_db
-from app.models.page import Page
-from app.schemas.search import SearchResponse, SearchResult
+from app.models.tag import Tag, page_tags
+from app.schemas.search import SearchHighlight, SearchPlan, SearchResponse, SearchResult, SuggestResponse
+from app.services.hangul import choseong_query, jamo_key
+from app.services.ngrams import MAX_GRAM, query_gram
+from app.services.search_cache import cache_key, normalize_query, search_cache
+from app.services.search_planner import choose_engines, estimate_candidates, needs_estimate, query_script, query_words
+from app.services.suggest_index import suggest_index
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
+# ts_headline 구분 문자 (본문에 나오지 않는 제어 문자, 파싱 후 제거)
+HEADLINE_START = "\x01"
+HEADLINE_STOP = "\x02"
+HEADLINE_FRAGMENT = "\x03"
+HEADLINE_OPTIONS = (
+    f'StartSel="{HEADLINE_START}", StopSel="{HEADLINE_STOP}", '
+    f'FragmentDelimiter="{HEADLINE_FRAGMENT}", MaxFragments=3, MaxWords=20, MinWords=8'
+)
+
+# 검색어 위치 기준 본문 창 (짧은 검색어, trigram)
+# hits CTE 결과에만 계산하므로 본문 전체는 DB 밖으로 나가지 않음
+SNIPPET_PARAMS = {"snippet_length": 150, "snippet_context": 60}
+POSITIONAL_SNIPPET_COLUMNS = """
+            w.snippet_start,
+            substring(p.content FROM w.snippet_start FOR :snippet_length) AS snippet_text,
+            char_length(p.content) AS content_length"""
+POSITIONAL_SNIPPET_JOIN = """
+        CROSS JOIN LATERAL (
+            SELECT greatest(strpos(lower(p.content), :needle) - :snippet_context, 1) AS snippet_start
+        ) w"""
+
+# 패싯: 전체 매칭 집합(matches CTE)의 카테고리/태그/프로젝트별 문서 수
+# 결과 행과 같은 문장에서 계산 (스칼라 서브쿼리는 한 번만 평가됨)
+FACET_CTE = """,
+        facet_counts AS (
+            SELECT 'category' AS facet, m.category AS value, count(*) AS hits
+            FROM matches m WHERE m.category IS NOT NULL GROUP BY m.category
+            UNION ALL
+            SELECT 'project', m.project_id, count(*)
+            FROM matches m WHERE m.project_id IS NOT NULL GROUP BY m.project_id
+            UNION ALL
+            SELECT 'tag', t.name, count(*)
+            FROM matches m
+            JOIN page_tags pt ON pt.page_id = m.id
+            JOIN tags t ON t.id = pt.tag_id
+            GROUP BY t.name
+        )"""
+FACET_COLUMN = """,
+            (
+                SELECT json_object_agg(f.facet, f.counts)
+                FROM (
+                    SELECT facet, json_object_agg(value, hits ORDER BY hits DESC, value) AS counts
+                    FROM facet_counts
+                    GROUP BY facet
+                ) f
+            ) AS facets"""
+
+# 검색 경로 반환값: (결과, 패싯)
+SearchOutcome = Tuple[List[SearchResult], Optional[Dict[str, Dict[str, int]]]]
+
+# LIKE 패턴 문자 (검색어에서 이스케이프)
+LIKE_SPECIAL_CHARS = re.compile(r"([%_\\])")
+
+# tsquery 문법 문자 (검색어에서 제거)
+TSQUERY_SPECIAL_CHARS = re.compile(r"[&|!():*<>'\\]")
+
 
 @router.get("", response_model=SearchResponse)
 async def search_pages(
@@ -23,99 +87,344 @@ async def search_pages(
     project_id: Optional[str] = Query(None, description="프로젝트(세계관) 필터"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     limit: int = Query(20, ge=1, le=100, description="결과 수"),
+    mode: str = Query("auto", pattern="^(auto|fulltext|substring|trigram|jamo|choseong)$", description="검색 방식"),
+    facets: bool = Query(False, description="카테고리/태그/프로젝트별 문서 수 포함"),
+    explain: bool = Query(False, description="실행 계획과 단계별 소요 시간 포함"),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    문서 검색 (PostgreSQL Trigram 기반)
+    문서 검색 (PostgreSQL 전문 검색 + Trigram)
 
     - **q**: 검색어 (필수)
     - **project_id**: 프로젝트 필터 (통합 검색은 생략)
     - **category**: 카테고리 필터
     - **limit**: 최대 결과 수
+    - **mode**: auto (기본), fulltext (가중치 전문 검색), substring (단어 중간 일치), trigram (제목 유사도),
+      jamo (자모 단위 제목 유사도), choseong (초성)
+    - **facets**: true면 전체 매칭 문서의 카테고리/태그/프로젝트별 문서 수를 함께 반환
+    - **explain**: true면 선택한 실행 계획과 단계별 소요 시간을 함께 반환
 
     ## 검색 방식
-    - 제목 가중치: 3.0
-    - 본문 가중치: 1.0
-    - 한글 형태소 변화 대응 (Trigram)
+    - fulltext: 제목 A > 요약 B > 태그 C > 본문 D 가중치, ts_rank_cd 정렬, 접두사 매칭 (조사 대응)
+    - substring: 제목/본문 부분 문자열 일치 (띄어쓰기 없는 한글 합성어)
+    - trigram: 제목 오타/부분 일치 (similarity, word_similarity)
+    - jamo: 자모로 풀어 쓴 제목 유사도 (한글 모음/받침 하나가 틀린 오타 "실바홀드" → 실버홀드)
+    - choseong: 제목/태그 초성 일치 ("ㅇㄹ" → 엘론)
+    - auto: 검색어 길이/문자 종류/단어 수/후보 문서 수로 순서를 정해 결과가 나올 때까지 시도
+      (app.services.search_planner 참고)
+
+    결과는 정규화된 검색어 + 필터 기준으로 캐시되며, 문서가 바뀌면 해당 범위의 캐시는 쓰이지 않습니다.
     """
 
     start_time = time.time()
 
-    # 짧은 검색어 (2글자 이하)는 ILIKE 사용
-    if len(q) <= 2:
-        results = await _search_short_query(db, q, project_id, category, limit)
+    # 대소문자/유니코드 정규화 형태가 달라도 같은 검색으로 처리 (캐시 키와 검색에 같이 사용)
+    query = normalize_query(q) or q
+    # generation은 검색 전에 읽음 (검색 중 커밋된 변경은 다음 키로 넘어감)
+    key = cache_key(query, project_id, category, limit, mode, facets)
+    cached = search_cache.get(key)
+
+    if cached is not None:
+        mode, results, facet_counts, plan = cached
     else:
-        results = await _search_trigram(db, q, project_id, category, limit)
+        mode, results, facet_counts, plan = await _run_search(
+            db, query, project_id, category, limit, mode, facets
+        )
+        search_cache.set(key, (mode, results, facet_counts, plan))
 
     search_time_ms = int((time.time() - start_time) * 1000)
 
-    logger.info("search_completed", query=q, results=len(results), time_ms=search_time_ms)
+    logger.info(
+        "search_completed",
+        query=q, mode=mode, results=len(results), time_ms=search_time_ms, cached=cached is not None,
+        plan=plan.engines, reason=plan.reason, timings_ms=plan.timings_ms
+    )
 
     return SearchResponse(
         query=q,
+        mode=mode,
         total=len(results),
         search_time_ms=search_time_ms,
-        results=results
+        cached=cached is not None,
+        results=results,
+        facets=facet_counts if facets else None,
+        plan=plan if explain else None
     )
 
 
+@router.get("/suggest", response_model=SuggestResponse)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="입력 중인 검색어"),
+    limit: int = Query(10, ge=1, le=20, description="최대 항목 수"),
+    project_id: Optional[str] = Query(None, description="문서를 해당 프로젝트로 제한"),
+):
+    """
+    자동완성 (문서 제목, 태그 이름/표시 이름 접두사, 초성 포함)
+
+    워커 메모리의 접두사 색인에서 응답하므로 DB를 조회하지 않습니다.
+    앱 시작 직후 색인이 준비되기 전에는 빈 목록을 반환합니다.
+    """
+    return SuggestResponse(query=q, suggestions=suggest_index.suggest(q, limit, project_id))
+
+
+async def plan_search(db: AsyncSession, query: str, mode: str = "auto") -> SearchPlan:
+    """
+    검색 실행 계획 (mode가 auto가 아니면 해당 방식만)
+
+    후보 수 추정(page_ngrams 조회)은 결과가 달라지는 한글 단어 검색어에서만 실행합니다.
+    """
+    plan = SearchPlan(
+        engines=[mode],
+        reason="forced",
+        length=len(query),
+        script=query_script(query),
+        terms=len(query_words(query)),
+    )
+    if mode != "auto":
+        return plan
+
+    if needs_estimate(query):
+        started = time.perf_counter()
+        plan.candidates = await estimate_candidates(db, query)
+        plan.timings_ms["estimate"] = round((time.perf_counter() - started) * 1000, 2)
+
+    plan.engines, plan.reason = choose_engines(query, plan.candidates)
+    return plan
+
+
+async def _run_search(
+    db: AsyncSession,
+    query: str,
+    project_id: Optional[str],
+    category: Optional[str],
+    limit: int,
+    mode: str,
+    with_facets: bool
+) -> Tuple[str, List[SearchResult], Optional[Dict[str, Dict[str, int]]], SearchPlan]:
+    """실행 계획 순서대로 검색 (결과가 나오면 중단) → (실제 사용한 방식, 결과, 패싯, 계획)"""
+    plan = await plan_search(db, query, mode)
+
+    for engine in plan.engines:
+        started = time.perf_counter()
+        results, facet_counts = await ENGINES[engine](db, query, project_id, category, limit, with_facets)
+        plan.timings_ms[engine] = round((time.perf_counter() - started) * 1000, 2)
+        if results:
+            break
+
+    return engine, results, facet_counts, plan
+
+
+def _facet_sql(with_facets: bool) -> Tuple[str, str]:
+    """패싯 계산용 (추가 CTE, 추가 결과 컬럼) SQL 조각"""
+    if not with_facets:
+        return "", ""
+    return FACET_CTE, FACET_COLUMN
+
+
+def _read_facets(rows, with_facets: bool) -> Optional[Dict[str, Dict[str, int]]]:
+    """결과 행에 실린 패싯 JSON 읽기 (모든 행이 같은 값)"""
+    if not with_facets:
+        return None
+    if not rows or rows[0].facets is None:
+        return {}
+    value = rows[0].facets
+    return json.loads(value) if isinstance(value, str) else value
+
+
 async def _search_short_query(
     db: AsyncSession,
     query: str,
     project_id: Optional[str],
     category: Optional[str],
-    limit: int
-) -> List[SearchResult]:
-    """짧은 검색어 처리 (ILIKE 사용)"""
-
-    # ILIKE 검색
-    filters = [
-        or_(
-            Page.title.ilike(f"%{query}%"),
-            Page.content.ilike(f"%{query}%")
-        )
-    ]
+    limit: int,
+    with_facets: bool = False
+) -> SearchOutcome:
+    """
+    짧은 검색어 처리 (1~2글자, page_ngrams 인덱스 조회)
 
-    if project_id:
-        filters.append(Page.project_id == project_id)
+    제목 매칭을 우선하고, 본문 출현 횟수가 많을수록 높게 정렬합니다.
+    """
 
-    if category:
-        filters.append(Page.category == category)
+    gram = query_gram(query)
+    if gram is None:
+        return [], _read_facets([], with_facets)
 
-    sql_query = select(Page).where(*filters).limit(limit)
+    params = {"gram": gram, "needle": gram, "limit": limit, **SNIPPET_PARAMS}
+    where_clause = _filter_sql(project_id, category, params)
+    facet_cte, facet_column = _facet_sql(with_facets)
 
-    result = await db.execute(sql_query)
-    pages = result.scalars().all()
+    # 점수: 제목 매칭 0.6 + 본문 출현 횟수 n에 대해 0.4 * n / (n + 3)
+    sql_query = text(f"""
+        WITH matches AS (
+            SELECT
+                p.id, p.category, p.project_id,
+                g.title_freq, g.content_freq,
+                (CASE WHEN g.title_freq > 0 THEN 0.6 ELSE 0 END)
+                    + 0.4 * g.content_freq / (g.content_freq + 3.0) AS relevance_score
+            FROM page_ngrams g
+            JOIN pages p ON p.id = g.page_id
+            WHERE g.gram = :gram AND (g.title_freq > 0 OR g.content_freq > 0) AND {where_clause}
+        ),
+        hits AS (
+            SELECT * FROM matches ORDER BY relevance_score DESC, id LIMIT :limit
+        ){facet_cte}
+        SELECT
+            hits.*, p.slug, p.title, p.updated_at,{POSITIONAL_SNIPPET_COLUMNS}{facet_column}
+        FROM hits
+        JOIN pages p ON p.id = hits.id{POSITIONAL_SNIPPET_JOIN}
+        ORDER BY hits.relevance_score DESC, hits.id
+    """)
+
+    result = await db.execute(sql_query, params)
+    rows = result.fetchall()
+
+    tag_names = await _load_tag_names(db, [row.id for row in rows])
 
     search_results = []
-    for page in pages:
+    for row in rows:
         # 매칭 위치 확인
         matched_in = []
-        if query.lower() in page.title.lower():
+        if row.title_freq:
             matched_in.append("title")
-        if query.lower() in page.content.lower():
+        if row.content_freq:
             matched_in.append("content")
 
-        # 간단한 관련도 점수 (제목 매칭이 더 높음)
-        score = 0.5
-        if "title" in matched_in:
-            score = 0.9
+        snippet, highlights = _positional_snippet(row, gram)
+        search_results.append(SearchResult(
+            slug=row.slug,
+            title=row.title,
+            snippet=snippet,
+            highlights=highlights,
+            relevance_score=round(float(row.relevance_score), 2),
+            matched_in=matched_in,
+            category=row.category,
+            tags=tag_names.get(row.id, []),
+            updated_at=row.updated_at
+        ))
+
+    return search_results, _read_facets(rows, with_facets)
 
-        # 태그 추출 (relationship으로 자동 로드됨)
-        tag_names = [tag.name for tag in page.tags] if page.tags else []
 
+def _build_prefix_tsquery(query: str) -> Optional[str]:
+    """
+    검색어 → 접두사 매칭 tsquery 문자열
+
+    "엘프 팔라딘" → "'엘프':* & '팔라딘':*"
+    ('simple' 설정은 형태소 분석을 하지 않으므로 "엘프는"도 "엘프"로 찾도록 접두사 매칭)
+
+    Returns:
+        tsquery 문자열 (검색할 단어가 없으면 None)
+    """
+    terms = TSQUERY_SPECIAL_CHARS.sub(" ", query.lower()).split()
+    if not terms:
+        return None
+    return " & ".join(f"'{term}':*" for term in terms)
+
+
+def _filter_sql(project_id: Optional[str], category: Optional[str], params: dict) -> str:
+    """공통 필터 (active 문서 + 프로젝트/카테고리) WHERE 조각"""
+    where_parts = ["p.status = 'active'"]
+
+    if project_id:
+        where_parts.append("p.project_id = :project_id")
+        params["project_id"] = project_id
+
+    if category:
+        where_parts.append("p.category = :category")
+        params["category"] = category
+
+    return " AND ".join(where_parts)
+
+
+async def _load_tag_names(db: AsyncSession, page_ids: List[int]) -> dict[int, List[str]]:
+    """검색 결과 문서들의 태그 이름 (한 번의 쿼리)"""
+    if not page_ids:
+        return {}
+
+    result = await db.execute(
+        select(page_tags.c.page_id, Tag.name)
+        .join(Tag, Tag.id == page_tags.c.tag_id)
+        .where(page_tags.c.page_id.in_(page_ids))
+        .order_by(Tag.name)
+    )
+    tag_names: dict[int, List[str]] = {}
+    for page_id, name in result.all():
+        tag_names.setdefault(page_id, []).append(name)
+    return tag_names
+
+
+async def _search_fulltext(
+    db: AsyncSession,
+    query: str,
+    project_id: Optional[str],
+    category: Optional[str],
+    limit: int,
+    with_facets: bool = False
+) -> SearchOutcome:
+    """가중치 전문 검색 (search_vector GIN 인덱스 + ts_rank_cd)"""
+
+    tsquery = _build_prefix_tsquery(query)
+    if tsquery is None:
+        return [], _read_facets([], with_facets)
+
+    params = {"tsquery": tsquery, "limit": limit, "headline_options": HEADLINE_OPTIONS}
+    where_clause = _filter_sql(project_id, category, params)
+    facet_cte, facet_column = _facet_sql(with_facets)
+
+    # ts_rank_cd 정규화 옵션 32: rank / (rank + 1) → 0~1 범위
+    # ts_filter(가중치별 매칭 위치)와 ts_headline은 LIMIT 이후 결과 문서에만 계산
+    # (본문은 DB 밖으로 나가지 않음)
+    sql_query = text(f"""
+        WITH q AS (SELECT to_tsquery('simple', :tsquery) AS query),
+        matches AS (
+            SELECT
+                p.id, p.category, p.project_id,
+                ts_rank_cd(p.search_vector, q.query, 32) AS relevance_score
+            FROM pages p, q
+            WHERE p.search_vector @@ q.query AND {where_clause}
+        ),
+        hits AS (
+            SELECT * FROM matches ORDER BY relevance_score DESC, id LIMIT :limit
+        ){facet_cte}
+        SELECT
+            hits.*, p.slug, p.title, p.updated_at,
+            ts_filter(p.search_vector, '{{a}}') @@ q.query AS in_title,
+            ts_filter(p.search_vector, '{{c}}') @@ q.query AS in_tags,
+            ts_filter(p.search_vector, '{{d}}') @@ q.query AS in_content,
+            ts_headline('simple', p.content, q.query, :headline_options) AS headline{facet_column}
+        FROM hits
+        JOIN pages p ON p.id = hits.id
+        CROSS JOIN q
+        ORDER BY hits.relevance_score DESC, hits.id
+    """)
+
+    result = await db.execute(sql_query, params)
+    rows = result.fetchall()
+
+    tag_names = await _load_tag_names(db, [row.id for row in rows])
+
+    search_results = []
+    for row in rows:
+        matched_in = [
+            location
+            for location, hit in (("title", row.in_title), ("tags", row.in_tags), ("content", row.in_content))
+            if hit
+        ]
+
+        snippet, highlights = _parse_headline(row.headline)
         search_results.append(SearchResult(
-            slug=page.slug,
-            title=page.title,
-            snippet=_generate_snippet(page.content, query),
-            relevance_score=score,
+            slug=row.slug,
+            title=row.title,
+            snippet=snippet,
+            highlights=highlights,
+            relevance_score=round(row.relevance_score, 2),
             matched_in=matched_in,
-            category=page.category,
-            tags=tag_names,
-            updated_at=page.updated_at
+            category=row.category,
+            tags=tag_names.get(row.id, []),
+            updated_at=row.updated_at
         ))
 
-    return search_results
+    return search_results, _read_facets(rows, with_facets)
 
 
 async def _search_trigram(
@@ -123,117 +432,362 @@ async def _search_trigram(
     query: str,
     project_id: Optional[str],
     category: Optional[str],
-    limit: int
-) -> List[SearchResult]:
-    """Trigram 기반 검색 (3글자 이상)"""
-
-    # Trigram 유사도 계산
-    # similarity(column, query) * weight
-    similarity_expr = text(f"""
-        (similarity(title, :query) * 3.0) +
-        (similarity(content, :query) * 1.0)
+    limit: int,
+    with_facets: bool = False
+) -> SearchOutcome:
+    """
+    Trigram 기반 제목 유사도 검색 (오타, 부분 일치)
+
+    본문 전체에 대한 similarity()는 긴 문서일수록 느리고 관련도 신호로도 약하므로
+    제목만 비교합니다. 본문 검색은 fulltext가 담당합니다.
+    """
+
+    needle = query.lower()
+    params = {"query": query, "needle": needle, "limit": limit, **SNIPPET_PARAMS}
+    where_clause = _filter_sql(project_id, category, params)
+    facet_cte, facet_column = _facet_sql(with_facets)
+
+    # 두 연산자 모두 idx_pages_title_trgm(gin_trgm_ops) 사용
+    sql_query = text(f"""
+        WITH matches AS (
+            SELECT
+                p.id, p.category, p.project_id,
+                greatest(similarity(p.title, :query), word_similarity(:query, p.title)) AS relevance_score
+            FROM pages p
+            WHERE (p.title % :query OR :query <% p.title) AND {where_clause}
+        ),
+        hits AS (
+            SELECT * FROM matches ORDER BY relevance_score DESC, id LIMIT :limit
+        ){facet_cte}
+        SELECT
+            hits.*, p.slug, p.title, p.updated_at,{POSITIONAL_SNIPPET_COLUMNS}{facet_column}
+        FROM hits
+        JOIN pages p ON p.id = hits.id{POSITIONAL_SNIPPET_JOIN}
+        ORDER BY hits.relevance_score DESC, hits.id
     """)
 
-    # WHERE 조건 구축
-    where_parts = ["(title % :query OR content % :query)", "status = 'active'"]
-    params = {"query": query, "limit": limit}
+    result = await db.execute(sql_query, params)
+    rows = result.fetchall()
 
-    if project_id:
-        where_parts.append("project_id = :project_id")
-        params["project_id"] = project_id
+    tag_names = await _load_tag_names(db, [row.id for row in rows])
 
-    if category:
-        where_parts.append("category = :category")
-        params["category"] = category
+    search_results = []
+    for row in rows:
+        snippet, highlights = _positional_snippet(row, needle)
+        search_results.append(SearchResult(
+            slug=row.slug,
+            title=row.title,
+            snippet=snippet,
+            highlights=highlights,
+            relevance_score=round(row.relevance_score, 2),
+            matched_in=["title"],
+            category=row.category,
+            tags=tag_names.get(row.id, []),
+            updated_at=row.updated_at
+        ))
+
+    return search_results, _read_facets(rows, with_facets)
+
+
+def _like_pattern(needle: str) -> str:
+    """부분 문자열 ILIKE 패턴 (%, _, \\ 이스케이프)"""
+    escaped = LIKE_SPECIAL_CHARS.sub(r"\\\1", needle)
+    return f"%{escaped}%"
+
+
+async def _search_substring(
+    db: AsyncSession,
+    query: str,
+    project_id: Optional[str],
+    category: Optional[str],
+    limit: int,
+    with_facets: bool = False
+) -> SearchOutcome:
+    """
+    제목/본문 부분 문자열 검색 (ILIKE)
 
-    where_clause = " AND ".join(where_parts)
+    3글자 이상이면 idx_pages_title_trgm / idx_pages_content_trgm으로 후보를 좁히지만
+    후보마다 본문 전체를 다시 검사하므로, 후보가 적은 검색어에만 쓰도록 계획됩니다.
+    """
+
+    needle = query.lower()
+    params = {"pattern": _like_pattern(needle), "needle": needle, "limit": limit, **SNIPPET_PARAMS}
+    where_clause = _filter_sql(project_id, category, params)
+    facet_cte, facet_column = _facet_sql(with_facets)
 
+    # 점수: 제목 시작 0.8 / 제목 포함 0.6 + 본문 포함 0.2
     sql_query = text(f"""
+        WITH matches AS (
+            SELECT
+                p.id, p.category, p.project_id, m.in_title, m.in_content,
+                (CASE WHEN m.in_title THEN
+                    CASE WHEN starts_with(lower(p.title), :needle) THEN 0.8 ELSE 0.6 END
+                 ELSE 0 END)
+                    + (CASE WHEN m.in_content THEN 0.2 ELSE 0 END) AS relevance_score
+            FROM pages p
+            CROSS JOIN LATERAL (
+                SELECT p.title ILIKE :pattern AS in_title, p.content ILIKE :pattern AS in_content
+            ) m
+            WHERE (p.title ILIKE :pattern OR p.content ILIKE :pattern) AND {where_clause}
+        ),
+        hits AS (
+            SELECT * FROM matches ORDER BY relevance_score DESC, id LIMIT :limit
+        ){facet_cte}
         SELECT
-            id, slug, title, content, category, updated_at,
-            ({similarity_expr.text}) as relevance_score,
-            similarity(title, :query) as title_sim,
-            similarity(content, :query) as content_sim
-        FROM pages
-        WHERE {where_clause}
-        ORDER BY relevance_score DESC
-        LIMIT :limit
+            hits.*, p.slug, p.title, p.updated_at,{POSITIONAL_SNIPPET_COLUMNS}{facet_column}
+        FROM hits
+        JOIN pages p ON p.id = hits.id{POSITIONAL_SNIPPET_JOIN}
+        ORDER BY hits.relevance_score DESC, hits.id
     """)
 
     result = await db.execute(sql_query, params)
+    rows = result.fetchall()
+
+    tag_names = await _load_tag_names(db, [row.id for row in rows])
+
+    search_results = []
+    for row in rows:
+        matched_in = [
+            location
+            for location, hit in (("title", row.in_title), ("content", row.in_content))
+            if hit
+        ]
+
+        snippet, highlights = _positional_snippet(row, needle)
+        search_results.append(SearchResult(
+            slug=row.slug,
+            title=row.title,
+            snippet=snippet,
+            highlights=highlights,
+            relevance_score=round(float(row.relevance_score), 2),
+            matched_in=matched_in,
+            category=row.category,
+            tags=tag_names.get(row.id, []),
+            updated_at=row.updated_at
+        ))
+
+    return search_results, _read_facets(rows, with_facets)
+
+
+async def _search_jamo(
+    db: AsyncSession,
+    query: str,
+    project_id: Optional[str],
+    category: Optional[str],
+    limit: int,
+    with_facets: bool = False
+) -> SearchOutcome:
+    """
+    자모 단위 제목 유사도 검색 (title_jamo trigram)
+
+    _search_trigram과 같은 연산자를 쓰지만, 음절 대신 자모로 비교하므로
+    자모 하나가 틀려도 대부분의 trigram이 유지됩니다.
+    """
 
+    jamo = jamo_key(query)
+    if jamo is None:
+        return [], _read_facets([], with_facets)
+
+    needle = query.lower()
+    params = {"jamo": jamo, "needle": needle, "limit": limit, **SNIPPET_PARAMS}
+    where_clause = _filter_sql(project_id, category, params)
+    facet_cte, facet_column = _facet_sql(with_facets)
+
+    # 두 연산자 모두 idx_pages_title_jamo_trgm(gin_trgm_ops) 사용
+    sql_query = text(f"""
+        WITH matches AS (
+            SELECT
+                p.id, p.category, p.project_id,
+                greatest(similarity(p.title_jamo, :jamo), word_similarity(:jamo, p.title_jamo)) AS relevance_score
+            FROM pages p
+            WHERE (p.title_jamo % :jamo OR :jamo <% p.title_jamo) AND {where_clause}
+        ),
+        hits AS (
+            SELECT * FROM matches ORDER BY relevance_score DESC, id LIMIT :limit
+        ){facet_cte}
+        SELECT
+            hits.*, p.slug, p.title, p.updated_at,{POSITIONAL_SNIPPET_COLUMNS}{facet_column}
+        FROM hits
+        JOIN pages p ON p.id = hits.id{POSITIONAL_SNIPPET_JOIN}
+        ORDER BY hits.relevance_score DESC, hits.id
+    """)
+
+    result = await db.execute(sql_query, params)
     rows = result.fetchall()
 
-    # 검색 결과가 있으면 태그 정보를 가져오기 위해 Page 객체 조회
-    page_ids = [row.id for row in rows]
+    tag_names = await _load_tag_names(db, [row.id for row in rows])
+
+    search_results = []
+    for row in rows:
+        snippet, highlights = _positional_snippet(row, needle)
+        search_results.append(SearchResult(
+            slug=row.slug,
+            title=row.title,
+            snippet=snippet,
+            highlights=highlights,
+            relevance_score=round(row.relevance_score, 2),
+            matched_in=["title"],
+            category=row.category,
+            tags=tag_names.get(row.id, []),
+            updated_at=row.updated_at
+        ))
+
+    return search_results, _read_facets(rows, with_facets)
+
+
+async def _search_choseong(
+    db: AsyncSession,
+    query: str,
+    project_id: Optional[str],
+    category: Optional[str],
+    limit: int,
+    with_facets: bool = False
+) -> SearchOutcome:
+    """
+    초성 검색 (title_choseong / tags_choseong 부분 일치)
 
-    # Page 객체들을 조회 (tags relationship 포함)
-    if page_ids:
-        pages_query = select(Page).where(Page.id.in_(page_ids))
-        pages_result = await db.execute(pages_query)
-        pages = {p.id: p for p in pages_result.scalars().all()}
+    1~2자 초성은 trigram 인덱스로 찾을 수 없으므로 page_ngrams의 초성 n-gram을 조회하고,
+    3자 이상은 trigram 인덱스로 LIKE 부분 일치를 찾습니다.
+    제목 초성이 검색어로 시작하면 가장 높게, 제목 중간 일치, 태그 일치 순으로 정렬합니다.
+    """
+
+    needle = choseong_query(query)
+    if needle is None:
+        return [], _read_facets([], with_facets)
+
+    params = {"needle": needle, "pattern": _like_pattern(needle), "limit": limit}
+    where_clause = _filter_sql(project_id, category, params)
+    facet_cte, facet_column = _facet_sql(with_facets)
+
+    if len(needle) <= MAX_GRAM:
+        match_sql = """
+            FROM page_ngrams g
+            JOIN pages p ON p.id = g.page_id
+            CROSS JOIN LATERAL (
+                SELECT g.title_choseong_freq > 0 AS in_title, g.tags_choseong_freq > 0 AS in_tags
+            ) m
+            WHERE g.gram = :needle AND (g.title_choseong_freq > 0 OR g.tags_choseong_freq > 0)
+        """
     else:
-        pages = {}
+        match_sql = """
+            FROM pages p
+            CROSS JOIN LATERAL (
+                SELECT
+                    coalesce(p.title_choseong LIKE :pattern, false) AS in_title,
+                    coalesce(p.tags_choseong LIKE :pattern, false) AS in_tags
+            ) m
+            WHERE (p.title_choseong LIKE :pattern OR p.tags_choseong LIKE :pattern)
+        """
+
+    # 점수: 제목 시작 1.0 / 제목 포함 0.6~0.7 (짧은 제목일수록 높음) / 태그만 0.4
+    sql_query = text(f"""
+        WITH matches AS (
+            SELECT
+                p.id, p.category, p.project_id, m.in_title, m.in_tags,
+                CASE
+                    WHEN starts_with(p.title_choseong, :needle) THEN 1.0
+                    WHEN m.in_title THEN 0.6 + 0.1 * char_length(:needle) / char_length(p.title_choseong)
+                    ELSE 0.4
+                END AS relevance_score
+            {match_sql} AND {where_clause}
+        ),
+        hits AS (
+            SELECT * FROM matches ORDER BY relevance_score DESC, id LIMIT :limit
+        ){facet_cte}
+        SELECT
+            hits.*, p.slug, p.title, p.summary, p.updated_at{facet_column}
+        FROM hits
+        JOIN pages p ON p.id = hits.id
+        ORDER BY hits.relevance_score DESC, hits.id
+    """)
+
+    result = await db.execute(sql_query, params)
+    rows = result.fetchall()
+
+    tag_names = await _load_tag_names(db, [row.id for row in rows])
 
     search_results = []
     for row in rows:
-        # 매칭 위치 확인
-        matched_in = []
-        if row.title_sim > 0.2:
-            matched_in.append("title")
-        if row.content_sim > 0.2:
-            matched_in.append("content")
-
-        # 태그 추출
-        page = pages.get(row.id)
-        tag_names = [tag.name for tag in page.tags] if page and page.tags else []
+        matched_in = [
+            location
+            for location, hit in (("title", row.in_title), ("tags", row.in_tags))
+            if hit
+        ]
 
+        # 초성은 본문 위치가 없으므로 요약을 snippet으로 사용
         search_results.append(SearchResult(
             slug=row.slug,
             title=row.title,
-            snippet=_generate_snippet(row.content, query),
-            relevance_score=round(row.relevance_score, 2),
+            snippet=row.summary or "",
+            relevance_score=round(float(row.relevance_score), 2),
             matched_in=matched_in,
             category=row.category,
-            tags=tag_names,
+            tags=tag_names.get(row.id, []),
             updated_at=row.updated_at
         ))
 
-    return search_results
+    return search_results, _read_facets(rows, with_facets)
 
 
-def _generate_snippet(content: str, query: str, context_length: int = 150) -> str:
+def _parse_headline(headline: Optional[str]) -> Tuple[str, List[SearchHighlight]]:
     """
-    검색어 주변 텍스트 추출 (snippet)
+    ts_headline 결과 → (snippet, 조각별 하이라이트)
 
-    Args:
-        content: 전체 본문
-        query: 검색어
-        context_length: snippet 길이
-
-    Returns:
-        "...검색어 주변 텍스트..."
+    구분 문자(HEADLINE_*)로 표시된 조각과 매칭 구간을 평문 + 오프셋으로 변환합니다.
     """
-    # 대소문자 구분 없이 검색
-    lower_content = content.lower()
-    lower_query = query.lower()
+    if not headline:
+        return "", []
+
+    fragments = []
+    highlights = []
+    for fragment in headline.split(HEADLINE_FRAGMENT):
+        parts = fragment.split(HEADLINE_START)
+        plain = parts[0]
+        matches = []
+        for part in parts[1:]:
+            hit, _, rest = part.partition(HEADLINE_STOP)
+            matches.append([len(plain), len(plain) + len(hit)])
+            plain += hit + rest
 
-    pos = lower_content.find(lower_query)
+        fragments.append(plain)
+        if matches:
+            highlights.append(SearchHighlight(text=plain, matches=matches))
 
-    if pos == -1:
-        # 검색어가 없으면 앞부분만 반환
-        return content[:context_length] + ("..." if len(content) > context_length else "")
+    return " ... ".join(fragments), highlights
 
-    # 검색어 중심으로 앞뒤 추출
-    start = max(0, pos - context_length // 2)
-    end = min(len(content), pos + len(query) + context_length // 2)
 
-    snippet = content[start:end]
+def _positional_snippet(row, needle: str) -> Tuple[str, List[SearchHighlight]]:
+    """
+    POSITIONAL_SNIPPET_SQL 결과 → (snippet, 하이라이트)
+
+    DB에서 잘라 온 창(snippet_text) 안의 검색어 위치를 표시합니다.
+    """
+    window = row.snippet_text or ""
 
+    matches = []
+    lower_window = window.lower()
+    pos = lower_window.find(needle)
+    while pos != -1 and needle:
+        matches.append([pos, pos + len(needle)])
+        pos = lower_window.find(needle, pos + len(needle))
+
+    snippet = window
     # 앞뒤에 ... 추가
-    if start > 0:
+    if row.snippet_start > 1:
         snippet = "..." + snippet
-    if end < len(content):
+    if row.snippet_start - 1 + len(window) < row.content_length:
         snippet = snippet + "..."
 
-    return snippet.strip()
+    highlights = [SearchHighlight(text=window, matches=matches)] if matches else []
+    return snippet, highlights
+
+
+# 검색 방식 이름 → 실행 함수 (실행 계획과 벤치마크 스크립트에서 사용)
+ENGINES = {
+    "short": _search_short_query,
+    "fulltext": _search_fulltext,
+    "substring": _search_substring,
+    "trigram": _search_trigram,
+    "jamo": _search_jamo,
+    "choseong": _search_choseong,
+}
@@ -0,0 +1,814 @@
+"""
+Sync API - GitHub → DB 재동기화
+
+DB는 GitHub content/ 트리의 캐시입니다. 전체 트리를 한 번의 호출로 조회해
+파일별 blob SHA를 Page.github_sha와 비교하고, 달라진 파일만 동시 다운로드 수를
+제한해 내려받은 뒤 배치 단위로 한 번에 upsert합니다.
+
+GitHub에 아직 반영되지 않은 변경(github_outbox의 pending/failed/conflict 작업)이
+있는 문서는 DB가 더 최신이므로 건너뜁니다. 보류된(conflict/failed) 작업은
+POST /api/sync/conflicts/{id}/resolve로 GitHub 내용(theirs) 또는 DB 내용(mine)을
+택해 해결합니다.
+
+GitHub에서 직접 수정한 내용은 push 웹훅(POST /api/sync/webhook)으로 받아, push에
+포함된 content/ 문서만 같은 방식으로 반영합니다. 전체 재동기화는 웹훅을 놓쳤을 때의
+복구용입니다.
+"""
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from github import GithubException
+from sqlalchemy import delete, exists, func, literal_column, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
+import structlog
+
+from app.api.pages import sync_tags_bulk
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, engine, get_db
+from app.models.github_push import GitHubPush
+from app.models.outbox import GitHubOutbox
+from app.models.page import Page
+from app.models.project import Project
+from app.models.tag import Tag, page_tags
+from app.schemas.sync import ConflictResolution, OutboxConflict, PushResult, SyncReport
+from app.services import invalidation, outbox
+from app.services.cache import mark_pages_changed
+from app.services.github_client import github_client
+from app.services.markdown_utils import parse_frontmatter
+from app.services.page_indexer import index_pages
+
+logger = structlog.get_logger()
+
+router = APIRouter()
+
+# 워커/스크립트 간 재동기화 중복 실행 방지용 advisory lock 키
+SYNC_LOCK_KEY = 7_302_002
+# push 웹훅 반영 직렬화용 advisory lock 키 (트랜잭션 단위)
+PUSH_LOCK_KEY = 7_302_003
+# 반영 중 브랜치 head가 계속 바뀔 때 다시 계산하는 최대 횟수
+PUSH_APPLY_ATTEMPTS = 3
+
+CONTENT_PREFIX = "content/"
+MARKDOWN_SUFFIX = ".md"
+ARCHIVED_PREFIX = "archived/"
+PAGE_STATUSES = {"active", "archived", "draft"}
+
+# GitHub 반영이 끝나지 않은 작업 (DB가 GitHub보다 최신, conflict는 양쪽 모두 변경됨)
+UNSYNCED_OUTBOX_STATUSES = ("pending", "failed", "conflict")
+
+
+@router.post("/github", response_model=SyncReport)
+async def resync_github(
+    dry_run: bool = Query(False, description="비교 결과만 반환하고 DB는 바꾸지 않음"),
+    prune: bool = Query(False, description="GitHub에 없는 문서를 DB에서 삭제"),
+):
+    """
+    GitHub content/ 트리 → DB 재동기화
+
+    - 트리 전체를 한 번에 조회해 blob SHA가 다른 파일만 내려받습니다.
+    - 반영 대기 중인 변경이 있는 문서는 건너뜁니다.
+    - 다른 재동기화가 실행 중이면 409, GitHub 트리를 조회하지 못하면 502
+    """
+    try:
+        report = await reconcile(dry_run=dry_run, prune=prune)
+    except GithubException as e:
+        raise HTTPException(
+            status_code=502,
+            detail={
+                "code": "GITHUB_ERROR",
+                "message": f"GitHub 트리 조회 실패: {e.status}"
+            }
+        )
+    if report is None:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "code": "SYNC_IN_PROGRESS",
+                "message": "다른 재동기화가 실행 중입니다"
+            }
+        )
+    return report
+
+
+@router.post("/webhook", response_model=PushResult)
+async def github_webhook(
+    request: Request,
+    x_github_event: str = Header(...),
+    x_github_delivery: Optional[str] = Header(None),
+    x_hub_signature_256: Optional[str] = Header(None),
+):
+    """
+    GitHub push 웹훅 수신
+
+    - X-Hub-Signature-256 서명(GITHUB_WEBHOOK_SECRET)이 맞지 않으면 401
+    - 설정된 브랜치의 push만 반영하며, 같은 커밋(after)의 재전송은 건너뜁니다.
+    - push에 포함된 content/ 문서만 브랜치 head 트리 기준으로 생성/수정/삭제
+      (늦게 도착한 이전 push가 최신 내용을 되돌리지 않음)
+    """
+    if not settings.GITHUB_WEBHOOK_SECRET:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "WEBHOOK_DISABLED",
+                "message": "GITHUB_WEBHOOK_SECRET이 설정되지 않았습니다"
+            }
+        )
+
+    body = await request.body()
+    if not verify_signature(settings.GITHUB_WEBHOOK_SECRET, body, x_hub_signature_256):
+        logger.warning("github_webhook_bad_signature", delivery=x_github_delivery, github_event=x_github_event)
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "code": "INVALID_SIGNATURE",
+                "message": "웹훅 서명이 올바르지 않습니다"
+            }
+        )
+
+    if x_github_event != "push":
+        # ping 등 다른 이벤트는 확인만
+        return PushResult(event=x_github_event, status="ignored")
+
+    try:
+        return await apply_push(json.loads(body), x_github_delivery)
+    except GithubException as e:
+        # 커밋 기록 전에 실패했으므로 재전송하면 다시 처리됨
+        raise HTTPException(
+            status_code=502,
+            detail={
+                "code": "GITHUB_ERROR",
+                "message": f"GitHub 조회 실패: {e.status}"
+            }
+        )
+
+
+@router.get("/conflicts", response_model=List[OutboxConflict])
+async def list_conflicts(db: AsyncSession = Depends(get_db)):
+    """
+    해결될 때까지 보류된 반영 작업
+
+    - conflict: 작업 등록 후 GitHub에서 직접 수정된 문서
+    - failed: 재시도 횟수를 넘긴 작업
+
+    같은 경로의 이후 작업과 재동기화/웹훅 반영도 해결될 때까지 보류됩니다.
+    (POST /api/sync/conflicts/{id}/resolve)
+    """
+    result = await db.execute(
+        select(GitHubOutbox)
+        .where(GitHubOutbox.status.in_(outbox.HELD_STATUSES))
+        .order_by(GitHubOutbox.id)
+    )
+    return result.scalars().all()
+
+
+@router.post("/conflicts/{entry_id}/resolve", response_model=ConflictResolution)
+async def resolve_conflict_entry(
+    entry_id: int,
+    strategy: str = Query(..., pattern="^(theirs|mine)$", description="theirs: GitHub 내용 반영, mine: DB 내용으로 덮어씀"),
+):
+    """
+    보류된 반영 작업 해결
+
+    - theirs: GitHub의 현재 파일을 DB에 반영하고, 같은 경로의 반영 대기 작업을 버림
+    - mine: GitHub의 현재 SHA를 기준으로 작업을 다시 대기열에 넣음 (GitHub 수정을 덮어씀)
+    - 보류된(conflict/failed) 작업이 아니면 404, GitHub 조회 실패 시 502
+    """
+    try:
+        resolution = await resolve_conflict(entry_id, strategy)
+    except GithubException as e:
+        raise HTTPException(
+            status_code=502,
+            detail={
+                "code": "GITHUB_ERROR",
+                "message": f"GitHub 조회 실패: {e.status}"
+            }
+        )
+    if resolution is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "code": "CONFLICT_NOT_FOUND",
+                "message": f"보류된 반영 작업이 아닙니다: {entry_id}"
+            }
+        )
+    return resolution
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """X-Hub-Signature-256 ("sha256=<hex>") 검증 (원본 요청 본문 기준)"""
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.removeprefix("sha256="))
+
+
+def touched_slugs(payload: Dict[str, Any]) -> set[str]:
+    """
+    push에 포함된 커밋들이 추가/수정/삭제한 문서 slug
+
+    최종 상태는 push 이후 트리로 판단하므로 변경 종류는 구분하지 않습니다.
+    (한 push 안에서 추가 후 삭제, 이동(삭제 + 추가)도 트리 기준으로 정리됨)
+    """
+    slugs = set()
+    for commit in payload.get("commits") or []:
+        for key in ("added", "modified", "removed"):
+            for path in commit.get(key) or []:
+                slug = slug_from_path(path)
+                if slug:
+                    slugs.add(slug)
+    return slugs
+
+
+def slug_from_path(path: str) -> Optional[str]:
+    """저장소 경로 → 문서 slug (content/ 아래 Markdown이 아니면 None)"""
+    if not path.startswith(CONTENT_PREFIX) or not path.endswith(MARKDOWN_SUFFIX):
+        return None
+    return path[len(CONTENT_PREFIX):-len(MARKDOWN_SUFFIX)]
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """frontmatter 날짜 (문자열 또는 YAML datetime)"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def page_values(slug: str, sha: str, markdown: str, project_ids: set[str]) -> Dict[str, Any]:
+    """
+    Markdown 파일 → pages 행 값
+
+    frontmatter에 없는 값은 경로에서 추정합니다. (제목: 파일 이름, 카테고리: 상위 경로)
+    project_id는 frontmatter에 있고 존재하는 프로젝트일 때만 새 문서에 사용합니다.
+    """
+    metadata, body = parse_frontmatter(markdown)
+
+    status = metadata.get("status")
+    if slug.startswith(ARCHIVED_PREFIX):
+        status = "archived"
+    elif status not in PAGE_STATUSES:
+        status = "active"
+
+    category = metadata.get("category")
+    if not category:
+        category = slug.removeprefix(ARCHIVED_PREFIX).rpartition("/")[0] or None
+
+    project_id = metadata.get("project_id") or metadata.get("project")
+
+    tags = metadata.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tags]
+
+    return {
+        "slug": slug,
+        "title": str(metadata.get("title") or slug.rpartition("/")[2]),
+        "category": category,
+        "author": metadata.get("author"),
+        "project_id": project_id if project_id in project_ids else None,
+        "content": body,
+        "summary": metadata.get("summary"),
+        "status": status,
+        "github_sha": sha,
+        "github_url": github_client.html_url(slug),
+        "created_at": _parse_datetime(metadata.get("created")) or datetime.now(timezone.utc),
+        "tags": [str(tag) for tag in tags],
+    }
+
+
+async def _download(
+    files: Dict[str, str],
+    project_ids: set[str],
+    semaphore: asyncio.Semaphore,
+    failed: Dict[str, str],
+) -> list[Dict[str, Any]]:
+    """blob 동시 다운로드 + frontmatter 파싱 (실패한 파일은 failed에 기록하고 제외)"""
+
+    async def fetch(slug: str, sha: str) -> Optional[Dict[str, Any]]:
+        try:
+            async with semaphore:
+                data = await github_client.get_blob(sha)
+            return page_values(slug, sha, data.decode("utf-8"), project_ids)
+        except Exception as e:
+            logger.warning("github_sync_file_failed", slug=slug, sha=sha, error=str(e))
+            failed[slug] = str(e)
+            return None
+
+    rows = await asyncio.gather(*(fetch(slug, sha) for slug, sha in files.items()))
+    return [row for row in rows if row is not None]
+
+
+def _unsynced(slug_column):
+    """GitHub 반영 대기/실패 작업이 있는 문서 조건"""
+    return exists().where(
+        GitHubOutbox.status.in_(UNSYNCED_OUTBOX_STATUSES),
+        (GitHubOutbox.path == slug_column) | (GitHubOutbox.new_path == slug_column),
+    )
+
+
+class _Changes:
+    """반영 중 바뀐 문서/태그 누적 (캐시 무효화는 반영이 끝날 때 한 번 등록)"""
+
+    def __init__(self) -> None:
+        self.page_ids: set[int] = set()
+        self.slugs: set[str] = set()
+        self.projects: set[str] = set()
+        self.tag_ids: set[int] = set()
+
+    def add(self, pages: Iterable[Any]) -> None:
+        for page in pages:
+            self.page_ids.add(page.id)
+            self.slugs.add(page.slug)
+            if page.project_id:
+                self.projects.add(page.project_id)
+
+    def emit(self, db: AsyncSession) -> None:
+        """커밋되면 무효화할 문서/태그 등록"""
+        if self.page_ids or self.slugs:
+            mark_pages_changed(db, self.page_ids, self.slugs, projects=self.projects)
+        if self.tag_ids:
+            invalidation.emit(db, "tags", ids=sorted(self.tag_ids))
+
+
+async def _delete(db: AsyncSession, slugs: Iterable[str], changes: _Changes) -> list[str]:
+    """
+    GitHub에서 지워진 문서 삭제 (반영 대기 작업이 있는 문서 제외), 삭제한 slug 반환
+
+    행이 사라지므로 문서 목록 Last-Modified가 볼 수 있도록 처리 완료된 delete
+    작업을 outbox에 함께 기록합니다.
+
+    page_tags는 CASCADE로 지워지므로, 같은 문장에서 삭제 전 연결을 읽어
+    태그별 usage_count를 한 번에 감소시킵니다. (sync_tags_bulk와 같은 방식)
+    """
+    deleted_pages = (
+        delete(Page)
+        .where(Page.slug.in_(list(slugs)), ~_unsynced(Page.slug))
+        .returning(Page.id, Page.slug, Page.project_id)
+        .cte("deleted_pages")
+    )
+    # 데이터 변경 CTE는 같은 스냅샷을 보므로 CASCADE 이전의 page_tags가 보임
+    removed_tags = (
+        select(page_tags.c.tag_id, func.count().label("delta"))
+        .join(deleted_pages, page_tags.c.page_id == deleted_pages.c.id)
+        .group_by(page_tags.c.tag_id)
+        .cte("removed_tags")
+    )
+    counted_tags = (
+        update(Tag)
+        .where(Tag.id == removed_tags.c.tag_id)
+        .values(usage_count=func.greatest(func.coalesce(Tag.usage_count, 0) - removed_tags.c.delta, 0))
+        .returning(Tag.id)
+        .cte("counted_tags")
+    )
+    result = await db.execute(
+        select(
+            deleted_pages.c.id,
+            deleted_pages.c.slug,
+            deleted_pages.c.project_id,
+            select(func.array_agg(counted_tags.c.id)).scalar_subquery().label("tag_ids"),
+        )
+    )
+    deleted = result.all()
+    if deleted:
+        changes.tag_ids.update(deleted[0].tag_ids or ())
+        await db.execute(
+            pg_insert(GitHubOutbox).values([
+                {
+                    "operation": "delete",
+                    "path": row.slug,
+                    "message": f"Delete {row.slug} (synced from GitHub)",
+                    "status": "done",
+                    "processed_at": text("now()"),
+                }
+                for row in deleted
+            ])
+        )
+        changes.add(deleted)
+    return sorted(row.slug for row in deleted)
+
+
+async def _upsert(db: AsyncSession, rows: list[Dict[str, Any]], changes: _Changes) -> Dict[str, bool]:
+    """
+    문서 일괄 upsert 후 파생 데이터(색인, 태그) 일괄 갱신
+
+    그 사이 편집되어 GitHub 반영 작업이 생긴 문서는 덮어쓰지 않습니다.
+
+    Returns:
+        반영된 slug → 새 문서 여부
+    """
+    insert_stmt = pg_insert(Page).values([
+        {column: value for column, value in row.items() if column != "tags"}
+        for row in rows
+    ])
+    excluded = insert_stmt.excluded
+    result = await db.execute(
+        insert_stmt
+        .on_conflict_do_update(
+            index_elements=[Page.slug],
+            # project_id, created_at, view_count는 DB 값 유지
+            set_={
+                "title": excluded.title,
+                "category": excluded.category,
+                "author": excluded.author,
+                "content": excluded.content,
+                "summary": excluded.summary,
+                "status": excluded.status,
+                "github_sha": excluded.github_sha,
+                "github_url": excluded.github_url,
+                "last_synced_at": text("now()"),
+                "updated_at": text("now()"),
+            },
+            where=~_unsynced(Page.slug),
+        )
+        # xmax = 0: 새로 삽입된 행 (충돌 후 갱신된 행은 xmax가 설정됨)
+        .returning(Page.id, Page.slug, literal_column("xmax = 0").label("inserted"))
+    )
+    written = {row.slug: (row.id, row.inserted) for row in result.all()}
+    if not written:
+        return {}
+
+    tags_by_slug = {row["slug"]: row["tags"] for row in rows}
+    pages = (await db.execute(
+        select(Page)
+        .options(undefer_group("body"))
+        .where(Page.id.in_([page_id for page_id, _ in written.values()]))
+    )).scalars().all()
+
+    # tags_text가 먼저 갱신되어야 초성 색인도 새 태그 기준으로 계산됨
+    added, removed, affected_ids = await sync_tags_bulk(
+        db, [(page, tags_by_slug[page.slug]) for page in pages]
+    )
+    await index_pages(db, pages)
+
+    changes.add(pages)
+    changes.page_ids |= affected_ids
+    changes.tag_ids |= added | removed
+    return {slug: inserted for slug, (_, inserted) in written.items()}
+
+
+async def resolve_conflict(entry_id: int, strategy: str) -> Optional[ConflictResolution]:
+    """
+    보류된(conflict/failed) 반영 작업 해결
+
+    GitHub 파일은 트랜잭션 밖에서 조회하고, 해결은 push 웹훅과 같은 advisory lock
+    아래 한 트랜잭션으로 커밋합니다.
+
+    - theirs: 작업이 건드리는 경로의 반영 대기 작업(pending/failed/conflict)을 모두
+      discarded로 바꾼 뒤 GitHub 파일을 upsert하고, GitHub에 없는 문서는 삭제합니다.
+      (먼저 버려야 _unsynced 조건에 걸리지 않음)
+    - mine: base_sha를 GitHub의 현재 SHA로 바꿔 다시 대기열에 넣습니다. (outbox.rebase)
+
+    Returns:
+        결과 (보류된 작업이 아니면 None)
+    """
+    async with AsyncSessionLocal() as db:
+        entry = await db.get(GitHubOutbox, entry_id)
+        if entry is None or entry.status not in outbox.HELD_STATUSES:
+            return None
+        path = entry.path
+        paths = sorted({entry.path, entry.new_path} - {None})
+        project_ids = set((await db.execute(select(Project.id))).scalars().all()) if strategy == "theirs" else set()
+
+    github_files = dict(zip(paths, await asyncio.gather(*(github_client.get_file(slug) for slug in paths))))
+    resolution = ConflictResolution(id=entry_id, strategy=strategy)
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PUSH_LOCK_KEY})
+        entry = (await db.execute(
+            select(GitHubOutbox).where(GitHubOutbox.id == entry_id).with_for_update()
+        )).scalar_one_or_none()
+        if entry is None or entry.status not in outbox.HELD_STATUSES:
+            # 동시에 다른 요청이 해결함
+            return None
+
+        if strategy == "mine":
+            current = github_files[path]
+            outbox.rebase(entry, current["sha"] if current else None)
+            resolution.base_sha = entry.base_sha
+        else:
+            discarded = await db.execute(
+                update(GitHubOutbox)
+                .where(
+                    GitHubOutbox.status.in_(UNSYNCED_OUTBOX_STATUSES),
+                    GitHubOutbox.path.in_(paths) | GitHubOutbox.new_path.in_(paths),
+                )
+                .values(status="discarded", processed_at=text("now()"))
+                .returning(GitHubOutbox.id)
+            )
+            resolution.discarded = sorted(discarded.scalars().all())
+
+            changes = _Changes()
+            rows = [
+                page_values(slug, github_file["sha"], github_file["content"], project_ids)
+                for slug, github_file in github_files.items() if github_file
+            ]
+            written = await _upsert(db, rows, changes) if rows else {}
+            resolution.updated = sorted(written)
+            removed = [slug for slug, github_file in github_files.items() if github_file is None]
+            resolution.deleted = await _delete(db, removed, changes) if removed else []
+            changes.emit(db)
+
+        await db.commit()
+
+    if strategy == "mine":
+        outbox.outbox_dispatcher.notify()
+
+    logger.info(
+        "outbox_conflict_resolved",
+        id=entry_id, strategy=strategy, paths=paths, base_sha=resolution.base_sha,
+        discarded=resolution.discarded, updated=resolution.updated, deleted=resolution.deleted,
+    )
+    return resolution
+
+
+async def resolve_held(strategy: str) -> list[ConflictResolution]:
+    """보류된 반영 작업 전체를 id 순서대로 해결 (앞선 해결이 함께 버린 작업은 건너뜀)"""
+    async with AsyncSessionLocal() as db:
+        entry_ids = (await db.execute(
+            select(GitHubOutbox.id)
+            .where(GitHubOutbox.status.in_(outbox.HELD_STATUSES))
+            .order_by(GitHubOutbox.id)
+        )).scalars().all()
+
+    resolutions = []
+    for entry_id in entry_ids:
+        resolution = await resolve_conflict(entry_id, strategy)
+        if resolution is not None:
+            resolutions.append(resolution)
+    return resolutions
+
+
+async def reconcile(
+    dry_run: bool = False,
+    prune: bool = False,
+    concurrency: int = settings.GITHUB_SYNC_CONCURRENCY,
+    batch_size: int = settings.GITHUB_SYNC_BATCH_SIZE,
+) -> Optional[SyncReport]:
+    """
+    GitHub content/ 트리와 DB 비교 후 달라진 문서만 반영
+
+    Args:
+        dry_run: 비교만 하고 DB는 바꾸지 않음
+        prune: GitHub에 없는 문서를 DB에서 삭제 (트리가 잘린 경우 무시)
+        concurrency: 동시에 내려받는 파일 수
+        batch_size: 한 트랜잭션에 반영하는 문서 수
+
+    Returns:
+        결과 (다른 재동기화가 실행 중이면 None)
+    """
+    started = time.perf_counter()
+
+    # advisory lock은 세션 단위이므로 전용 커넥션에서 잡고 놓습니다.
+    async with engine.connect() as lock_conn:
+        locked = (await lock_conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": SYNC_LOCK_KEY}
+        )).scalar()
+        if not locked:
+            return None
+
+        try:
+            report = await _reconcile_locked(dry_run, prune, concurrency, batch_size)
+        finally:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SYNC_LOCK_KEY})
+
+    report.elapsed_ms = int((time.perf_counter() - started) * 1000)
+    logger.info(
+        "github_sync_completed",
+        tree_sha=report.tree_sha, files=report.files, created=len(report.created),
+        updated=len(report.updated), deleted=len(report.deleted), skipped=len(report.skipped),
+        failed=len(report.failed), dry_run=dry_run, elapsed_ms=report.elapsed_ms,
+    )
+    return report
+
+
+async def _reconcile_locked(dry_run: bool, prune: bool, concurrency: int, batch_size: int) -> SyncReport:
+    tree = await github_client.get_tree()
+    files: Dict[str, str] = {}
+    for entry in tree["tree"]:
+        slug = slug_from_path(entry["path"]) if entry["type"] == "blob" else None
+        if slug:
+            files[slug] = entry["sha"]
+
+    async with AsyncSessionLocal() as db:
+        known = dict((await db.execute(select(Page.slug, Page.github_sha))).all())
+        unsynced = set()
+        for path, new_path in (await db.execute(
+            select(GitHubOutbox.path, GitHubOutbox.new_path)
+            .where(GitHubOutbox.status.in_(UNSYNCED_OUTBOX_STATUSES))
+        )).all():
+            unsynced |= {path, new_path} - {None}
+        project_ids = set((await db.execute(select(Project.id))).scalars().all())
+
+    changed = {slug: sha for slug, sha in files.items() if known.get(slug) != sha and slug not in unsynced}
+    missing = sorted(slug for slug in known.keys() - files.keys() if slug not in unsynced)
+
+    report = SyncReport(
+        tree_sha=tree["sha"],
+        truncated=bool(tree.get("truncated")),
+        dry_run=dry_run,
+        files=len(files),
+        unchanged=sum(1 for slug, sha in files.items() if known.get(slug) == sha),
+        missing=missing,
+        skipped=sorted(unsynced & (files.keys() | known.keys())),
+        elapsed_ms=0,
+    )
+
+    if dry_run:
+        report.created = sorted(slug for slug in changed if slug not in known)
+        report.updated = sorted(slug for slug in changed if slug in known)
+        return report
+
+    changes = _Changes()
+    try:
+        await _apply_batches(changed, missing, prune, project_ids, concurrency, batch_size, report, changes)
+    finally:
+        # 배치마다 커밋하지만 캐시 무효화는 재동기화 전체에 대해 한 번 (중간에 실패해도 커밋된 배치는 무효화)
+        if changes.page_ids or changes.tag_ids:
+            async with AsyncSessionLocal() as db:
+                changes.emit(db)
+                await db.commit()
+
+    return report
+
+
+async def _apply_batches(
+    changed: Dict[str, str],
+    missing: list[str],
+    prune: bool,
+    project_ids: set[str],
+    concurrency: int,
+    batch_size: int,
+    report: SyncReport,
+    changes: _Changes,
+) -> None:
+    """달라진 문서를 배치 단위로 내려받아 반영하고, prune이면 GitHub에 없는 문서 삭제"""
+    semaphore = asyncio.Semaphore(concurrency)
+    slugs = sorted(changed)
+    for start in range(0, len(slugs), batch_size):
+        batch = {slug: changed[slug] for slug in slugs[start:start + batch_size]}
+        rows = await _download(batch, project_ids, semaphore, report.failed)
+        if not rows:
+            continue
+
+        async with AsyncSessionLocal() as db:
+            written = await _upsert(db, rows, changes)
+            await db.commit()
+
+        for slug, inserted in sorted(written.items()):
+            (report.created if inserted else report.updated).append(slug)
+        # 편집 중이라 덮어쓰지 않은 문서
+        report.skipped.extend(sorted(row["slug"] for row in rows if row["slug"] not in written))
+
+    if prune and missing and not report.truncated:
+        async with AsyncSessionLocal() as db:
+            report.deleted = await _delete(db, missing, changes)
+            await db.commit()
+        report.missing = sorted(set(missing) - set(report.deleted))
+
+
+def plan_push(
+    files: Dict[str, str],
+    known: Dict[str, Optional[str]],
+    unsynced: set[str],
+    truncated: bool,
+) -> tuple[Dict[str, str], list[str]]:
+    """
+    push가 건드린 문서 중 반영할 것 계산
+
+    Args:
+        files: 트리에 있는 문서 slug → blob SHA (push가 건드린 문서만)
+        known: DB에 있는 문서 slug → github_sha (push가 건드린 문서만)
+        unsynced: GitHub 반영 대기 작업이 있어 건너뛸 slug
+        truncated: 트리가 잘렸는지
+
+    Returns:
+        (내려받을 slug → blob SHA, 삭제할 slug)
+    """
+    # SHA가 같으면 이미 반영됨 (예: outbox가 만든 커밋)
+    changed = {slug: sha for slug, sha in files.items() if known.get(slug) != sha and slug not in unsynced}
+    # 잘린 트리에서는 없는 파일이 삭제된 것인지 알 수 없음
+    removed = [] if truncated else sorted(slug for slug in known.keys() - files.keys() if slug not in unsynced)
+    return changed, removed
+
+
+async def head_files(slugs: set[str]) -> tuple[Optional[str], Dict[str, str], bool]:
+    """
+    브랜치 head 트리에서 주어진 문서의 blob SHA 조회
+
+    Returns:
+        (head 커밋 SHA, slug → blob SHA, 트리가 잘렸는지) - slugs가 비었으면 GitHub을 호출하지 않음
+    """
+    if not slugs:
+        return None, {}, False
+
+    head_sha = await github_client.get_head()
+    tree = await github_client.get_tree(head_sha)
+    files: Dict[str, str] = {}
+    for entry in tree["tree"]:
+        slug = slug_from_path(entry["path"]) if entry["type"] == "blob" else None
+        if slug in slugs:
+            files[slug] = entry["sha"]
+    return head_sha, files, bool(tree.get("truncated"))
+
+
+async def apply_push(payload: Dict[str, Any], delivery_id: Optional[str] = None) -> PushResult:
+    """
+    push 웹훅 반영
+
+    웹훅은 순서 없이 늦게 도착하거나 재전송될 수 있으므로 push의 after 커밋이 아니라
+    브랜치 head 트리 기준으로 push가 건드린 문서를 반영합니다. 늦게 도착한 이전 push가
+    이후 push의 수정/삭제를 되돌리지 않습니다.
+
+    내려받기는 트랜잭션 밖에서 하고, 문서 반영과 커밋 기록(github_pushes)은 한
+    트랜잭션으로 커밋합니다. 반영은 advisory lock으로 직렬화하며, 내려받는 사이 head가
+    바뀌었으면 새 head 기준으로 다시 계산합니다. 실패하면 기록되지 않으므로 재전송 시
+    다시 처리됩니다.
+    """
+    commit_sha = payload.get("after")
+    result = PushResult(event="push", commit=commit_sha, status="ignored")
+    if payload.get("ref") != f"refs/heads/{github_client.branch}" or payload.get("deleted") or not commit_sha:
+        return result
+
+    slugs = touched_slugs(payload)
+    async with AsyncSessionLocal() as db:
+        if await db.get(GitHubPush, commit_sha) is not None:
+            result.status = "duplicate"
+            return result
+        project_ids = set((await db.execute(select(Project.id))).scalars().all()) if slugs else set()
+
+    for attempt in range(1, PUSH_APPLY_ATTEMPTS + 1):
+        head_sha, files, truncated = await head_files(slugs)
+        async with AsyncSessionLocal() as db:
+            known = dict((await db.execute(
+                select(Page.slug, Page.github_sha).where(Page.slug.in_(slugs))
+            )).all()) if slugs else {}
+            unsynced = set((await db.execute(
+                select(Page.slug).where(Page.slug.in_(slugs), _unsynced(Page.slug))
+            )).scalars().all()) if slugs else set()
+
+        changed, removed = plan_push(files, known, unsynced, truncated)
+        failed: Dict[str, str] = {}
+        rows = await _download(changed, project_ids, asyncio.Semaphore(settings.GITHUB_SYNC_CONCURRENCY), failed)
+        if failed:
+            raise GithubException(502, {"message": f"blob 조회 실패: {', '.join(sorted(failed))}"})
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PUSH_LOCK_KEY})
+            if head_sha is not None and await github_client.get_head() != head_sha:
+                # 내려받는 사이 새 push가 들어옴 → 이전 트리로 덮어쓰지 않고 새 head 기준으로 다시
+                logger.info("github_push_head_moved", commit=commit_sha, head=head_sha, attempt=attempt)
+                await db.rollback()
+                continue
+
+            recorded = (await db.execute(
+                pg_insert(GitHubPush)
+                .values(
+                    commit_sha=commit_sha,
+                    ref=payload["ref"],
+                    delivery_id=delivery_id,
+                    pusher=(payload.get("pusher") or {}).get("name"),
+                    paths=len(slugs),
+                )
+                .on_conflict_do_nothing(index_elements=[GitHubPush.commit_sha])
+                .returning(GitHubPush.commit_sha)
+            )).scalar()
+            if recorded is None:
+                # 동시에 도착한 재전송이 먼저 반영함
+                result.status = "duplicate"
+                return result
+
+            changes = _Changes()
+            written = await _upsert(db, rows, changes) if rows else {}
+            result.deleted = await _delete(db, removed, changes) if removed else []
+            changes.emit(db)
+            await db.commit()
+        break
+    else:
+        # 기록하지 않으므로 재전송이나 이후 push, 전체 재동기화에서 반영됨
+        logger.warning("github_push_stale", commit=commit_sha, delivery=delivery_id, attempts=PUSH_APPLY_ATTEMPTS)
+        result.status = "stale"
+        return result
+
+    result.status = "applied"
+    for slug, inserted in sorted(written.items()):
+        (result.created if inserted else result.updated).append(slug)
+    result.skipped = sorted(unsynced | {row["slug"] for row in rows if row["slug"] not in written})
+    result.unchanged = sum(1 for slug, sha in files.items() if known.get(slug) == sha)
+
+    logger.info(
+        "github_push_applied",
+        commit=commit_sha, head=head_sha, delivery=delivery_id, paths=len(slugs), created=len(result.created),
+        updated=len(result.updated), deleted=len(result.deleted), skipped=len(result.skipped),
+    )
+    return result
@@ -3,14 +3,16 @@ Tags API - 태그 관리
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from typing import List, Optional
 from pydantic import BaseModel
 
+from app.api.pages import list_load_options
 from app.db.database import get_db
 from app.models.tag import Tag
 from app.models.page import Page
-from app.schemas.page import PageResponse, PageListResponse
+from app.schemas.page import PageSummary, PageListResponse
+from app.services.pagination import encode_cursor, decode_cursor, apply_keyset, count_rows
 
 router = APIRouter()
 
@@ -33,6 +35,8 @@ async def get_tags(
 ):
     """
     전체 태그 목록 조회 (사용 빈도순)
+
+    태그 컬럼만 조회하며 연결된 문서는 불러오지 않습니다.
     """
 
     query = select(Tag).order_by(Tag.usage_count.desc())
@@ -42,12 +46,15 @@ async def get_tags(
     return [TagResponse.model_validate(tag) for tag in tags]
 
 
-@router.get("/{tag_name}/pages", response_model=PageListResponse)
+@router.get("/{tag_name}/pages", response_model=PageListResponse, response_model_exclude_unset=True)
 async def get_pages_by_tag(
     tag_name: str,
     status: str = Query("active", description="문서 상태"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor가 없을 때만 사용)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 문서 수"),
+    count: str = Query("exact", pattern="^(exact|estimated|none)$", description="전체 개수 계산 방식"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: title,summary,tags)"),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -55,10 +62,21 @@ async def get_pages_by_tag(
 
     - **tag_name**: 태그 이름 (예: 종족/엘프)
     - **status**: active, archived, draft
-    - **page**: 페이지 번호
+    - **cursor**: 다음 페이지 커서
+    - **page**: 페이지 번호 (하위 호환용 OFFSET 방식)
     - **limit**: 페이지당 문서 수
+    - **count**: exact (COUNT), estimated (플래너 추정치), none (생략)
+    - **fields**: 필요한 필드만 응답 (id, slug는 항상 포함)
     """
 
+    try:
+        requested_fields = PageSummary.parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "INVALID_FIELDS", "message": str(e)}
+        )
+
     # 태그 조회
     tag_query = select(Tag).where(Tag.name == tag_name)
     tag_result = await db.execute(tag_query)
@@ -80,27 +98,41 @@ async def get_pages_by_tag(
         .join(Page.tags)
         .where(Tag.id == tag.id)
         .where(Page.status == status)
-        .order_by(Page.updated_at.desc())
     )
 
-    # 페이지네이션
-    offset = (page - 1) * limit
-    query = query.offset(offset).limit(limit)
-
-    result = await db.execute(query)
+    # 전체 개수 조회
+    total = await count_rows(db, query, count)
+
+    # 최근 수정순 (updated_at, id) 커서
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, "updated_at", "desc", Page.updated_at)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "INVALID_CURSOR", "message": str(e)}
+            )
+    query = apply_keyset(query, Page.updated_at, Page.id, "desc", after)
+
+    # 페이지네이션 (다음 페이지 유무 확인을 위해 1개 더 조회)
+    if after is None and page > 1:
+        query = query.offset((page - 1) * limit)
+    query = query.limit(limit + 1)
+
+    # 본문은 모델에서 지연 로드, fields가 있으면 요청한 컬럼만 로드 (문서 목록과 같은 옵션)
+    result = await db.execute(query.options(*list_load_options(requested_fields, Page.updated_at)))
     pages = result.scalars().all()
 
-    # 전체 개수 조회
-    count_query = (
-        select(func.count(Page.id))
-        .join(Page.tags)
-        .where(Tag.id == tag.id)
-        .where(Page.status == status)
-    )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    next_cursor = None
+    if len(pages) > limit:
+        pages = pages[:limit]
+        last = pages[-1]
+        next_cursor = encode_cursor("updated_at", "desc", last.updated_at, last.id)
 
     return PageListResponse(
         total=total,
-        pages=[PageResponse.model_validate(p) for p in pages]
+        total_estimated=count == "estimated",
+        next_cursor=next_cursor,
+        pages=[PageSummary.from_page(p, requested_fields) for p in pages]
     )
@@ -4,7 +4,7 @@ Upload API - 이미지 업로드
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List
 import base64
 from datetime import datetime
 import uuid
@@ -18,6 +18,11 @@ logger = structlog.get_logger()
 router = APIRouter()
 
 
+MAX_SIZE = 2 * 1024 * 1024  # 2MB
+MAX_FILES = 20  # 일괄 업로드 최대 파일 수
+ALLOWED_TYPES = ["image/jpeg", "image/jpg", "image/png", "image/gif", "image/webp"]
+
+
 class UploadResponse(BaseModel):
     """업로드 응답"""
     url: str
@@ -25,21 +30,8 @@ class UploadResponse(BaseModel):
     size: int
 
 
-@router.post("/image", response_model=UploadResponse)
-async def upload_image(
-    file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    이미지 업로드 (GitHub 저장)
-
-    - **file**: 이미지 파일 (최대 2MB)
-
-    지원 형식: jpg, jpeg, png, gif, webp
-    """
-
-    # 파일 크기 체크 (2MB)
-    MAX_SIZE = 2 * 1024 * 1024  # 2MB
+async def _read_image(file: UploadFile) -> bytes:
+    """이미지 파일을 읽고 크기/형식 검증"""
     content = await file.read()
     size = len(content)
 
@@ -52,9 +44,7 @@ async def upload_image(
             }
         )
 
-    # 파일 형식 체크
-    allowed_types = ["image/jpeg", "image/jpg", "image/png", "image/gif", "image/webp"]
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_TYPES:
         raise HTTPException(
             status_code=400,
             detail={
@@ -63,17 +53,101 @@ async def upload_image(
             }
         )
 
+    return content
+
+
+def _new_filename(original: str) -> str:
+    """고유한 파일명 생성"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    unique_id = str(uuid.uuid4())[:8]
+    extension = original.split('.')[-1] if '.' in original else 'png'
+    return f"{timestamp}_{unique_id}.{extension}"
+
+
+@router.post("/images", response_model=List[UploadResponse])
+async def upload_images(
+    files: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    이미지 일괄 업로드 (GitHub에 하나의 커밋으로 저장)
+
+    - **files**: 이미지 파일들 (파일당 최대 2MB, 최대 20개)
+
+    지원 형식: jpg, jpeg, png, gif, webp
+    """
+
+    if len(files) > MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "code": "TOO_MANY_FILES",
+                "message": f"한 번에 최대 {MAX_FILES}개까지 업로드 가능합니다."
+            }
+        )
+
+    # 전체 파일을 먼저 검증 (일부만 커밋되지 않도록)
+    images = [(file, await _read_image(file)) for file in files]
+
+    try:
+        batch = github_client.batch()
+        uploaded = []
+        for file, content in images:
+            new_filename = _new_filename(file.filename)
+            image_path = f"images/{new_filename}"
+            batch.put(image_path, base64.b64encode(content).decode('utf-8'), is_binary=True)
+            uploaded.append(UploadResponse(
+                url=github_client.raw_url(image_path),
+                filename=new_filename,
+                size=len(content)
+            ))
+
+        result = await batch.commit(f"Upload {len(uploaded)} images")
+
+        logger.info("images_uploaded",
+                   count=len(uploaded),
+                   commit_sha=result["commit_sha"])
+
+        return uploaded
+
+    except Exception as e:
+        logger.error("image_batch_upload_failed",
+                    count=len(files),
+                    error=str(e))
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "code": "UPLOAD_FAILED",
+                "message": "이미지 업로드에 실패했습니다."
+            }
+        )
+
+
+@router.post("/image", response_model=UploadResponse)
+async def upload_image(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    이미지 업로드 (GitHub 저장)
+
+    - **file**: 이미지 파일 (최대 2MB)
+
+    지원 형식: jpg, jpeg, png, gif, webp
+    """
+
+    # 파일 크기/형식 체크
+    content = await _read_image(file)
+    size = len(content)
+
     try:
         # 고유한 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        extension = file.filename.split('.')[-1] if '.' in file.filename else 'png'
-        new_filename = f"{timestamp}_{unique_id}.{extension}"
+        new_filename = _new_filename(file.filename)
 
         # GitHub에 업로드
         image_path = f"images/{new_filename}"
 
-        github_result = github_client.create_file(
+        github_result = await github_client.create_file(
             path=image_path,
             content=base64.b64encode(content).decode('utf-8'),
             message=f"Upload image: {new_filename}",
@@ -87,13 +161,8 @@ async def upload_image(
 
         # GitHub raw URL 생성
         # 형식: https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}
-        raw_url = github_result["url"].replace(
-            "https://api.github.com/repos/",
-            "https://raw.githubusercontent.com/"
-        ).replace("/contents/", "/main/")
-
         return UploadResponse(
-            url=raw_url,
+            url=github_client.raw_url(image_path),
             filename=new_filename,
             size=size
         )
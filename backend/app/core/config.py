@@ -2,7 +2,7 @@
 애플리케이션 설정
 """
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -21,6 +21,37 @@ class Settings(BaseSettings):
     GITHUB_REPO: str
     GITHUB_BRANCH: str = "main"
 
+    # GitHub Outbox (write-behind 커밋 디스패처)
+    OUTBOX_POLL_INTERVAL: float = 5.0  # 대기열 폴링 주기 (초)
+    OUTBOX_BATCH_SIZE: int = 50  # 한 번에 처리할 작업 수
+    OUTBOX_MAX_ATTEMPTS: int = 8  # 이 횟수를 넘기면 failed 처리
+    OUTBOX_RETENTION_DAYS: int = 7  # 반영 완료(done) 작업 보관 기간 (일)
+
+    # GitHub → DB 재동기화
+    GITHUB_SYNC_CONCURRENCY: int = 8  # 동시에 내려받는 파일 수
+    GITHUB_SYNC_BATCH_SIZE: int = 200  # 한 트랜잭션에 반영하는 문서 수
+    GITHUB_WEBHOOK_SECRET: Optional[str] = None  # push 웹훅 서명 키 (없으면 웹훅 비활성)
+
+    # 조회수 버퍼
+    VIEW_COUNT_FLUSH_INTERVAL: float = 10.0  # DB 반영 주기 (초)
+    VIEW_COUNT_DAILY_TABLE: bool = False  # page_views 일별 집계 테이블에도 기록
+
+    # 문서 상세 캐시 (프로세스 내)
+    PAGE_CACHE_SIZE: int = 1000  # 최대 항목 수
+    PAGE_CACHE_TTL: float = 60.0  # 항목 유효 시간 (초)
+    INVALIDATION_HEALTHCHECK_INTERVAL: float = 30.0  # LISTEN 연결 점검 주기 (초)
+
+    # 검색 결과 캐시 (쓰기마다 generation이 바뀌므로 TTL은 메모리 회수용)
+    SEARCH_CACHE_SIZE: int = 500
+    SEARCH_CACHE_TTL: float = 300.0
+    # 후보 문서(n-gram 기준)가 이보다 많으면 단어 중간 일치(ILIKE) 검색 생략
+    SEARCH_SUBSTRING_MAX_CANDIDATES: int = 300
+
+    # Markdown 렌더링
+    RENDER_WORKERS: int = 2  # 렌더링 프로세스 수
+    RENDER_CACHE_SIZE: int = 256  # 본문 SHA 기준 HTML 캐시 항목 수
+    RENDER_CACHE_TTL: float = 3600.0  # HTML 캐시 유효 시간 (초)
+
     # Security
     SECRET_KEY: str
 
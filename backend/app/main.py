@@ -1,15 +1,48 @@
 """
 Xperion Wiki - FastAPI Main Application
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.services.cache import page_cache
+from app.services.github_client import github_client
+from app.services.invalidation import invalidation_listener
+from app.services.markdown_render import render_cache, shutdown_renderer
+from app.services.outbox import outbox_dispatcher
+from app.services.search_cache import search_cache
+from app.services.suggest_index import suggest_index
+from app.services.view_counter import view_counter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 공유 리소스 관리"""
+    # GitHub 반영 대기열 디스패처 시작
+    outbox_dispatcher.start()
+    # 조회수 버퍼 주기적 반영 시작
+    view_counter.start()
+    # 다른 워커의 캐시 무효화 이벤트 수신
+    invalidation_listener.start()
+    # 자동완성 색인 불러오기 (이후 무효화 이벤트로 갱신)
+    suggest_index.start()
+    yield
+    await suggest_index.stop()
+    await invalidation_listener.stop()
+    await view_counter.stop()
+    await outbox_dispatcher.stop()
+    # GitHub 커넥션 풀 정리
+    await github_client.close()
+    # 렌더링 프로세스 풀 정리
+    shutdown_renderer()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
     description="D&D TRPG 위키 시스템 API",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -38,12 +71,24 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/cache")
+async def cache_stats():
+    """프로세스 내 캐시 통계 (적중/실패/축출)"""
+    return {
+        "page": page_cache.stats(),
+        "render": render_cache.stats(),
+        "search": search_cache.stats(),
+        "suggest": suggest_index.stats(),
+    }
+
+
 # API 라우터 등록
-from app.api import projects, pages, search, tags, upload
+from app.api import projects, pages, search, sync, tags, upload
 
 app.include_router(projects.router, tags=["projects"])
 app.include_router(pages.router, prefix="/api/pages", tags=["pages"])
 app.include_router(search.router, prefix="/api/search", tags=["search"])
+app.include_router(sync.router, prefix="/api/sync", tags=["sync"])
 app.include_router(tags.router, prefix="/api/tags", tags=["tags"])
 app.include_router(upload.router, prefix="/api/upload", tags=["upload"])
 
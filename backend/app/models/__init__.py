@@ -1,5 +1,9 @@
 from app.models.project import Project
 from app.models.page import Page
 from app.models.tag import Tag
+from app.models.outbox import GitHubOutbox
+from app.models.github_push import GitHubPush
+from app.models.page_view import PageView
+from app.models.page_ngram import PageNgram
 
-__all__ = ["Project", "Page", "Tag"]
+__all__ = ["Project", "Page", "Tag", "GitHubOutbox", "GitHubPush", "PageView", "PageNgram"]
@@ -0,0 +1,24 @@
+"""
+GitHubPush 모델 - 반영한 push 웹훅 (커밋 SHA 기준 중복 방지)
+"""
+from sqlalchemy import Column, Integer, String, TIMESTAMP
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class GitHubPush(Base):
+    """DB에 반영한 push (같은 커밋의 재전송은 건너뜀)"""
+
+    __tablename__ = "github_pushes"
+
+    # push 이후 브랜치 head 커밋 (payload의 after)
+    commit_sha = Column(String(40), primary_key=True)
+    ref = Column(String(255), nullable=False)
+    delivery_id = Column(String(100))  # X-GitHub-Delivery
+    pusher = Column(String(100))
+    paths = Column(Integer, nullable=False, server_default="0")  # 반영 대상 문서 수
+
+    received_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<GitHubPush(commit_sha={self.commit_sha}, ref={self.ref}, paths={self.paths})>"
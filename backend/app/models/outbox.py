@@ -0,0 +1,50 @@
+"""
+GitHubOutbox 모델 - GitHub 커밋 대기열 (write-behind)
+"""
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, CheckConstraint, Index, ForeignKey
+from sqlalchemy.sql import func, text
+from app.db.database import Base
+
+
+class GitHubOutbox(Base):
+    """GitHub에 아직 반영되지 않은 문서 변경 작업"""
+
+    __tablename__ = "github_outbox"
+
+    id = Column(Integer, primary_key=True)
+
+    # 대상 문서 (하드 삭제 후에는 NULL)
+    page_id = Column(Integer, ForeignKey("pages.id", ondelete="SET NULL"), nullable=True)
+
+    # 작업 내용
+    operation = Column(String(20), nullable=False)  # upsert, delete, move
+    path = Column(String(255), nullable=False)  # slug (content/ 제외)
+    new_path = Column(String(255))  # move 대상 slug
+    content = Column(Text)  # upsert할 Markdown 전체 (frontmatter 포함)
+    base_sha = Column(String(40))  # 작업 직전 GitHub 파일 SHA
+    message = Column(Text, nullable=False)  # 커밋 메시지
+    author = Column(String(100))
+
+    # 처리 상태 (pending, done, failed, conflict: GitHub 파일이 base_sha와 달라 보류,
+    # discarded: 충돌 해결 시 GitHub 내용을 택해 버림)
+    status = Column(String(20), nullable=False, server_default="pending")
+    attempts = Column(Integer, nullable=False, server_default="0")
+    last_error = Column(Text)
+    next_attempt_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+
+    # 날짜
+    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    processed_at = Column(TIMESTAMP(timezone=True))
+
+    __table_args__ = (
+        CheckConstraint("operation IN ('upsert', 'delete', 'move')", name="outbox_operation_check"),
+        CheckConstraint(
+            "status IN ('pending', 'done', 'failed', 'conflict', 'discarded')", name="outbox_status_check"
+        ),
+        Index("idx_github_outbox_pending", "status", "id"),
+        # 목록 Last-Modified 계산용 (하드 삭제 시각)
+        Index("idx_github_outbox_deleted", "created_at", postgresql_where=text("operation = 'delete'")),
+    )
+
+    def __repr__(self):
+        return f"<GitHubOutbox(id={self.id}, op={self.operation}, path={self.path}, status={self.status})>"
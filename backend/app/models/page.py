@@ -1,12 +1,21 @@
 """
 Page 모델 - 위키 문서
 """
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, CheckConstraint, Index, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, CheckConstraint, Index, ForeignKey, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from app.db.database import Base
 
 
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(tags_text, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'D')"
+)
+
+
 class Page(Base):
     """위키 페이지 모델"""
 
@@ -23,8 +32,9 @@ class Page(Base):
     project_id = Column(String(50), ForeignKey("projects.id", ondelete="CASCADE"), nullable=True, index=True)
 
     # 컨텐츠 캐싱 (GitHub 마크다운 원본)
-    content = Column(Text, nullable=False)
-    content_html = Column(Text, nullable=True)  # 선택사항: 사전 렌더링된 HTML
+    # 본문은 목록 조회에서 제외 (필요한 쿼리에서 undefer_group("body")로 로드)
+    content = deferred(Column(Text, nullable=False), group="body", raiseload=True)
+    content_html = deferred(Column(Text, nullable=True), group="body", raiseload=True)  # 선택사항: 사전 렌더링된 HTML
 
     # 날짜
     created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
@@ -35,6 +45,20 @@ class Page(Base):
 
     # 메타데이터
     summary = Column(Text)
+    tags_text = Column(Text)  # 태그 이름 (검색 벡터용, sync_tags가 갱신)
+
+    # 초성 검색용 ("엘론 실버스트라이드" → "ㅇㄹㅅㅂㅅㅌㄹㅇㄷ", app.services.hangul)
+    title_choseong = Column(Text)
+    tags_choseong = Column(Text)  # 태그 단어별 초성 (공백 구분)
+    # 자모 단위 오타 보정용 ("엘론" → "ㅇㅔㄹㄹㅗㄴ")
+    title_jamo = Column(Text)
+
+    # 가중치 전문 검색 벡터 (제목 A, 요약 B, 태그 C, 본문 D)
+    # 한국어 사전이 없으므로 'simple' 설정 + 접두사 검색으로 조사 변화 대응
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)),
+        raiseload=True,
+    )
 
     # GitHub 동기화 메타데이터
     github_sha = Column(String(40))
@@ -42,22 +66,30 @@ class Page(Base):
     last_synced_at = Column(TIMESTAMP(timezone=True))
 
     # 조회수
-    view_count = Column(Integer, server_default="0")
+    view_count = Column(Integer, nullable=False, server_default="0")
 
     # Relationships
     project = relationship("Project", back_populates="pages")
+    # 태그는 엔드포인트마다 selectinload로 명시적으로 로드 (암묵적 로드 시 에러)
     tags = relationship(
         "Tag",
         secondary="page_tags",
         back_populates="pages",
-        lazy="selectin"  # 자동으로 태그 로드
+        lazy="raise_on_sql",
+        passive_deletes=True,  # page_tags는 FK ON DELETE CASCADE로 정리
     )
 
     # 제약 조건
     __table_args__ = (
         CheckConstraint("status IN ('active', 'archived', 'draft')", name="status_check"),
         Index("idx_pages_updated", "updated_at"),
-        # Trigram 인덱스는 Alembic 마이그레이션에서 수동 추가
+        # Keyset 페이지네이션용 (status, 정렬 컬럼, id)
+        Index("idx_pages_status_updated_id", "status", "updated_at", "id"),
+        Index("idx_pages_status_created_id", "status", "created_at", "id"),
+        Index("idx_pages_status_title_id", "status", "title", "id"),
+        Index("idx_pages_status_views_id", "status", "view_count", "id"),
+        Index("idx_pages_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram 인덱스(제목, 본문, 초성, 자모)는 Alembic 마이그레이션에서 수동 추가
     )
 
     def __repr__(self):
@@ -0,0 +1,30 @@
+"""
+PageNgram 모델 - 짧은 검색어용 n-gram 색인
+"""
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.db.database import Base
+
+
+class PageNgram(Base):
+    """
+    문서별 unigram/bigram 출현 횟수
+
+    Trigram 인덱스로 찾을 수 없는 1~2글자 검색어(엘프, 검술)와 초성(ㅇㄹ)을 인덱스 조회로 처리합니다.
+    """
+
+    __tablename__ = "page_ngrams"
+
+    gram = Column(String(2), primary_key=True)
+    page_id = Column(Integer, ForeignKey("pages.id", ondelete="CASCADE"), primary_key=True)
+    title_freq = Column(Integer, nullable=False, server_default="0")
+    content_freq = Column(Integer, nullable=False, server_default="0")
+    # 제목/태그 초성 n-gram 출현 횟수 (1~2자 초성 검색용)
+    title_choseong_freq = Column(Integer, nullable=False, server_default="0")
+    tags_choseong_freq = Column(Integer, nullable=False, server_default="0")
+
+    __table_args__ = (
+        Index("idx_page_ngrams_page", "page_id"),
+    )
+
+    def __repr__(self):
+        return f"<PageNgram(gram={self.gram}, page_id={self.page_id})>"
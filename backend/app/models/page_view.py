@@ -0,0 +1,22 @@
+"""
+PageView 모델 - 일별 조회수 집계
+"""
+from sqlalchemy import Column, Integer, Date, ForeignKey, Index
+from app.db.database import Base
+
+
+class PageView(Base):
+    """문서별 일별 조회수"""
+
+    __tablename__ = "page_views"
+
+    page_id = Column(Integer, ForeignKey("pages.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    views = Column(Integer, nullable=False, server_default="0")
+
+    __table_args__ = (
+        Index("idx_page_views_day", "day"),
+    )
+
+    def __repr__(self):
+        return f"<PageView(page_id={self.page_id}, day={self.day}, views={self.views})>"
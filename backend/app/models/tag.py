@@ -16,6 +16,18 @@ page_tags = Table(
     Index('idx_page_tags_tag', 'tag_id')
 )
 
+# 관련 문서 materialization (page_tags에서 파생, 양방향 저장)
+# sync_tags가 문서의 태그 집합을 바꿀 때마다 해당 문서의 행을 다시 계산합니다.
+page_related = Table(
+    'page_related',
+    Base.metadata,
+    Column('page_id', Integer, ForeignKey('pages.id', ondelete='CASCADE'), primary_key=True),
+    Column('related_page_id', Integer, ForeignKey('pages.id', ondelete='CASCADE'), primary_key=True),
+    Column('common_tags', Integer, nullable=False),
+    Index('idx_page_related_rank', 'page_id', 'common_tags', 'related_page_id'),
+    Index('idx_page_related_related', 'related_page_id')
+)
+
 
 class Tag(Base):
     """태그 모델"""
@@ -30,11 +42,13 @@ class Tag(Base):
     usage_count = Column(Integer, server_default="0")
 
     # Relationships
+    # 태그 목록 조회 시 문서를 불러오지 않도록 암묵적 로드 금지
     pages = relationship(
         "Page",
         secondary="page_tags",
         back_populates="tags",
-        lazy="selectin"
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self):
@@ -1,8 +1,8 @@
 """
 Page 스키마 - API 요청/응답 모델
 """
-from pydantic import BaseModel, Field, field_serializer
-from typing import Optional, List, Any
+from pydantic import BaseModel, Field, field_serializer, field_validator
+from typing import Optional, List, Any, Set
 from datetime import datetime
 
 
@@ -29,7 +29,10 @@ class PageUpdate(PageBase):
     content: Optional[str] = Field(None, min_length=1)
     tags: Optional[List[str]] = None
     expected_sha: Optional[str] = Field(None, description="동시성 제어를 위한 현재 SHA")
-    force: bool = Field(False, description="충돌 무시하고 강제 저장")
+    force: bool = Field(
+        False,
+        description="expected_sha 검사를 건너뛰고 저장 (GitHub에서 직접 수정된 파일은 덮어쓰지 않고 conflict로 보류)",
+    )
 
 
 class PageResponse(PageBase):
@@ -53,15 +56,71 @@ class PageResponse(PageBase):
         from_attributes = True  # SQLAlchemy 모델을 Pydantic으로 변환 허용
 
 
+class PageSummary(BaseModel):
+    """
+    페이지 목록 항목 (본문 제외)
+
+    fields= 파라미터로 요청한 필드만 채워서 응답합니다 (id, slug는 항상 포함).
+    """
+    id: int
+    slug: str
+    title: Optional[str] = None
+    category: Optional[str] = None
+    author: Optional[str] = None
+    project_id: Optional[str] = None
+    summary: Optional[str] = None
+    status: Optional[str] = None
+    tags: List[str] = []
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    view_count: Optional[int] = None
+    github_sha: Optional[str] = None
+
+    @field_validator('tags', mode='before')
+    @classmethod
+    def validate_tags(cls, tags: Any) -> List[str]:
+        """Tag 객체를 문자열 리스트로 변환"""
+        if isinstance(tags, list):
+            return [tag.name if hasattr(tag, 'name') else str(tag) for tag in tags]
+        return []
+
+    @classmethod
+    def parse_fields(cls, raw: Optional[str]) -> Optional[Set[str]]:
+        """
+        fields 파라미터 파싱 ("title,summary,tags")
+
+        Raises:
+            ValueError: 알 수 없는 필드
+        """
+        if not raw:
+            return None
+        fields = {name.strip() for name in raw.split(",") if name.strip()}
+        unknown = fields - set(cls.model_fields)
+        if unknown:
+            raise ValueError(f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}")
+        return fields | {"id", "slug"}
+
+    @classmethod
+    def from_page(cls, page: Any, fields: Optional[Set[str]] = None) -> "PageSummary":
+        """ORM Page에서 요청한 필드만 채운 목록 항목 생성"""
+        names = cls.model_fields if fields is None else fields
+        return cls.model_validate({name: getattr(page, name) for name in names})
+
+    class Config:
+        from_attributes = True
+
+
 class PageDetail(PageResponse):
     """페이지 상세 응답"""
     content_html: Optional[str] = None
     github_url: Optional[str] = None
     last_synced_at: Optional[datetime] = None
-    related_pages: Optional[List[PageResponse]] = []
+    related_pages: Optional[List[PageSummary]] = []
 
 
 class PageListResponse(BaseModel):
     """페이지 목록 응답"""
-    total: int
-    pages: List[PageResponse]
+    total: Optional[int] = Field(None, description="전체 문서 수 (count=none이면 생략)")
+    total_estimated: bool = Field(False, description="total이 플래너 추정치인지 여부")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    pages: List[PageSummary]
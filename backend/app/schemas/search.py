@@ -6,11 +6,18 @@ from typing import List, Optional, Dict
 from datetime import datetime
 
 
+class SearchHighlight(BaseModel):
+    """검색어 주변 본문 조각과 조각 내 매칭 위치"""
+    text: str
+    matches: List[List[int]] = Field(default=[], description="매칭 구간 [시작, 끝) 오프셋 목록")
+
+
 class SearchResult(BaseModel):
     """검색 결과 항목"""
     slug: str
     title: str
     snippet: str = Field(..., description="검색어 주변 텍스트")
+    highlights: List[SearchHighlight] = Field(default=[], description="하이라이트할 본문 조각")
     relevance_score: float = Field(..., description="관련도 점수 (0.0 ~ 1.0)")
     matched_in: List[str] = Field(default=[], description="매칭된 위치 (title, content, tags)")
     category: Optional[str] = None
@@ -21,13 +28,42 @@ class SearchResult(BaseModel):
         from_attributes = True
 
 
+class SearchPlan(BaseModel):
+    """검색 실행 계획과 단계별 소요 시간 (explain=true)"""
+    engines: List[str] = Field(..., description="시도 순서 (결과가 나온 방식에서 중단)")
+    reason: str = Field(..., description="계획 선택 이유")
+    length: int
+    script: str = Field(..., description="검색어 문자 종류 (hangul, latin, mixed, other)")
+    terms: int
+    candidates: Optional[int] = Field(None, description="n-gram 색인 기준 후보 문서 수 상한")
+    timings_ms: Dict[str, float] = Field(default={}, description="단계별 소요 시간 (estimate, 방식 이름)")
+
+
 class SearchResponse(BaseModel):
     """검색 응답"""
     query: str
+    mode: Optional[str] = Field(None, description="실제 사용한 검색 방식 (short, fulltext, substring, trigram, jamo, choseong)")
     total: int
     search_time_ms: Optional[int] = None
+    cached: bool = Field(False, description="검색 결과 캐시에서 응답했는지 여부")
     results: List[SearchResult]
     facets: Optional[Dict[str, Dict[str, int]]] = None  # 카테고리, 태그별 문서 수
+    plan: Optional[SearchPlan] = None
+
+
+class SuggestItem(BaseModel):
+    """자동완성 항목 (문서 또는 태그)"""
+    type: str = Field(..., description="page 또는 tag")
+    label: str = Field(..., description="표시할 이름 (문서 제목, 태그 표시 이름)")
+    slug: Optional[str] = None  # 문서
+    name: Optional[str] = None  # 태그 전체 이름 (예: "종족/엘프")
+    project_id: Optional[str] = None
+
+
+class SuggestResponse(BaseModel):
+    """자동완성 응답"""
+    query: str
+    suggestions: List[SuggestItem]
 
 
 class SearchFilters(BaseModel):
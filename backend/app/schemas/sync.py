@@ -0,0 +1,61 @@
+"""
+Sync Schemas - GitHub → DB 재동기화 / push 웹훅 결과
+"""
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import datetime
+
+
+class SyncReport(BaseModel):
+    """재동기화 결과 (문서 목록은 slug)"""
+    tree_sha: str
+    truncated: bool = Field(False, description="트리가 잘려 일부 파일만 비교했는지 (prune 생략)")
+    dry_run: bool = False
+    files: int = Field(..., description="content/ 아래 Markdown 파일 수")
+    unchanged: int
+    created: List[str] = []
+    updated: List[str] = []
+    deleted: List[str] = []
+    missing: List[str] = Field(default=[], description="DB에만 있는 문서 (prune=true면 삭제)")
+    skipped: List[str] = Field(default=[], description="GitHub 반영 대기/실패 작업이 있어 건너뛴 문서")
+    failed: Dict[str, str] = Field(default={}, description="내려받기/파싱 실패 (slug → 오류)")
+    elapsed_ms: int
+
+
+class PushResult(BaseModel):
+    """push 웹훅 반영 결과 (문서 목록은 slug)"""
+    event: str
+    commit: Optional[str] = Field(None, description="push 이후 head 커밋 SHA")
+    status: str = Field(..., description="applied, duplicate(이미 반영한 커밋), ignored(다른 브랜치/이벤트), stale(반영 중 head가 계속 바뀌어 보류)")
+    unchanged: int = 0
+    created: List[str] = []
+    updated: List[str] = []
+    deleted: List[str] = []
+    skipped: List[str] = Field(default=[], description="GitHub 반영 대기/실패 작업이 있어 건너뛴 문서")
+
+
+class OutboxConflict(BaseModel):
+    """해결될 때까지 보류된 반영 작업 (GitHub 버전 충돌 또는 재시도 초과)"""
+    id: int
+    page_id: Optional[int] = None
+    status: str = Field(..., description="conflict(GitHub에서 직접 수정됨) 또는 failed(재시도 초과)")
+    operation: str
+    path: str
+    new_path: Optional[str] = None
+    base_sha: Optional[str] = Field(None, description="작업이 기대한 GitHub 파일 SHA")
+    last_error: Optional[str] = None
+    author: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ConflictResolution(BaseModel):
+    """보류된 반영 작업 해결 결과 (문서 목록은 slug)"""
+    id: int
+    strategy: str = Field(..., description="theirs(GitHub 내용 반영) 또는 mine(DB 내용으로 다시 반영)")
+    base_sha: Optional[str] = Field(None, description="mine: 다시 반영할 기준 GitHub SHA (파일이 없으면 None)")
+    discarded: List[int] = Field(default=[], description="theirs: 버린 작업 ID (같은 경로의 이후 작업 포함)")
+    updated: List[str] = []
+    deleted: List[str] = []
@@ -0,0 +1,162 @@
+"""
+프로세스 내 응답 캐시 - 문서 상세 (LRU + TTL)
+
+읽기가 쓰기보다 훨씬 많으므로 직렬화된 문서 상세 응답을 slug 기준으로
+보관하고, 문서를 바꾸는 트랜잭션이 커밋되면 관련 항목을 즉시 무효화합니다.
+(다른 워커의 캐시는 app.services.invalidation의 LISTEN/NOTIFY로 무효화)
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services.invalidation import emit, on_invalidate
+
+
+class LRUCache:
+    """크기 제한(LRU)과 만료 시간(TTL)이 있는 캐시"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        # 무효화할 때마다 증가 (무효화 이전에 읽은 값이 다시 저장되는 것을 방지)
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Any) -> Optional[Any]:
+        """값 조회 (없거나 만료되면 None)"""
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Any, value: Any, generation: Optional[int] = None) -> bool:
+        """
+        값 저장 (가장 오래 쓰지 않은 항목부터 밀어냄)
+
+        Args:
+            generation: 값을 읽기 시작할 때의 generation. 그 사이 무효화가
+                있었으면 오래된 값일 수 있으므로 저장하지 않음
+
+        Returns:
+            저장 여부
+        """
+        if generation is not None and generation != self.generation:
+            return False
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def discard_where(self, predicate: Callable[[Any, Any], bool]) -> int:
+        """조건에 맞는 항목 무효화 (쓰기 시점에만 호출되므로 전체 순회)"""
+        self.generation += 1
+        keys = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+        for key in keys:
+            del self._data[key]
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """전체 무효화"""
+        self.generation += 1
+        self.invalidations += len(self._data)
+        self._data.clear()
+
+    def stats(self) -> dict:
+        """적중/실패/축출 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+# 문서 상세 캐시: slug → (etag, 응답 dict, 캐시 시점 조회 기록 수)
+page_cache = LRUCache(maxsize=settings.PAGE_CACHE_SIZE, ttl=settings.PAGE_CACHE_TTL)
+
+
+def invalidate_pages(page_ids: Iterable[int] = (), slugs: Iterable[str] = ()) -> int:
+    """
+    문서 상세 캐시 무효화
+
+    해당 문서 자신과, 관련 문서 목록에 해당 문서를 포함한 항목을 함께 지웁니다.
+    """
+    ids, slug_set = set(page_ids), set(slugs)
+    if not ids and not slug_set:
+        return 0
+
+    def affected(slug: str, entry: tuple) -> bool:
+        payload = entry[1]
+        return (
+            slug in slug_set
+            or payload["id"] in ids
+            or any(related["id"] in ids for related in payload["related_pages"])
+        )
+
+    return page_cache.discard_where(affected)
+
+
+def mark_pages_changed(
+    db: AsyncSession,
+    page_ids: Iterable[int] = (),
+    slugs: Iterable[str] = (),
+    projects: Optional[Iterable[Optional[str]]] = None,
+) -> None:
+    """
+    트랜잭션이 커밋되면 무효화할 문서 등록
+
+    커밋 전에 지우면 다른 요청이 이전 값을 다시 캐시할 수 있으므로 실제 무효화는
+    커밋 후에 수행되며, 다른 워커에는 LISTEN/NOTIFY로 전파됩니다.
+
+    Args:
+        projects: 검색 결과에 영향이 있는 변경이면 바뀐 문서의 프로젝트 ID
+            (검색 캐시 generation을 올림)
+    """
+    data = {"ids": sorted(set(page_ids)), "slugs": sorted(set(slugs))}
+    if projects is not None:
+        data["projects"] = sorted({project for project in projects if project})
+    emit(db, "pages", **data)
+
+
+@on_invalidate("pages")
+def _on_pages_changed(event_data: dict) -> None:
+    if event_data.get("all"):
+        page_cache.clear()
+    else:
+        invalidate_pages(event_data.get("ids", ()), event_data.get("slugs", ()))
+
+
+@on_invalidate("projects")
+def _on_project_changed(event_data: dict) -> None:
+    # 프로젝트 삭제는 하위 문서까지 지우므로 문서 캐시 전체 초기화
+    if event_data.get("all") or event_data.get("deleted"):
+        page_cache.clear()
@@ -1,25 +1,129 @@
 """
 GitHub API 클라이언트
+
+httpx.AsyncClient 기반 비동기 클라이언트입니다.
+커넥션 풀(keep-alive)을 재사용하므로 GitHub 커밋이 이벤트 루프를 막지 않습니다.
 """
-from github import Github, GithubException
+from github import GithubException
 from app.core.config import settings
 import base64
-from typing import Optional, Dict, Any
-import frontmatter
+from typing import Optional, Dict, Any, List, Union
+import asyncio
+import hashlib
+import httpx
 import structlog
 
 logger = structlog.get_logger()
 
+GITHUB_API_URL = "https://api.github.com"
+
+# 브랜치 ref 갱신이 경합(fast-forward 실패)할 때 재시도 횟수
+REF_UPDATE_RETRIES = 3
+
+
+def git_blob_sha(content: Union[str, bytes]) -> str:
+    """
+    Git blob SHA 계산
+
+    GitHub이 저장할 파일의 SHA를 커밋 전에 미리 알 수 있습니다.
+    (sha1("blob <크기>\\0" + 내용))
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def conflict_error(conflicts: Dict[str, Optional[str]]) -> GithubException:
+    """
+    GitHub 파일이 예상한 SHA와 다를 때의 예외 (409)
+
+    Args:
+        conflicts: 저장소 경로 → GitHub의 현재 blob SHA (없으면 None)
+    """
+    return GithubException(409, {"message": "GitHub 파일이 예상한 버전과 다릅니다", "conflicts": conflicts})
+
+
+def is_conflict(error: Exception) -> bool:
+    """conflict_error로 만든 예외인지 (GitHub 자체의 409와 구분)"""
+    return (
+        isinstance(error, GithubException)
+        and error.status == 409
+        and isinstance(error.data, dict)
+        and "conflicts" in error.data
+    )
+
 
 class GitHubClient:
-    """GitHub Repository 관리 클라이언트"""
+    """GitHub Repository 관리 클라이언트 (비동기)"""
 
     def __init__(self):
-        self.client = Github(settings.GITHUB_TOKEN)
-        self.repo = self.client.get_repo(settings.GITHUB_REPO)
+        self.repo_name = settings.GITHUB_REPO
         self.branch = settings.GITHUB_BRANCH
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 AsyncClient (최초 사용 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=f"{GITHUB_API_URL}/repos/{self.repo_name}",
+                headers={
+                    "Authorization": f"Bearer {settings.GITHUB_TOKEN}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """커넥션 풀 정리 (앱 종료 시 호출)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-    def get_file(self, path: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _content_path(path: str) -> str:
+        """content/ 접두사와 .md 확장자를 붙인 저장소 경로"""
+        return f"content/{path}.md" if not path.endswith(".md") else f"content/{path}"
+
+    def html_url(self, path: str) -> str:
+        """문서의 GitHub 웹 URL"""
+        return f"https://github.com/{self.repo_name}/blob/{self.branch}/{self._content_path(path)}"
+
+    def raw_url(self, file_path: str) -> str:
+        """저장소 경로의 raw 파일 URL (이미지 등)"""
+        return f"https://raw.githubusercontent.com/{self.repo_name}/{self.branch}/{file_path}"
+
+    def batch(self) -> "CommitBatch":
+        """여러 파일 변경을 하나의 커밋으로 묶는 배치 생성"""
+        return CommitBatch(self)
+
+    async def _request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """
+        GitHub REST API 호출
+
+        Raises:
+            GithubException: 2xx 이외의 응답 (기존 PyGithub 예외와 동일한 타입)
+        """
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            # 네트워크 오류는 502 계열로 취급
+            raise GithubException(502, {"message": str(e)}) from e
+
+        if response.status_code >= 400:
+            try:
+                data = response.json()
+            except ValueError:
+                data = {"message": response.text}
+            raise GithubException(response.status_code, data, dict(response.headers))
+
+        if response.status_code == 204 or not response.content:
+            return {}
+        return response.json()
+
+    async def get_file(self, path: str) -> Optional[Dict[str, Any]]:
         """
         GitHub에서 파일 가져오기
 
@@ -31,16 +135,16 @@ class GitHubClient:
             }
         """
         try:
-            file_path = f"content/{path}.md" if not path.endswith(".md") else f"content/{path}"
-            file_content = self.repo.get_contents(file_path, ref=self.branch)
+            file_path = self._content_path(path)
+            data = await self._request("GET", f"/contents/{file_path}", params={"ref": self.branch})
 
             # 바이너리 디코딩
-            content = base64.b64decode(file_content.content).decode("utf-8")
+            content = base64.b64decode(data["content"]).decode("utf-8")
 
             return {
                 "content": content,
-                "sha": file_content.sha,
-                "url": file_content.html_url,
+                "sha": data["sha"],
+                "url": data["html_url"],
             }
         except GithubException as e:
             if e.status == 404:
@@ -49,12 +153,45 @@ class GitHubClient:
             logger.error("github_api_error", path=path, status=e.status, error=str(e))
             raise
 
-    def create_file(
+    async def get_tree(self, ref: Optional[str] = None) -> Dict[str, Any]:
+        """
+        브랜치(또는 커밋)의 전체 트리를 한 번의 호출로 조회 (recursive)
+
+        Args:
+            ref: 커밋 SHA 또는 브랜치 (기본: 설정된 브랜치)
+
+        Returns:
+            {
+                "sha": str,          # 트리 SHA
+                "tree": [...],       # {"path", "type", "sha", "size"} 항목
+                "truncated": bool    # 항목이 너무 많아 일부만 반환되었는지
+            }
+        """
+        try:
+            return await self._request("GET", f"/git/trees/{ref or self.branch}", params={"recursive": "1"})
+        except GithubException as e:
+            logger.error("github_tree_failed", ref=ref or self.branch, status=e.status, error=str(e))
+            raise
+
+    async def get_head(self) -> str:
+        """설정된 브랜치의 현재 head 커밋 SHA"""
+        ref = await self._request("GET", f"/git/ref/heads/{self.branch}")
+        return ref["object"]["sha"]
+
+    async def get_blob(self, sha: str) -> bytes:
+        """
+        blob SHA로 파일 내용 조회
+
+        SHA로 가리키므로 조회 중 브랜치가 바뀌어도 트리와 같은 내용을 받습니다.
+        """
+        data = await self._request("GET", f"/git/blobs/{sha}")
+        return base64.b64decode(data["content"])
+
+    async def create_file(
         self,
         path: str,
         content: str,
         message: str,
-        author_name: Optional[str] = None,
         is_binary: bool = False
     ) -> Dict[str, Any]:
         """
@@ -64,7 +201,6 @@ class GitHubClient:
             path: 파일 경로 (content/ 제외)
             content: 파일 내용 (is_binary=True이면 base64 인코딩된 문자열)
             message: 커밋 메시지
-            author_name: 작성자 이름
             is_binary: 바이너리 파일 여부 (이미지 등)
 
         Returns:
@@ -79,35 +215,35 @@ class GitHubClient:
             # 마크다운 파일은 content/ 추가
             if is_binary:
                 file_path = path
+                encoded = content
             else:
-                file_path = f"content/{path}.md" if not path.endswith(".md") else f"content/{path}"
+                file_path = self._content_path(path)
+                encoded = base64.b64encode(content.encode("utf-8")).decode("ascii")
 
             # 커밋
-            result = self.repo.create_file(
-                path=file_path,
-                message=message,
-                content=content,
-                branch=self.branch
+            result = await self._request(
+                "PUT",
+                f"/contents/{file_path}",
+                json={"message": message, "content": encoded, "branch": self.branch},
             )
 
-            logger.info("github_file_created", path=path, sha=result["content"].sha, binary=is_binary)
+            logger.info("github_file_created", path=path, sha=result["content"]["sha"], binary=is_binary)
 
             return {
-                "sha": result["content"].sha,
-                "commit_sha": result["commit"].sha,
-                "url": result["content"].html_url,
+                "sha": result["content"]["sha"],
+                "commit_sha": result["commit"]["sha"],
+                "url": result["content"]["html_url"],
             }
         except GithubException as e:
             logger.error("github_create_failed", path=path, status=e.status, error=str(e))
             raise
 
-    def update_file(
+    async def update_file(
         self,
         path: str,
         content: str,
         message: str,
-        sha: str,
-        author_name: Optional[str] = None
+        sha: str
     ) -> Dict[str, Any]:
         """
         GitHub 파일 업데이트
@@ -117,7 +253,6 @@ class GitHubClient:
             content: 새 내용
             message: 커밋 메시지
             sha: 현재 파일 SHA (동시성 제어)
-            author_name: 작성자 이름
 
         Returns:
             {
@@ -130,22 +265,25 @@ class GitHubClient:
             GithubException: SHA 불일치 시 409 에러
         """
         try:
-            file_path = f"content/{path}.md" if not path.endswith(".md") else f"content/{path}"
-
-            result = self.repo.update_file(
-                path=file_path,
-                message=message,
-                content=content,
-                sha=sha,
-                branch=self.branch
+            file_path = self._content_path(path)
+
+            result = await self._request(
+                "PUT",
+                f"/contents/{file_path}",
+                json={
+                    "message": message,
+                    "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+                    "sha": sha,
+                    "branch": self.branch,
+                },
             )
 
-            logger.info("github_file_updated", path=path, old_sha=sha, new_sha=result["content"].sha)
+            logger.info("github_file_updated", path=path, old_sha=sha, new_sha=result["content"]["sha"])
 
             return {
-                "sha": result["content"].sha,
-                "commit_sha": result["commit"].sha,
-                "url": result["content"].html_url,
+                "sha": result["content"]["sha"],
+                "commit_sha": result["commit"]["sha"],
+                "url": result["content"]["html_url"],
             }
         except GithubException as e:
             if e.status == 409:
@@ -154,7 +292,7 @@ class GitHubClient:
                 logger.error("github_update_failed", path=path, status=e.status, error=str(e))
             raise
 
-    def delete_file(
+    async def delete_file(
         self,
         path: str,
         message: str,
@@ -172,54 +310,325 @@ class GitHubClient:
             {"commit_sha": str}
         """
         try:
-            file_path = f"content/{path}.md" if not path.endswith(".md") else f"content/{path}"
+            file_path = self._content_path(path)
 
-            result = self.repo.delete_file(
-                path=file_path,
-                message=message,
-                sha=sha,
-                branch=self.branch
+            result = await self._request(
+                "DELETE",
+                f"/contents/{file_path}",
+                json={"message": message, "sha": sha, "branch": self.branch},
             )
 
             logger.info("github_file_deleted", path=path, sha=sha)
 
-            return {"commit_sha": result["commit"].sha}
+            return {"commit_sha": result["commit"]["sha"]}
         except GithubException as e:
             logger.error("github_delete_failed", path=path, status=e.status, error=str(e))
             raise
 
-    def move_file(
+    async def move_file(
         self,
         old_path: str,
         new_path: str,
         message: str,
-        sha: str
+        sha: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         파일 이동 (archived 폴더로 이동 등)
 
-        실제로는 삭제 후 생성
+        기존 blob SHA를 그대로 새 경로에 연결하고 원본 경로를 지우는
+        단일 트리 커밋입니다. 내용을 다시 내려받거나 올리지 않습니다.
+
+        Args:
+            old_path: 원래 경로
+            new_path: 새 경로
+            message: 커밋 메시지
+            sha: 파일 blob SHA (없으면 GitHub에서 조회). 지정하면 원래 경로의
+                현재 파일이 이 SHA일 때만 이동 (다르면 conflict_error)
+
+        Returns:
+            {
+                "sha": str,
+                "commit_sha": str,
+                "url": str
+            }
+        """
+        batch = self.batch()
+        if sha:
+            batch.expect(old_path, sha)
+        else:
+            file_data = await self.get_file(old_path)
+            if not file_data:
+                raise FileNotFoundError(f"File not found: {old_path}")
+            sha = file_data["sha"]
+
+        result = await batch.move(old_path, new_path, sha=sha).commit(message)
+
+        logger.info("github_file_moved", old_path=old_path, new_path=new_path, sha=sha)
+
+        return {
+            "sha": sha,
+            "commit_sha": result["commit_sha"],
+            "url": result["files"][new_path]["url"],
+        }
+
+    async def commit_tree(
+        self,
+        entries: List[Dict[str, Any]],
+        message: str,
+        expected: Optional[Dict[str, Optional[str]]] = None,
+    ) -> str:
+        """
+        Git Data API로 트리 변경을 단일 커밋으로 반영
+
+        ref 조회 → base commit 조회 → tree 생성 → commit 생성 → ref 갱신 순서이며,
+        다른 커밋과 경합해 ref 갱신이 실패하면 최신 ref 기준으로 다시 시도합니다.
+
+        삭제 항목(sha=None)이 있으면 base tree에 실제로 있는지 확인해, 이미 없는
+        파일의 삭제는 제외합니다. (없는 경로를 지우면 GitHub이 422로 커밋 전체를 거부)
+
+        Args:
+            entries: POST /git/trees의 tree 항목 리스트
+            message: 커밋 메시지
+            expected: 저장소 경로 → base tree에 있어야 할 blob SHA (None이면 파일이 없어야 함)
+
+        Returns:
+            새 커밋 SHA (반영할 변경이 없으면 현재 head SHA)
+
+        Raises:
+            GithubException: expected와 다른 경로가 있으면 conflict_error (커밋하지 않음)
+        """
+        for attempt in range(1, REF_UPDATE_RETRIES + 1):
+            head_sha = await self.get_head()
+            head_commit = await self._request("GET", f"/git/commits/{head_sha}")
+
+            tree_entries = entries
+            deleted_paths = [entry["path"] for entry in entries if entry.get("sha", "") is None]
+            if deleted_paths or expected:
+                current = await self._blob_shas(
+                    head_sha, head_commit["tree"]["sha"], sorted({*deleted_paths, *(expected or {})})
+                )
+                conflicts = {
+                    path: current[path] for path, sha in (expected or {}).items() if current[path] != sha
+                }
+                if conflicts:
+                    logger.warning("github_batch_conflict", conflicts=conflicts)
+                    raise conflict_error(conflicts)
+
+                tree_entries = [
+                    entry for entry in entries
+                    if entry.get("sha", "") is not None or current[entry["path"]] is not None
+                ]
+                if len(tree_entries) < len(entries):
+                    logger.info("github_batch_skip_missing", paths=[
+                        path for path in deleted_paths if current[path] is None
+                    ])
+                if not tree_entries:
+                    return head_sha
+
+            tree = await self._request(
+                "POST",
+                "/git/trees",
+                json={"base_tree": head_commit["tree"]["sha"], "tree": tree_entries},
+            )
+            commit = await self._request(
+                "POST",
+                "/git/commits",
+                json={"message": message, "tree": tree["sha"], "parents": [head_sha]},
+            )
+
+            try:
+                await self._request(
+                    "PATCH",
+                    f"/git/refs/heads/{self.branch}",
+                    json={"sha": commit["sha"], "force": False},
+                )
+                return commit["sha"]
+            except GithubException as e:
+                # 422: fast-forward 불가 (그 사이 다른 커밋이 들어옴)
+                if e.status != 422 or attempt == REF_UPDATE_RETRIES:
+                    logger.error("github_ref_update_failed", status=e.status, attempt=attempt, error=str(e))
+                    raise
+                logger.warning("github_ref_update_retry", attempt=attempt)
+
+    async def _blob_shas(self, commit_sha: str, tree_sha: str, paths: List[str]) -> Dict[str, Optional[str]]:
+        """
+        커밋 시점 경로별 blob SHA (없는 파일은 None)
+
+        트리 전체를 한 번에 조회하고, 트리가 잘려(truncated) 목록에 없는 경로만 개별 조회합니다.
+        """
+        tree = await self._request("GET", f"/git/trees/{tree_sha}", params={"recursive": "1"})
+        blobs = {entry["path"]: entry["sha"] for entry in tree["tree"] if entry["type"] == "blob"}
+
+        shas: Dict[str, Optional[str]] = {}
+        for path in paths:
+            if path in blobs or not tree.get("truncated"):
+                shas[path] = blobs.get(path)
+                continue
+            try:
+                data = await self._request("GET", f"/contents/{path}", params={"ref": commit_sha})
+                shas[path] = data["sha"]
+            except GithubException as e:
+                if e.status != 404:
+                    raise
+                shas[path] = None
+        return shas
+
+
+class CommitBatch:
+    """
+    여러 파일 변경을 하나의 커밋으로 묶는 배치 (Git Data API)
+
+    같은 경로를 여러 번 변경하면 마지막 변경만 커밋됩니다.
+
+    사용 예:
+        batch = github_client.batch()
+        batch.put("characters/player/elon", markdown)
+        batch.delete("characters/player/old")
+        result = await batch.commit("Bulk update")
+    """
+
+    def __init__(self, client: GitHubClient):
+        self._client = client
+        # 저장소 경로 → 변경 내용 (None이면 삭제)
+        self._changes: Dict[str, Optional[Dict[str, Any]]] = {}
+        # 저장소 경로 → 호출자가 넘긴 경로
+        self._paths: Dict[str, str] = {}
+        # 저장소 경로 → 커밋 직전에 있어야 할 blob SHA (None이면 파일이 없어야 함)
+        self._expected: Dict[str, Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def _file_path(self, path: str, is_binary: bool) -> str:
+        file_path = path if is_binary else self._client._content_path(path)
+        self._paths[file_path] = path
+        return file_path
+
+    def expect(self, path: str, sha: Optional[str]) -> "CommitBatch":
+        """
+        커밋 시점 파일 버전 조건 (마크다운 문서)
+
+        다르면 commit이 conflict_error를 일으키고 아무것도 커밋하지 않습니다.
+        이미 이 배치에서 변경한 경로에는 적용하지 않습니다. (배치 이전 상태만 검사)
+
+        Args:
+            path: 문서 경로 (content/ 제외)
+            sha: GitHub에 있어야 할 blob SHA (None이면 파일이 없어야 함)
+        """
+        file_path = self._client._content_path(path)
+        if file_path not in self._changes and file_path not in self._expected:
+            self._expected[file_path] = sha
+        return self
+
+    def put(self, path: str, content: str, is_binary: bool = False) -> "CommitBatch":
+        """
+        파일 생성/수정
+
+        Args:
+            path: 파일 경로 (마크다운은 content/ 제외, 바이너리는 저장소 경로)
+            content: 파일 내용 (is_binary=True이면 base64 인코딩된 문자열)
+            is_binary: 바이너리 파일 여부
+        """
+        file_path = self._file_path(path, is_binary)
+        self._changes[file_path] = {"content": content, "is_binary": is_binary}
+        return self
+
+    def delete(self, path: str, is_binary: bool = False) -> "CommitBatch":
+        """파일 삭제 (커밋 시점에 이미 없는 파일이면 건너뜀)"""
+        file_path = self._file_path(path, is_binary)
+        self._changes[file_path] = None
+        return self
+
+    def move(self, old_path: str, new_path: str, sha: Optional[str] = None) -> "CommitBatch":
+        """
+        파일 이동 (마크다운 문서)
+
+        기존 blob SHA를 새 경로에 연결하므로 내용 전송이 없습니다.
+        같은 배치에서 put한 경로를 옮기면 그 내용이 새 경로로 이동합니다.
+
+        Args:
+            old_path: 원래 경로 (content/ 제외)
+            new_path: 새 경로 (content/ 제외)
+            sha: 원본 blob SHA (같은 배치에서 put한 경로면 생략 가능)
+        """
+        old_file_path = self._file_path(old_path, False)
+        new_file_path = self._file_path(new_path, False)
+
+        pending = self._changes.get(old_file_path)
+        if pending is not None:
+            self._changes[new_file_path] = pending
+        elif sha:
+            self._changes[new_file_path] = {"sha": sha}
+        else:
+            raise ValueError(f"blob SHA가 필요합니다: {old_path}")
+
+        self._changes[old_file_path] = None
+        return self
+
+    async def _tree_entry(self, file_path: str, change: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        entry = {"path": file_path, "mode": "100644", "type": "blob"}
+
+        if change is None:
+            entry["sha"] = None
+        elif "sha" in change:
+            # 기존 blob 재사용 (이동)
+            entry["sha"] = change["sha"]
+        elif change["is_binary"]:
+            blob = await self._client._request(
+                "POST",
+                "/git/blobs",
+                json={"content": change["content"], "encoding": "base64"},
+            )
+            entry["sha"] = blob["sha"]
+        else:
+            # 텍스트는 tree 생성 시 인라인으로 blob 생성 (SHA는 로컬 계산)
+            entry["content"] = change["content"]
+
+        return entry
+
+    async def commit(self, message: str) -> Dict[str, Any]:
+        """
+        변경 사항을 하나의 커밋으로 반영
+
+        Returns:
+            {
+                "commit_sha": str,
+                "files": {
+                    path: {"sha": str, "url": str} 또는 None (삭제)
+                }
+            }
         """
-        # 1. 원본 파일 가져오기
-        file_data = self.get_file(old_path)
-        if not file_data:
-            raise FileNotFoundError(f"File not found: {old_path}")
+        if not self._changes:
+            return {"commit_sha": None, "files": {}}
 
-        # 2. 새 위치에 생성
-        create_result = self.create_file(
-            path=new_path,
-            content=file_data["content"],
-            message=message
-        )
+        try:
+            # 바이너리 blob 업로드는 동시에 처리
+            entries = await asyncio.gather(*(
+                self._tree_entry(file_path, change)
+                for file_path, change in self._changes.items()
+            ))
+
+            commit_sha = await self._client.commit_tree(list(entries), message, expected=self._expected or None)
+        except GithubException as e:
+            logger.error("github_batch_commit_failed", files=len(self._changes), status=e.status, error=str(e))
+            raise
+
+        files: Dict[str, Optional[Dict[str, str]]] = {}
+        for entry in entries:
+            path = self._paths[entry["path"]]
+            if "content" in entry:
+                files[path] = {"sha": git_blob_sha(entry["content"]), "url": self._client.html_url(path)}
+            elif entry["sha"] is not None:
+                files[path] = {
+                    "sha": entry["sha"],
+                    "url": f"https://github.com/{self._client.repo_name}/blob/{self._client.branch}/{entry['path']}",
+                }
+            else:
+                files[path] = None
 
-        # 3. 원본 삭제
-        self.delete_file(
-            path=old_path,
-            message=f"Moved to {new_path}",
-            sha=sha
-        )
+        logger.info("github_batch_committed", commit_sha=commit_sha, files=len(files))
 
-        return create_result
+        return {"commit_sha": commit_sha, "files": files}
 
 
 # 전역 클라이언트 인스턴스
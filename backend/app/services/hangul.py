@@ -0,0 +1,115 @@
+"""
+한글 자모 변환 - 초성 검색, 자모 단위 오타 보정
+
+- 초성: 저장 시점에 제목/태그의 초성 문자열(title_choseong, tags_choseong)을 만들어 두고,
+  검색어가 초성으로만 이루어져 있으면 그 컬럼에서 부분 일치로 찾습니다.
+  ("ㅇㄹ" → 엘론, "ㅅㅂㅎㄷ" → 실버홀드)
+  1~2자 초성은 trigram 인덱스로 찾을 수 없으므로 초성 n-gram을 page_ngrams에 함께 색인합니다.
+- 자모 분해: 음절 단위 trigram은 모음 하나만 틀려도 그 음절이 들어간 trigram이
+  모두 달라지므로, 자모로 풀어 쓴 제목(title_jamo)에서 유사도를 계산합니다.
+  ("실바홀드" → "ㅅㅣㄹㅂㅏㅎㅗㄹㄷㅡ"가 "ㅅㅣㄹㅂㅓㅎㅗㄹㄷㅡ"와 대부분 겹침)
+"""
+import re
+from collections import Counter
+from typing import Optional
+
+from app.services.ngrams import WORD_PATTERN, extract_ngrams
+
+# 완성형 한글 음절 범위와 초성 순서 (유니코드 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+SYLLABLE_FIRST = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+SYLLABLES_PER_CHOSEONG = 21 * 28
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+
+# 첫가끝 초성 자모(U+1100~U+1112) → 호환 자모 (입력기에 따라 이 형태로 들어옴)
+LEADING_JAMO = {chr(0x1100 + index): char for index, char in enumerate(CHOSEONG)}
+
+# 초성으로만 이루어진 검색어 (공백/문장부호 허용)
+CHOSEONG_QUERY_PATTERN = re.compile(rf"[{CHOSEONG}\s\W]+")
+
+
+def choseong(text: str) -> str:
+    """
+    글자별 초성 변환 (한글 음절 외의 글자는 소문자로 유지)
+
+    "엘론 실버스트라이드" → "ㅇㄹ ㅅㅂㅅㅌㄹㅇㄷ"
+    """
+    chars = []
+    for char in text.lower():
+        code = ord(char)
+        if SYLLABLE_FIRST <= code <= SYLLABLE_LAST:
+            chars.append(CHOSEONG[(code - SYLLABLE_FIRST) // SYLLABLES_PER_CHOSEONG])
+        else:
+            chars.append(LEADING_JAMO.get(char, char))
+    return "".join(chars)
+
+
+def decompose(text: str) -> str:
+    """
+    음절 → 호환 자모 나열 (한글 음절 외의 글자는 소문자로 유지)
+
+    받침과 초성을 같은 자모로 쓰므로 연음 오타("머거")도 원문("먹어")과 겹칩니다.
+    "엘론" → "ㅇㅔㄹㄹㅗㄴ"
+    """
+    chars = []
+    for char in text.lower():
+        code = ord(char) - SYLLABLE_FIRST
+        if 0 <= code <= SYLLABLE_LAST - SYLLABLE_FIRST:
+            chars.append(CHOSEONG[code // SYLLABLES_PER_CHOSEONG])
+            chars.append(JUNGSEONG[code % SYLLABLES_PER_CHOSEONG // 28])
+            chars.append(JONGSEONG[code % 28])
+        else:
+            chars.append(LEADING_JAMO.get(char, char))
+    return "".join(chars)
+
+
+def jamo_key(text: Optional[str]) -> Optional[str]:
+    """자모 검색 색인 값 (단어 구분은 유지, trigram이 단어 단위로 계산되므로)"""
+    if not text:
+        return None
+    return " ".join(decompose(word) for word in text.split()) or None
+
+
+def choseong_key(text: Optional[str]) -> Optional[str]:
+    """
+    초성 색인 값 (단어 문자만, 공백/문장부호 제거)
+
+    띄어쓰기 없이 입력해도 찾도록 붙여서 저장합니다. ("엘론 실버" → "ㅇㄹㅅㅂ")
+    """
+    if not text:
+        return None
+    return "".join(WORD_PATTERN.findall(choseong(text))) or None
+
+
+def tags_choseong(tags_text: Optional[str]) -> Optional[str]:
+    """태그 이름(tags_text) → 단어별 초성 색인 값 (단어 경계를 넘는 매칭 방지)"""
+    if not tags_text:
+        return None
+    return " ".join(filter(None, (choseong_key(word) for word in tags_text.split()))) or None
+
+
+def choseong_ngrams(key: Optional[str]) -> Counter:
+    """
+    초성 색인 값 → 초성으로만 이루어진 unigram/bigram 출현 횟수 (page_ngrams 색인용)
+
+    "ㅇㄹㅅㅂ" → {"ㅇ": 1, "ㄹ": 1, "ㅅ": 1, "ㅂ": 1, "ㅇㄹ": 1, "ㄹㅅ": 1, "ㅅㅂ": 1}
+    """
+    return Counter({
+        gram: count
+        for gram, count in extract_ngrams(key).items()
+        if all(char in CHOSEONG for char in gram)
+    })
+
+
+def choseong_query(query: str) -> Optional[str]:
+    """
+    초성 검색어 → 검색할 초성 문자열 (초성 검색어가 아니면 None)
+
+    "ㅅㅂ ㅎㄷ" → "ㅅㅂㅎㄷ"
+    """
+    converted = "".join(LEADING_JAMO.get(char, char) for char in query)
+    if not CHOSEONG_QUERY_PATTERN.fullmatch(converted):
+        return None
+    return choseong_key(converted)
@@ -0,0 +1,107 @@
+"""
+HTTP 조건부 요청 (ETag / Last-Modified) 유틸리티
+
+클라이언트가 이미 최신 버전을 갖고 있으면 본문 조회와 직렬화 없이
+304 Not Modified로 응답하기 위한 헬퍼입니다.
+"""
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional, Tuple
+
+from fastapi import Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.outbox import GitHubOutbox
+from app.models.page import Page
+
+# 공유 캐시 없이 매번 재검증 (304면 본문 전송 없음)
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 구성 요소로 strong ETag 생성"""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 (weak 비교)"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def format_http_date(value: datetime) -> str:
+    """datetime → HTTP-date (RFC 9110)"""
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def http_date_settled(value: datetime, now: Optional[datetime] = None) -> bool:
+    """
+    value가 속한 초가 이미 지났는지
+
+    HTTP-date는 초 단위이므로, 같은 초 안의 이후 변경과 구분할 수 없는
+    Last-Modified는 보내지 않습니다. (ETag로만 검증)
+    """
+    now = now or datetime.now(timezone.utc)
+    return value.replace(microsecond=0) + timedelta(seconds=1) <= now
+
+
+def is_not_modified(headers, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    조건부 요청 판정 (RFC 9110: If-None-Match가 있으면 If-Modified-Since는 무시)
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+    return not_modified_since(headers.get("if-modified-since"), last_modified)
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """If-Modified-Since 이후 변경이 없는지 (HTTP-date는 초 단위)"""
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified(headers: dict) -> Response:
+    """304 응답 (검증 헤더만 포함)"""
+    return Response(status_code=304, headers={**headers, "Cache-Control": CACHE_CONTROL})
+
+
+async def pages_version(
+    db: AsyncSession,
+    project_id: Optional[str] = None,
+    category: Optional[str] = None,
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    문서 목록 버전 (필터 범위의 max(updated_at), 마지막 하드 삭제 시각)
+
+    status와 무관하게 필터 범위의 max(updated_at)을 사용하므로 보관/복원도
+    반영되고, 행이 사라지는 하드 삭제는 outbox의 삭제 작업 시각으로 반영합니다.
+    두 값 모두 DB 정밀도(마이크로초) 그대로이므로 ETag 계산에 사용합니다.
+
+    Args:
+        project_id: 프로젝트 필터
+        category: 카테고리 필터
+    """
+    page_query = select(func.max(Page.updated_at))
+    if project_id:
+        page_query = page_query.where(Page.project_id == project_id)
+    if category:
+        page_query = page_query.where(Page.category == category)
+
+    deleted_query = select(func.max(GitHubOutbox.created_at)).where(GitHubOutbox.operation == "delete")
+
+    result = await db.execute(select(page_query.scalar_subquery(), deleted_query.scalar_subquery()))
+    updated, deleted = result.one()
+    return updated, deleted
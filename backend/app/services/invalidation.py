@@ -0,0 +1,213 @@
+"""
+캐시 무효화 버스 - PostgreSQL LISTEN/NOTIFY
+
+여러 uvicorn 워커가 각자 프로세스 내 캐시를 가지므로, 쓰기 트랜잭션이
+무효화 이벤트를 pg_notify로 함께 커밋하고 모든 워커의 리스너가 이를 받아
+자기 캐시를 지웁니다. NOTIFY는 커밋될 때만 전달되므로 롤백된 변경은
+전파되지 않습니다.
+"""
+import asyncio
+import json
+import uuid
+from collections import defaultdict
+from typing import Callable, Optional
+
+import asyncpg
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import structlog
+
+from app.core.config import settings
+from app.db.database import engine
+
+logger = structlog.get_logger()
+
+# NOTIFY 채널 이름
+CHANNEL = "xperion_invalidate"
+
+# 자기 자신이 보낸 이벤트는 after_commit에서 이미 처리했으므로 건너뜀
+WORKER_ID = uuid.uuid4().hex
+
+# NOTIFY payload 상한(8000 bytes)보다 여유 있게
+MAX_PAYLOAD_BYTES = 7000
+
+# 리스너 재연결 대기 시간 (초)
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+# 세션 info에 커밋 후 전파할 이벤트를 모아 두는 키
+_PENDING = "invalidation_events"
+
+# kind → 핸들러 목록 (각 캐시 모듈이 등록)
+_handlers: dict[str, list[Callable[[dict], None]]] = defaultdict(list)
+
+
+def on_invalidate(*kinds: str):
+    """
+    무효화 이벤트 핸들러 등록 데코레이터
+
+    핸들러는 이벤트 dict를 받습니다. {"all": True}이면 해당 종류의 캐시 전체를 지워야 합니다
+    (payload가 너무 크거나 리스너가 재연결되어 이벤트를 놓쳤을 수 있는 경우).
+    """
+    def decorator(handler: Callable[[dict], None]) -> Callable[[dict], None]:
+        for kind in kinds:
+            _handlers[kind].append(handler)
+        return handler
+    return decorator
+
+
+def dispatch(event_data: dict) -> None:
+    """로컬 핸들러 실행 (핸들러 하나의 실패가 다른 캐시 무효화를 막지 않도록)"""
+    for handler in _handlers.get(event_data["kind"], []):
+        try:
+            handler(event_data)
+        except Exception as e:
+            logger.error("invalidation_handler_failed", kind=event_data["kind"], error=str(e))
+
+
+def dispatch_all() -> None:
+    """모든 종류의 캐시 전체 무효화"""
+    for kind in list(_handlers):
+        dispatch({"kind": kind, "all": True})
+
+
+def emit(db: AsyncSession, kind: str, **data) -> None:
+    """
+    트랜잭션이 커밋되면 전파할 무효화 이벤트 등록
+
+    Args:
+        db: 데이터베이스 세션
+        kind: 이벤트 종류 (pages, tags, projects)
+        **data: 핸들러에 전달할 값 (JSON 직렬화 가능해야 함)
+    """
+    db.sync_session.info.setdefault(_PENDING, []).append({"kind": kind, **data})
+
+
+def encode_payload(events: list[dict]) -> str:
+    """
+    NOTIFY payload 생성
+
+    상한을 넘으면 종류별 전체 무효화 이벤트로 대체합니다.
+    """
+    payload = json.dumps({"w": WORKER_ID, "events": events}, ensure_ascii=False, default=str)
+    if len(payload.encode("utf-8")) <= MAX_PAYLOAD_BYTES:
+        return payload
+
+    kinds = sorted({event_data["kind"] for event_data in events})
+    return json.dumps({"w": WORKER_ID, "events": [{"kind": kind, "all": True} for kind in kinds]})
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_before_commit(session: Session) -> None:
+    # 같은 트랜잭션 안에서 NOTIFY → 커밋될 때만 다른 워커에 전달
+    events = session.info.get(_PENDING)
+    if events:
+        session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CHANNEL, "payload": encode_payload(events)}
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_after_commit(session: Session) -> None:
+    for event_data in session.info.pop(_PENDING, []):
+        dispatch(event_data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+def _listen_dsn() -> str:
+    """SQLAlchemy URL → asyncpg DSN"""
+    return engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class InvalidationListener:
+    """다른 워커가 보낸 무효화 이벤트를 받아 로컬 캐시에 반영하는 백그라운드 작업"""
+
+    def __init__(self, healthcheck_interval: float = settings.INVALIDATION_HEALTHCHECK_INTERVAL):
+        self.healthcheck_interval = healthcheck_interval
+        self._task: Optional[asyncio.Task] = None
+        # 현재 연결에서 LISTEN을 시작했는지 (재연결 대기 시간 초기화 기준)
+        self._listening = False
+
+    def start(self) -> None:
+        """리스너 시작 (앱 시작 시 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """리스너 종료 (앱 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("invalidation_payload_invalid", payload=payload[:200])
+            return
+
+        if message.get("w") == WORKER_ID:
+            return
+        for event_data in message.get("events", []):
+            dispatch(event_data)
+
+    async def _run(self) -> None:
+        delay = RECONNECT_DELAY
+        while True:
+            self._listening = False
+            error = None
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+
+            # LISTEN까지 성공했던 연결이 끊긴 것이면 정상 재연결이므로 기본 대기 시간부터
+            # (연결 자체가 계속 실패할 때만 대기 시간이 늘어남)
+            if self._listening:
+                delay = RECONNECT_DELAY
+            if error is not None:
+                logger.warning("invalidation_listener_disconnected", error=str(error), retry_in=delay)
+
+            # 연결이 끊긴 동안 놓친 이벤트가 있을 수 있음
+            dispatch_all()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _listen(self) -> None:
+        """연결 하나로 LISTEN 유지 (끊기면 반환 또는 예외)"""
+        connection = await asyncpg.connect(_listen_dsn())
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+
+        try:
+            await connection.add_listener(CHANNEL, self._on_notify)
+            self._listening = True
+            # LISTEN 이전에 커밋된 변경은 받지 못했으므로 초기화
+            dispatch_all()
+            logger.info("invalidation_listener_started", channel=CHANNEL)
+
+            while not closed.is_set():
+                try:
+                    await asyncio.wait_for(closed.wait(), timeout=self.healthcheck_interval)
+                except asyncio.TimeoutError:
+                    # 조용히 끊긴 연결(half-open) 감지
+                    await connection.execute("SELECT 1")
+        finally:
+            if not connection.is_closed():
+                await connection.close()
+
+
+# 전역 리스너 인스턴스
+invalidation_listener = InvalidationListener()
@@ -0,0 +1,117 @@
+"""
+Markdown 렌더링 - 본문 → 안전한 HTML (content_html)
+
+저장 시점과 백필 스크립트에서 한 번 렌더링해 두면 클라이언트가 조회할 때마다
+Markdown을 다시 렌더링할 필요가 없습니다. 결과는 본문 SHA 기준으로 캐시하고,
+큰 문서는 이벤트 루프를 막지 않도록 프로세스 풀에서 렌더링합니다.
+"""
+import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import markdown
+from markdown.extensions.toc import slugify_unicode
+import nh3
+
+from app.core.config import settings
+from app.services.cache import LRUCache
+
+# 렌더링 규칙이 바뀌면 올림 (ETag에 포함되어 클라이언트 캐시도 갱신)
+RENDER_VERSION = 1
+
+# 이보다 짧은 본문은 프로세스 간 전송 비용이 더 크므로 바로 렌더링
+INLINE_MAX_CHARS = 10_000
+
+MARKDOWN_EXTENSIONS = ["extra", "sane_lists", "toc"]
+MARKDOWN_EXTENSION_CONFIGS = {
+    # 한글 제목도 앵커 id로 유지 ("기본 정보" → "기본-정보")
+    "toc": {"slugify": slugify_unicode},
+}
+
+# 기본 허용 목록 + 제목 앵커 id, 링크/이미지 title
+ALLOWED_TAGS = set(nh3.ALLOWED_TAGS)
+ALLOWED_ATTRIBUTES = {tag: set(attrs) for tag, attrs in nh3.ALLOWED_ATTRIBUTES.items()}
+for heading in ("h1", "h2", "h3", "h4", "h5", "h6"):
+    ALLOWED_ATTRIBUTES.setdefault(heading, set()).add("id")
+ALLOWED_ATTRIBUTES["a"] = ALLOWED_ATTRIBUTES.get("a", set()) | {"title", "id"}
+ALLOWED_ATTRIBUTES["img"] = ALLOWED_ATTRIBUTES.get("img", set()) | {"title"}
+ALLOWED_ATTRIBUTES["code"] = {"class"}
+
+_markdown: Optional[markdown.Markdown] = None
+_executor: Optional[ProcessPoolExecutor] = None
+
+# 본문 SHA → HTML (내용 기준 키이므로 무효화 불필요)
+render_cache = LRUCache(maxsize=settings.RENDER_CACHE_SIZE, ttl=settings.RENDER_CACHE_TTL)
+
+
+def _keep_attribute(element: str, attribute: str, value: str) -> Optional[str]:
+    # 코드 블록은 언어 표시 class만 허용
+    if attribute == "class":
+        return value if element == "code" and value.startswith("language-") else None
+    return value
+
+
+def render_markdown(content: str) -> str:
+    """
+    Markdown → 정제된 HTML (동기, 프로세스 풀에서도 실행)
+
+    제목에는 앵커용 id가 붙고, 스크립트/이벤트 핸들러/javascript: 링크는 제거됩니다.
+    """
+    global _markdown
+    if _markdown is None:
+        _markdown = markdown.Markdown(
+            extensions=MARKDOWN_EXTENSIONS,
+            extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+        )
+    html = _markdown.reset().convert(content)
+
+    return nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        attribute_filter=_keep_attribute,
+        link_rel="noopener noreferrer",
+    )
+
+
+def content_sha(content: str) -> str:
+    """렌더링 캐시 키"""
+    return hashlib.sha256(f"{RENDER_VERSION}:{content}".encode("utf-8")).hexdigest()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.RENDER_WORKERS)
+    return _executor
+
+
+async def render_html(content: str) -> str:
+    """
+    Markdown → HTML (캐시 + 프로세스 풀)
+
+    Args:
+        content: Markdown 본문 (frontmatter 제외)
+    """
+    key = content_sha(content)
+    cached = render_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if len(content) <= INLINE_MAX_CHARS:
+        html = render_markdown(content)
+    else:
+        loop = asyncio.get_running_loop()
+        html = await loop.run_in_executor(_get_executor(), render_markdown, content)
+
+    render_cache.set(key, html)
+    return html
+
+
+def shutdown_renderer() -> None:
+    """프로세스 풀 종료 (앱 종료 시 호출)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,50 @@
+"""
+짧은 검색어용 n-gram 추출
+
+한글 1~2글자 검색어는 trigram 인덱스로 찾을 수 없으므로, 저장 시점에
+unigram/bigram을 뽑아 page_ngrams에 색인합니다.
+"""
+import re
+from collections import Counter
+from typing import Optional
+
+# 단어 단위 (공백/문장부호를 넘는 n-gram은 만들지 않음)
+WORD_PATTERN = re.compile(r"\w+")
+
+# n-gram 색인 대상 최대 길이
+MAX_GRAM = 2
+
+
+def _unigram_indexed(char: str) -> bool:
+    # 영문/숫자 한 글자는 검색어로 의미가 없으므로 한글 등 비ASCII만 색인
+    return not char.isascii()
+
+
+def extract_ngrams(text: Optional[str]) -> Counter:
+    """
+    텍스트의 unigram(비ASCII) + bigram 출현 횟수
+
+    "엘프 팔라딘" → {"엘": 1, "프": 1, "엘프": 1, "팔": 1, "라": 1, "딘": 1, "팔라": 1, "라딘": 1}
+    """
+    grams: Counter = Counter()
+    if not text:
+        return grams
+
+    for word in WORD_PATTERN.findall(text.lower()):
+        grams.update(char for char in word if _unigram_indexed(char))
+        grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def query_gram(query: str) -> Optional[str]:
+    """
+    짧은 검색어 → 조회할 n-gram (색인되지 않는 검색어면 None)
+
+    공백/문장부호는 무시합니다 ("엘 프" → "엘프").
+    """
+    normalized = "".join(WORD_PATTERN.findall(query.lower()))
+    if not normalized or len(normalized) > MAX_GRAM:
+        return None
+    if len(normalized) == 1 and not _unigram_indexed(normalized):
+        return None
+    return normalized
@@ -0,0 +1,472 @@
+"""
+GitHub Outbox - 문서 변경의 비동기 GitHub 반영 (write-behind)
+
+문서 저장은 PostgreSQL 커밋으로 끝나고, GitHub 커밋은 대기열(github_outbox)에
+쌓였다가 백그라운드 디스패처가 순서대로 반영합니다. 실패한 작업은
+지수 백오프로 재시도합니다.
+
+GitHub 파일이 작업의 base_sha와 다르면(작업 등록 후 GitHub에서 직접 수정) 덮어쓰지
+않고 conflict로 기록합니다. 재시도 횟수를 넘긴 작업은 failed가 됩니다. conflict/failed
+작업은 재시도하지 않으며, 같은 경로의 이후 작업도 해결될 때까지 대기합니다.
+(GET /api/sync/conflicts, POST /api/sync/conflicts/{id}/resolve)
+
+반영 완료(done)와 해결 중 버린(discarded) 작업은 OUTBOX_RETENTION_DAYS가 지나면
+디스패처가 주기적으로 삭제합니다.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from github import GithubException
+from sqlalchemy import select, update, text
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal, engine
+from app.models.outbox import GitHubOutbox
+from app.models.page import Page
+from app.services.cache import mark_pages_changed
+from app.services.github_client import conflict_error, git_blob_sha, github_client, is_conflict
+
+logger = structlog.get_logger()
+
+# 워커 간 디스패처 중복 실행 방지용 advisory lock 키
+OUTBOX_LOCK_KEY = 7_302_001
+
+# 재시도 간격 상한 (초)
+MAX_BACKOFF_SECONDS = 300
+
+# 완료 작업 정리 주기 (초)
+PRUNE_INTERVAL_SECONDS = 3600
+
+# 해결될 때까지 같은 경로의 이후 작업을 막는 상태
+HELD_STATUSES = ("conflict", "failed")
+
+
+def enqueue(
+    db: AsyncSession,
+    operation: str,
+    path: str,
+    message: str,
+    page_id: Optional[int] = None,
+    content: Optional[str] = None,
+    new_path: Optional[str] = None,
+    base_sha: Optional[str] = None,
+    author: Optional[str] = None,
+) -> GitHubOutbox:
+    """
+    GitHub 반영 작업을 대기열에 추가합니다.
+
+    호출한 트랜잭션과 함께 커밋되므로 DB 변경과 작업 등록이 원자적입니다.
+
+    Args:
+        db: 데이터베이스 세션
+        operation: upsert, delete, move
+        path: 문서 slug
+        message: 커밋 메시지
+        page_id: 대상 문서 ID
+        content: upsert할 Markdown (frontmatter 포함)
+        new_path: move 대상 slug
+        base_sha: 작업 직전 GitHub 파일 SHA
+        author: 작성자 이름
+    """
+    entry = GitHubOutbox(
+        page_id=page_id,
+        operation=operation,
+        path=path,
+        new_path=new_path,
+        content=content,
+        base_sha=base_sha,
+        message=message,
+        author=author,
+    )
+    db.add(entry)
+    return entry
+
+
+def rebase(entry: GitHubOutbox, current_sha: Optional[str]) -> None:
+    """
+    보류된 작업을 GitHub의 현재 파일 기준으로 다시 대기열에 넣습니다. ('mine' 해결)
+
+    base_sha를 현재 SHA로 바꾸므로 다음 반영은 GitHub의 수정을 덮어씁니다.
+    파일이 없으면(current_sha=None) upsert는 새로 생성합니다.
+    """
+    entry.base_sha = current_sha
+    entry.status = "pending"
+    entry.attempts = 0
+    entry.last_error = None
+    entry.next_attempt_at = datetime.now(timezone.utc)
+
+
+async def conflicted_entry(db: AsyncSession, path: str) -> Optional[GitHubOutbox]:
+    """경로에 GitHub 버전 충돌로 보류된 작업 (가장 오래된 것)"""
+    result = await db.execute(
+        select(GitHubOutbox)
+        .where(
+            GitHubOutbox.status == "conflict",
+            (GitHubOutbox.path == path) | (GitHubOutbox.new_path == path),
+        )
+        .order_by(GitHubOutbox.id)
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+def _entry_paths(entry: GitHubOutbox) -> set[str]:
+    """작업이 건드리는 문서 경로"""
+    return {entry.path, entry.new_path} - {None}
+
+
+class OutboxDispatcher:
+    """github_outbox 대기열을 GitHub에 반영하는 백그라운드 작업"""
+
+    def __init__(self, poll_interval: float = settings.OUTBOX_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._last_pruned: Optional[float] = None
+
+    def start(self) -> None:
+        """디스패처 루프 시작 (앱 시작 시 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """디스패처 루프 종료 (앱 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self) -> None:
+        """새 작업이 커밋되었음을 알림 (폴링 주기를 기다리지 않고 즉시 처리)"""
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.dispatch_pending()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("outbox_dispatch_failed", error=str(e))
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def dispatch_pending(self) -> int:
+        """
+        대기 중인 작업을 id 순서대로 GitHub에 반영합니다.
+
+        같은 경로에 앞선 작업이 재시도 대기 중이거나 conflict/failed로 보류되어 있으면
+        뒤 작업도 기다립니다. (앞선 변경이 빠진 base_sha로 반영되지 않도록)
+
+        Returns:
+            처리 완료된 작업 수
+        """
+        # advisory lock은 세션 단위이므로 전용 커넥션에서 잡고 놓습니다.
+        async with engine.connect() as lock_conn:
+            locked = (await lock_conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": OUTBOX_LOCK_KEY}
+            )).scalar()
+            if not locked:
+                return 0
+
+            try:
+                processed = await self._dispatch_locked()
+                await self._prune_if_due()
+                return processed
+            finally:
+                await lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": OUTBOX_LOCK_KEY}
+                )
+
+    async def _prune_if_due(self) -> int:
+        """
+        보관 기간이 지난 완료 작업 삭제 (PRUNE_INTERVAL_SECONDS마다 한 번)
+
+        가장 최근 삭제 작업은 남겨 둡니다. (목록 Last-Modified의 하드 삭제 시각)
+        failed/conflict 작업은 해결이 필요하므로 삭제하지 않습니다.
+
+        Returns:
+            삭제한 작업 수
+        """
+        now = time.monotonic()
+        if self._last_pruned is not None and now - self._last_pruned < PRUNE_INTERVAL_SECONDS:
+            return 0
+        self._last_pruned = now
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                text("""
+                    DELETE FROM github_outbox
+                    WHERE status IN ('done', 'discarded')
+                      AND processed_at < :cutoff
+                      AND id IS DISTINCT FROM (
+                          SELECT max(id) FROM github_outbox WHERE operation = 'delete'
+                      )
+                """),
+                {"cutoff": cutoff}
+            )
+            await db.commit()
+
+        if result.rowcount:
+            logger.info("outbox_pruned", deleted=result.rowcount, cutoff=cutoff.isoformat())
+        return result.rowcount
+
+    async def _dispatch_locked(self) -> int:
+        processed = 0
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(GitHubOutbox)
+                .where(GitHubOutbox.status == "pending")
+                .order_by(GitHubOutbox.id)
+                .limit(settings.OUTBOX_BATCH_SIZE)
+            )
+            entries = result.scalars().all()
+
+            # 보류(conflict/failed)가 해결되지 않은 경로의 작업은 대기
+            held = await db.execute(
+                select(GitHubOutbox.path, GitHubOutbox.new_path).where(GitHubOutbox.status.in_(HELD_STATUSES))
+            )
+            now = datetime.now(timezone.utc)
+            blocked_paths: set[str] = set()
+            for path, new_path in held.all():
+                blocked_paths |= {path, new_path} - {None}
+            group: list[GitHubOutbox] = []
+
+            for entry in entries:
+                paths = _entry_paths(entry)
+
+                # 순서 보장: 앞선 작업이 대기 중인 경로는 건너뜀
+                if paths & blocked_paths or entry.next_attempt_at > now:
+                    blocked_paths |= paths
+                    continue
+
+                group.append(entry)
+
+            # 준비된 작업 전체를 하나의 커밋으로 반영
+            processed += await self._flush(db, group, blocked_paths)
+
+        if processed:
+            logger.info("outbox_dispatched", processed=processed)
+
+        return processed
+
+    async def _flush(self, db: AsyncSession, group: list[GitHubOutbox], blocked_paths: set[str]) -> int:
+        """
+        작업 묶음을 GitHub에 반영하고 결과를 기록합니다.
+
+        묶음 커밋이 실패하면 작업을 하나씩 다시 시도해 문제 작업만 재시도 대기로 돌립니다.
+
+        Returns:
+            처리 완료된 작업 수
+        """
+        if not group:
+            return 0
+
+        try:
+            await self._push(db, group)
+        except Exception as e:
+            if len(group) > 1:
+                logger.warning("outbox_batch_failed", entries=len(group), error=str(e))
+                processed = 0
+                for entry in group:
+                    if not _entry_paths(entry) & blocked_paths:
+                        processed += await self._flush(db, [entry], blocked_paths)
+                return processed
+
+            self._record_failure(group[0], e, blocked_paths)
+            await db.commit()
+            return 0
+
+        processed_at = datetime.now(timezone.utc)
+        for entry in group:
+            entry.status = "done"
+            entry.last_error = None
+            entry.processed_at = processed_at
+
+        # GitHub 반영 결과를 즉시 기록
+        await db.commit()
+        return len(group)
+
+    def _record_failure(self, entry: GitHubOutbox, error: Exception, blocked_paths: set[str]) -> None:
+        """
+        실패 횟수 기록 후 재시도 예약 (최대 횟수 초과 시 failed, GitHub 버전 충돌은 conflict)
+
+        어느 경우든 같은 경로의 이후 작업은 이 작업이 반영되거나 해결될 때까지 막습니다.
+        """
+        entry.attempts += 1
+        entry.last_error = str(error)
+        if is_conflict(error):
+            entry.status = "conflict"
+            blocked_paths |= _entry_paths(entry)
+            logger.error("outbox_entry_conflict", id=entry.id, path=entry.path,
+                         base_sha=entry.base_sha, conflicts=error.data["conflicts"])
+        elif entry.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            entry.status = "failed"
+            blocked_paths |= _entry_paths(entry)
+            logger.error("outbox_entry_failed", id=entry.id, path=entry.path,
+                         attempts=entry.attempts, error=str(error))
+        else:
+            delay = min(2 ** entry.attempts, MAX_BACKOFF_SECONDS)
+            entry.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+            blocked_paths |= _entry_paths(entry)
+            logger.warning("outbox_entry_retry", id=entry.id, path=entry.path,
+                           attempts=entry.attempts, retry_in=delay, error=str(error))
+
+    async def _current_sha(self, path: str, known_sha: Optional[str]) -> Optional[str]:
+        """알고 있는 SHA가 없으면 GitHub에서 현재 SHA 조회"""
+        if known_sha:
+            return known_sha
+        github_file = await github_client.get_file(path)
+        return github_file["sha"] if github_file else None
+
+    async def _push(self, db: AsyncSession, group: list[GitHubOutbox]) -> None:
+        """
+        작업 묶음을 GitHub에 반영하고 문서의 동기화 메타데이터를 갱신
+
+        작업이 하나면 Contents API로, 여러 개면 Git Data API로 한 커밋에 반영합니다.
+        배치는 각 경로가 첫 작업의 base_sha 그대로일 때만 커밋되며, 하나라도 다르면
+        실패해 작업별로 다시 시도됩니다. (_flush)
+        """
+        if len(group) == 1:
+            await self._push_single(db, group[0])
+            return
+
+        batch = github_client.batch()
+        for entry in group:
+            if entry.operation == "upsert":
+                batch.expect(entry.path, entry.base_sha)
+                batch.put(entry.path, entry.content)
+            elif entry.operation == "move":
+                batch.expect(entry.path, entry.base_sha)
+                batch.move(entry.path, entry.new_path, sha=entry.base_sha)
+            else:
+                if entry.base_sha:
+                    batch.expect(entry.path, entry.base_sha)
+                batch.delete(entry.path)
+
+        message = f"Update {len(group)} pages\n\n" + "\n".join(f"- {entry.message}" for entry in group)
+        result = await batch.commit(message)
+
+        for entry in group:
+            if entry.operation == "delete":
+                continue
+            path = entry.new_path if entry.operation == "move" else entry.path
+            file_result = result["files"].get(path)
+            if file_result:
+                await self._mark_synced(db, entry.page_id, path, file_result)
+
+    async def _push_single(self, db: AsyncSession, entry: GitHubOutbox) -> None:
+        """작업 하나를 GitHub에 반영"""
+        if entry.operation == "upsert":
+            result = await self._push_upsert(entry)
+            await self._mark_synced(db, entry.page_id, entry.path, result)
+
+        elif entry.operation == "move":
+            # 단일 트리 커밋으로 이동 (원래 경로가 base_sha일 때만, SHA가 없으면 move_file이 조회)
+            try:
+                result = await github_client.move_file(
+                    old_path=entry.path,
+                    new_path=entry.new_path,
+                    message=entry.message,
+                    sha=entry.base_sha
+                )
+            except GithubException as e:
+                if not is_conflict(e):
+                    raise
+                # 이전 시도가 반영되었지만 결과를 기록하지 못한 경우
+                moved = await github_client.get_file(entry.new_path)
+                if not moved or moved["sha"] != entry.base_sha or await github_client.get_file(entry.path):
+                    raise
+                result = moved
+            await self._mark_synced(db, entry.page_id, entry.new_path, result)
+
+        elif entry.operation == "delete":
+            sha = await self._current_sha(entry.path, entry.base_sha)
+            if sha is None:
+                # 이미 GitHub에 없는 파일
+                return
+            try:
+                await github_client.delete_file(path=entry.path, message=entry.message, sha=sha)
+            except GithubException as e:
+                if e.status not in (409, 422):
+                    raise
+                current = await self._current_sha(entry.path, None)
+                if current is None:
+                    return
+                # GitHub에서 수정된 파일은 지우지 않음
+                if entry.base_sha and current != entry.base_sha:
+                    raise conflict_error({entry.path: current}) from e
+                await github_client.delete_file(path=entry.path, message=entry.message, sha=current)
+
+    async def _push_upsert(self, entry: GitHubOutbox) -> dict:
+        """
+        Markdown 생성/수정 반영
+
+        GitHub 파일이 base_sha(새 문서면 파일 없음)와 다르면 GitHub에서 직접 수정된
+        것이므로 덮어쓰지 않고 conflict_error를 일으킵니다. 이미 같은 내용이면
+        (이전 시도가 반영되었지만 결과를 기록하지 못함) 성공으로 처리합니다.
+        """
+        try:
+            if entry.base_sha:
+                return await github_client.update_file(
+                    path=entry.path,
+                    content=entry.content,
+                    message=entry.message,
+                    sha=entry.base_sha
+                )
+            return await github_client.create_file(
+                path=entry.path,
+                content=entry.content,
+                message=entry.message
+            )
+        except GithubException as e:
+            if e.status not in (409, 422):
+                raise
+            error = e
+
+        current = await self._current_sha(entry.path, None)
+        if current == git_blob_sha(entry.content):
+            return {"sha": current, "url": github_client.html_url(entry.path)}
+        if current == entry.base_sha:
+            # 버전은 그대로인데 거부됨 (일시적 오류), 재시도 대기
+            raise error
+        raise conflict_error({entry.path: current}) from error
+
+    async def _mark_synced(self, db: AsyncSession, page_id: Optional[int], path: str, result: dict) -> None:
+        """
+        GitHub 반영 결과를 문서에 기록 (updated_at은 유지)
+
+        github_sha는 저장 시점에 미리 계산해 두므로, 반영된 SHA가 문서의
+        최신 SHA와 같을 때만 동기화 완료로 기록합니다.
+        """
+        if page_id is None:
+            return
+
+        await db.execute(
+            update(Page)
+            .where(Page.id == page_id, Page.slug == path, Page.github_sha == result["sha"])
+            .values(
+                github_url=result["url"],
+                last_synced_at=datetime.now(timezone.utc),
+                updated_at=Page.updated_at,
+            )
+        )
+        # 문서 상세의 github_url/last_synced_at이 바뀜
+        mark_pages_changed(db, [page_id])
+
+
+# 전역 디스패처 인스턴스
+outbox_dispatcher = OutboxDispatcher()
@@ -0,0 +1,122 @@
+"""
+문서 색인 - 저장 시점에 본문에서 파생 데이터 계산
+
+create/update와 백필 스크립트(scripts/reindex_pages.py)가 같은 함수를 사용합니다.
+"""
+from typing import Any, Optional
+
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.page import Page
+from app.models.page_ngram import PageNgram
+from app.services.hangul import choseong_key, choseong_ngrams, jamo_key, tags_choseong
+from app.services.markdown_render import render_html
+from app.services.ngrams import extract_ngrams
+
+
+async def build_index(page: Page) -> dict[str, Any]:
+    """
+    문서의 파생 컬럼 값 계산 (본문이 로드되어 있어야 함)
+
+    - content_html: 정제된 HTML (제목 앵커 포함)
+    - title_choseong, tags_choseong: 초성 검색용 문자열
+    - title_jamo: 자모 단위 오타 보정용 문자열
+    """
+    return {
+        "content_html": await render_html(page.content),
+        "title_choseong": choseong_key(page.title),
+        "tags_choseong": tags_choseong(page.tags_text),
+        "title_jamo": jamo_key(page.title),
+    }
+
+
+async def replace_ngrams(
+    db: AsyncSession, page_id: int, title: str, content: str, tags_choseong: Optional[str]
+) -> None:
+    """
+    문서의 n-gram 색인(page_ngrams) 교체
+
+    행 수와 무관하게 DELETE 1회 + unnest INSERT 1회로 처리합니다.
+    """
+    await replace_ngrams_many(db, [(page_id, title, content, tags_choseong)])
+
+
+async def replace_ngrams_many(db: AsyncSession, docs: list[tuple[int, str, str, Optional[str]]]) -> None:
+    """
+    여러 문서의 n-gram 색인을 한 번에 교체 (docs: (page_id, title, content, tags_choseong) 목록)
+
+    제목/태그 초성의 n-gram도 같은 행에 기록합니다. (1~2자 초성 검색용)
+    문서 수와 무관하게 DELETE 1회 + unnest INSERT 1회로 처리합니다.
+    """
+    if not docs:
+        return
+
+    page_ids: list[int] = []
+    grams: list[str] = []
+    title_freqs: list[int] = []
+    content_freqs: list[int] = []
+    title_choseong_freqs: list[int] = []
+    tags_choseong_freqs: list[int] = []
+    for page_id, title, content, tags_choseong_key in docs:
+        title_grams = extract_ngrams(title)
+        content_grams = extract_ngrams(content)
+        title_choseong_grams = choseong_ngrams(choseong_key(title))
+        tags_choseong_grams = choseong_ngrams(tags_choseong_key)
+        for gram in sorted(
+            title_grams.keys() | content_grams.keys() | title_choseong_grams.keys() | tags_choseong_grams.keys()
+        ):
+            page_ids.append(page_id)
+            grams.append(gram)
+            title_freqs.append(title_grams.get(gram, 0))
+            content_freqs.append(content_grams.get(gram, 0))
+            title_choseong_freqs.append(title_choseong_grams.get(gram, 0))
+            tags_choseong_freqs.append(tags_choseong_grams.get(gram, 0))
+
+    await db.execute(delete(PageNgram).where(PageNgram.page_id.in_([doc[0] for doc in docs])))
+    if not grams:
+        return
+
+    await db.execute(
+        text("""
+            INSERT INTO page_ngrams (gram, page_id, title_freq, content_freq, title_choseong_freq, tags_choseong_freq)
+            SELECT g.gram, g.page_id, g.title_freq, g.content_freq, g.title_choseong_freq, g.tags_choseong_freq
+            FROM unnest(
+                CAST(:grams AS varchar[]),
+                CAST(:page_ids AS integer[]),
+                CAST(:title_freqs AS integer[]),
+                CAST(:content_freqs AS integer[]),
+                CAST(:title_choseong_freqs AS integer[]),
+                CAST(:tags_choseong_freqs AS integer[])
+            ) AS g(gram, page_id, title_freq, content_freq, title_choseong_freq, tags_choseong_freq)
+        """),
+        {
+            "grams": grams,
+            "page_ids": page_ids,
+            "title_freqs": title_freqs,
+            "content_freqs": content_freqs,
+            "title_choseong_freqs": title_choseong_freqs,
+            "tags_choseong_freqs": tags_choseong_freqs,
+        }
+    )
+
+
+async def index_page(db: AsyncSession, page: Page) -> None:
+    """
+    파생 컬럼을 계산해 문서 객체에 반영하고 n-gram 색인 교체
+
+    호출한 트랜잭션과 함께 저장됩니다. (page.id가 있어야 하므로 flush 이후 호출)
+    """
+    await index_pages(db, [page])
+
+
+async def index_pages(db: AsyncSession, pages: list[Page]) -> None:
+    """
+    여러 문서의 파생 컬럼을 계산하고 n-gram 색인을 한 번에 교체 (동기화 배치용)
+    """
+    for page in pages:
+        for column, value in (await build_index(page)).items():
+            setattr(page, column, value)
+    await replace_ngrams_many(
+        db, [(page.id, page.title, page.content, page.tags_choseong) for page in pages]
+    )
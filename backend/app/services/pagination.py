@@ -0,0 +1,122 @@
+"""
+Keyset(커서) 페이지네이션 유틸리티
+
+OFFSET 대신 (정렬 컬럼, id) 기준 위치로 다음 페이지를 조회하므로
+몇 번째 페이지든 인덱스 탐색 비용이 같습니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import DateTime, Integer, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def encode_cursor(sort: str, order: str, value: Any, row_id: int) -> str:
+    """
+    마지막 행의 정렬 키를 불투명 커서 문자열로 인코딩
+
+    Args:
+        sort: 정렬 기준 이름
+        order: asc / desc
+        value: 마지막 행의 정렬 컬럼 값
+        row_id: 마지막 행의 id
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort, "o": order, "v": value, "id": row_id}, ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, order: str, column) -> Tuple[Any, int]:
+    """
+    커서 문자열을 (정렬 컬럼 값, id)로 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 다른 정렬 조건으로 만든 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value, row_id = payload["v"], payload["id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("잘못된 커서입니다") from e
+
+    if payload.get("s") != sort or payload.get("o") != order:
+        raise ValueError("정렬 조건이 커서와 다릅니다")
+
+    # 변조된 커서의 값이 SQL까지 가지 않도록 정렬 컬럼 타입 확인
+    if not _is_int4(row_id):
+        raise ValueError("잘못된 커서입니다")
+    if isinstance(column.type, DateTime):
+        if not isinstance(value, str):
+            raise ValueError("잘못된 커서입니다")
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError as e:
+            raise ValueError("잘못된 커서입니다") from e
+    elif isinstance(column.type, Integer):
+        if not _is_int4(value):
+            raise ValueError("잘못된 커서입니다")
+    elif not isinstance(value, str):
+        raise ValueError("잘못된 커서입니다")
+
+    return value, row_id
+
+
+def _is_int4(value: Any) -> bool:
+    """PostgreSQL integer 범위의 정수인지 (JSON true/false 제외)"""
+    return isinstance(value, int) and not isinstance(value, bool) and -2**31 <= value < 2**31
+
+
+def apply_keyset(query: Select, column, id_column, order: str, after: Optional[Tuple[Any, int]]) -> Select:
+    """
+    (정렬 컬럼, id) 순서 정렬과 커서 이후 조건을 쿼리에 적용
+
+    Args:
+        query: 기본 SELECT
+        column: 정렬 컬럼
+        id_column: 동률 처리용 고유 컬럼
+        order: asc / desc
+        after: decode_cursor 결과 (첫 페이지면 None)
+    """
+    if order == "desc":
+        query = query.order_by(column.desc(), id_column.desc())
+        if after is not None:
+            query = query.where(tuple_(column, id_column) < tuple_(*after))
+    else:
+        query = query.order_by(column.asc(), id_column.asc())
+        if after is not None:
+            query = query.where(tuple_(column, id_column) > tuple_(*after))
+    return query
+
+
+async def count_rows(db: AsyncSession, query: Select, mode: str) -> Optional[int]:
+    """
+    목록 전체 개수 조회
+
+    Args:
+        query: 정렬/페이지네이션을 적용하기 전의 SELECT
+        mode: exact (COUNT), estimated (플래너 통계), none (생략)
+    """
+    if mode == "none":
+        return None
+
+    if mode == "estimated":
+        # EXPLAIN은 실행 없이 플래너 추정 행 수만 계산
+        # 필터 값은 SQL 문자열에 넣지 않고 드라이버 파라미터로 전달
+        compiled = query.compile(dialect=db.get_bind().dialect)
+        params = compiled.params
+        if compiled.positiontup is not None:
+            params = tuple(params[name] for name in compiled.positiontup)
+        connection = await db.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    result = await db.execute(count_query)
+    return result.scalar_one()
@@ -0,0 +1,75 @@
+"""
+검색 결과 캐시 - 정규화된 검색어 + 콘텐츠 generation
+
+같은 검색(캐릭터/지역 이름)이 반복되므로 결과를 캐시합니다. 키에는 필터와
+함께 콘텐츠 generation이 들어가며, 문서가 바뀌면 generation이 올라가
+이전 키는 다시 쓰이지 않습니다 (수정 직후에도 오래된 결과를 주지 않음).
+"""
+import unicodedata
+from collections import defaultdict
+from typing import Hashable, Optional
+
+from app.core.config import settings
+from app.services.cache import LRUCache
+from app.services.invalidation import on_invalidate
+
+# 검색어 → (mode, results, facets)
+search_cache = LRUCache(maxsize=settings.SEARCH_CACHE_SIZE, ttl=settings.SEARCH_CACHE_TTL)
+
+# 콘텐츠 generation
+# - ALL: 모든 쓰기마다 증가 (프로젝트 필터 없는 검색)
+# - 프로젝트 ID: 해당 프로젝트 문서가 바뀔 때 증가
+# - UNSCOPED: 어느 프로젝트가 바뀌었는지 모를 때 증가 (모든 프로젝트 검색 무효화)
+ALL = "*"
+UNSCOPED = "?"
+_generations: defaultdict[str, int] = defaultdict(int)
+
+
+def normalize_query(query: str) -> str:
+    """검색어 정규화 (NFC + casefold + 공백 정리) - 캐시 키와 실제 검색에 같이 사용"""
+    return " ".join(unicodedata.normalize("NFC", query).casefold().split())
+
+
+def generation(project_id: Optional[str]) -> tuple[int, int]:
+    """검색 범위의 현재 generation"""
+    if project_id:
+        return _generations[project_id], _generations[UNSCOPED]
+    return _generations[ALL], 0
+
+
+def cache_key(query: str, project_id: Optional[str], *options: Hashable) -> tuple:
+    """정규화된 검색어 + 필터/옵션 + generation"""
+    return (query, project_id, *options, generation(project_id))
+
+
+def bump(project_ids: Optional[list] = None) -> None:
+    """
+    콘텐츠 generation 증가
+
+    Args:
+        project_ids: 바뀐 문서의 프로젝트 (None이면 범위를 모름)
+    """
+    _generations[ALL] += 1
+    if project_ids is None:
+        _generations[UNSCOPED] += 1
+        return
+    for project_id in set(project_ids):
+        if project_id:
+            _generations[project_id] += 1
+
+
+@on_invalidate("pages")
+def _on_pages_changed(event_data: dict) -> None:
+    # 검색 결과에 영향이 있는 변경만 projects를 함께 보냄 (GitHub 동기화 기록 등은 제외)
+    if event_data.get("all"):
+        bump()
+    elif "projects" in event_data:
+        bump(event_data["projects"])
+
+
+@on_invalidate("projects")
+def _on_project_changed(event_data: dict) -> None:
+    if event_data.get("all"):
+        bump()
+    elif event_data.get("deleted"):
+        bump([event_data["id"]])
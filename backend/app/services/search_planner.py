@@ -0,0 +1,123 @@
+"""
+검색 실행 계획 - 검색어 형태에 따라 검색 방식 선택
+
+검색 방식마다 잘 맞는 검색어가 다릅니다.
+- short: 1~2글자 (page_ngrams 색인, trigram으로는 찾을 수 없음)
+  색인하지 않는 영문/숫자 한 글자는 substring으로 찾음
+- fulltext: 단어/접두사 일치 (가중치 정렬, 조사가 붙은 한글 단어도 매칭)
+- substring: 단어 중간 일치 (ILIKE + trigram 인덱스). 띄어쓰기 없는 한글 합성어
+  ("하이드워프"에서 "드워프")를 찾지만, 후보 문서마다 본문을 다시 검사하므로
+  후보가 적을 때만 사용
+- trigram: 제목 오타 보정 (결과가 없을 때 마지막 수단)
+- choseong: 초성으로만 입력한 검색어 ("ㅇㄹ" → 엘론, title_choseong/tags_choseong)
+
+계획은 시도할 방식의 순서이며, 앞 방식에서 결과가 나오면 중단합니다.
+"""
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.services.hangul import choseong_query
+from app.services.ngrams import WORD_PATTERN, query_gram
+
+HANGUL_PATTERN = re.compile(r"[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3]")
+LATIN_PATTERN = re.compile(r"[a-z]")
+
+# 이보다 짧은 검색어는 n-gram 색인 (ngrams.MAX_GRAM)
+SHORT_QUERY_MAX_LENGTH = 2
+
+
+def query_script(query: str) -> str:
+    """검색어 문자 종류 (hangul, latin, mixed, other)"""
+    has_hangul = bool(HANGUL_PATTERN.search(query))
+    has_latin = bool(LATIN_PATTERN.search(query.lower()))
+    if has_hangul and has_latin:
+        return "mixed"
+    if has_hangul:
+        return "hangul"
+    if has_latin:
+        return "latin"
+    return "other"
+
+
+def query_words(query: str) -> List[str]:
+    """검색어 단어 목록 (문장부호 제외, 소문자)"""
+    return WORD_PATTERN.findall(query.lower())
+
+
+def needs_estimate(query: str) -> bool:
+    """substring 포함 여부를 후보 수로 판단해야 하는 검색어인지 (한글 단어 하나, 3글자 이상)"""
+    words = query_words(query)
+    return (
+        len(query) > SHORT_QUERY_MAX_LENGTH
+        and len(words) == 1
+        and query_script(query) == "hangul"
+        and not choseong_query(query)
+    )
+
+
+def choose_engines(query: str, candidates: Optional[int] = None) -> Tuple[List[str], str]:
+    """
+    검색 방식 순서 결정
+
+    Args:
+        query: 정규화된 검색어
+        candidates: n-gram 색인 기준 후보 문서 수 상한 (needs_estimate일 때만)
+
+    Returns:
+        (시도할 방식 순서, 선택 이유)
+    """
+    if choseong_query(query):
+        # 초성은 다른 방식으로는 찾을 수 없음
+        return ["choseong"], "choseong"
+    if len(query) <= SHORT_QUERY_MAX_LENGTH:
+        if query_gram(query) is None:
+            # 색인하지 않는 영문/숫자 한 글자 등은 부분 일치로 찾음
+            return ["substring"], "short_unindexed"
+        return ["short"], "short_query"
+
+    words = query_words(query)
+    if not words:
+        return ["trigram"], "no_terms"
+    if len(words) > 1:
+        return ["fulltext", "trigram"], "multi_term"
+    if query_script(query) != "hangul":
+        return ["fulltext", "trigram"], "single_term"
+
+    # 한글 단어: 접두사로 못 찾으면 합성어 중간 일치 → 그래도 없으면 오타 보정
+    if candidates is None:
+        return ["fulltext", "trigram"], "hangul_term"
+    if candidates == 0:
+        # 제목/본문 어디에도 없음 (요약/태그는 fulltext가 확인)
+        return ["fulltext", "trigram"], "hangul_term_absent"
+    if candidates > settings.SEARCH_SUBSTRING_MAX_CANDIDATES:
+        return ["fulltext", "trigram"], "hangul_term_common"
+    return ["fulltext", "substring", "trigram"], "hangul_term_selective"
+
+
+async def estimate_candidates(db: AsyncSession, query: str) -> int:
+    """
+    검색어를 포함할 수 있는 문서 수 상한 (page_ngrams 기준)
+
+    검색어의 모든 bigram을 포함해야 하므로 가장 드문 bigram의 문서 수가 상한입니다.
+    각 bigram은 SEARCH_SUBSTRING_MAX_CANDIDATES + 1건까지만 세므로 흔한 글자도 비용이 일정합니다.
+    """
+    grams = sorted({word[i:i + 2] for word in query_words(query) for i in range(len(word) - 1)})
+    if not grams:
+        return 0
+
+    result = await db.execute(
+        text("""
+            SELECT min(c.df)
+            FROM unnest(CAST(:grams AS text[])) AS g(gram)
+            CROSS JOIN LATERAL (
+                SELECT count(*) AS df
+                FROM (SELECT 1 FROM page_ngrams n WHERE n.gram = g.gram LIMIT :cap) s
+            ) c
+        """),
+        {"grams": grams, "cap": settings.SEARCH_SUBSTRING_MAX_CANDIDATES + 1}
+    )
+    return int(result.scalar_one() or 0)
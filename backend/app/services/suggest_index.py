@@ -0,0 +1,301 @@
+"""
+자동완성 색인 - 문서 제목 / 태그 이름의 접두사 검색 (프로세스 내)
+
+입력할 때마다 DB를 조회하지 않도록 워커마다 정렬된 (키, 종류, id) 배열을 두고
+bisect로 접두사 범위를 찾습니다. 앱 시작 시 전체를 불러오고, 이후에는 무효화
+이벤트(문서/태그 변경)를 받은 항목만 다시 불러옵니다.
+
+키는 정규화된 전체 문자열과 각 단어 시작 위치부터의 문자열이며, 한글 이름은 같은
+방식의 초성 키와 띄어쓰기를 뺀 초성 키도 함께 둡니다.
+("엘론 실버스트라이드" → "엘론 실버스트라이드", "실버스트라이드", "ㅇㄹ ㅅㅂㅅㅌㄹㅇㄷ",
+ "ㅅㅂㅅㅌㄹㅇㄷ", "ㅇㄹㅅㅂㅅㅌㄹㅇㄷ" / "종족/엘프" → "종족/엘프", "엘프", ...)
+"""
+import asyncio
+from bisect import bisect_left, insort
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+import structlog
+
+from app.db.database import AsyncSessionLocal
+from app.models.page import Page
+from app.models.tag import Tag
+from app.services.hangul import choseong, choseong_key, choseong_query
+from app.services.invalidation import on_invalidate
+from app.services.ngrams import WORD_PATTERN
+from app.services.search_cache import normalize_query
+
+logger = structlog.get_logger()
+
+# 접두사 범위에서 확인할 최대 키 수 (한 글자 입력처럼 범위가 넓을 때 응답 시간 상한)
+SCAN_LIMIT = 2000
+
+# 불러오기 실패 시 재시도 대기 시간 (초)
+RETRY_DELAY = 5.0
+
+
+def _word_start_keys(normalized: str) -> set[str]:
+    return {normalized[match.start():] for match in WORD_PATTERN.finditer(normalized)} | {normalized}
+
+
+def index_keys(label: str) -> set[str]:
+    """항목 이름 → 색인 키 (정규화된 전체 + 단어 시작 위치부터, 초성 키 포함)"""
+    normalized = normalize_query(label)
+    if not normalized:
+        return set()
+
+    keys = _word_start_keys(normalized)
+    initials = choseong(normalized)
+    if initials != normalized:
+        keys |= _word_start_keys(initials)
+        keys.add(choseong_key(initials))
+    return keys
+
+
+class SuggestIndex:
+    """문서 제목 / 태그 이름 접두사 색인"""
+
+    def __init__(self):
+        # (키, 종류, id) 정렬 배열
+        self._items: list[tuple[str, str, int]] = []
+        # (종류, id) → 항목 (응답 값 + 정렬 가중치 + 색인 키)
+        self._entries: dict[tuple[str, int], dict] = {}
+        self.ready = False
+
+        # 다시 불러올 항목 (무효화 이벤트가 쌓고 백그라운드 작업이 처리)
+        self._reload_all = True
+        self._dirty_pages: set[int] = set()
+        self._dirty_tags: set[int] = set()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """색인 작업 시작 (앱 시작 시 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """색인 작업 종료 (앱 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def mark_pages(self, page_ids: Iterable[int]) -> None:
+        """문서 다시 불러오기 예약"""
+        self._dirty_pages.update(page_ids)
+        self._wakeup.set()
+
+    def mark_tags(self, tag_ids: Iterable[int]) -> None:
+        """태그 다시 불러오기 예약"""
+        self._dirty_tags.update(tag_ids)
+        self._wakeup.set()
+
+    def mark_all(self) -> None:
+        """전체 다시 불러오기 예약"""
+        self._reload_all = True
+        self._wakeup.set()
+
+    def suggest(self, prefix: str, limit: int = 10, project_id: Optional[str] = None) -> list[dict]:
+        """
+        접두사로 시작하는 문서/태그 (DB 접근 없음)
+
+        정렬: 이름(또는 초성)이 접두사로 시작 > 가중치(조회수, 태그 사용 수) > 짧은 이름
+
+        Args:
+            prefix: 입력 중인 검색어
+            project_id: 문서를 해당 프로젝트로 제한 (태그는 전체 공용)
+        """
+        prefix = normalize_query(prefix)
+        if not prefix:
+            return []
+        if choseong_query(prefix):
+            # 첫가끝 초성 자모도 호환 자모 키로 찾음
+            prefix = choseong(prefix)
+
+        matched: set[tuple[str, int]] = set()
+        start = bisect_left(self._items, (prefix,))
+        for key, kind, item_id in self._items[start:start + SCAN_LIMIT]:
+            if not key.startswith(prefix):
+                break
+            matched.add((kind, item_id))
+
+        candidates = [self._entries[owner] for owner in matched]
+        if project_id:
+            candidates = [
+                entry for entry in candidates
+                if entry["type"] != "page" or entry["project_id"] == project_id
+            ]
+
+        candidates.sort(key=lambda entry: (
+            not entry["sort_label"].startswith(prefix) and not entry["sort_initials"].startswith(prefix),
+            -entry["weight"],
+            len(entry["label"]),
+            entry["label"],
+        ))
+        return [entry["item"] for entry in candidates[:limit]]
+
+    def stats(self) -> dict:
+        """색인 크기"""
+        return {
+            "ready": self.ready,
+            "entries": len(self._entries),
+            "keys": len(self._items),
+        }
+
+    def _set(
+        self, kind: str, item_id: int, labels: Iterable[Optional[str]], item: dict, weight: int,
+        bulk: bool = False,
+    ) -> None:
+        """
+        항목 추가 또는 교체
+
+        Args:
+            bulk: 전체 불러오기 중 (키를 뒤에 붙이기만 하고, 호출자가 마지막에 한 번 정렬)
+        """
+        keys = set()
+        for label in labels:
+            if label:
+                keys |= index_keys(label)
+        if bulk:
+            self._items.extend((key, kind, item_id) for key in keys)
+        else:
+            self._remove(kind, item_id)
+            for key in keys:
+                insort(self._items, (key, kind, item_id))
+        self._entries[(kind, item_id)] = {
+            "type": kind,
+            "label": item["label"],
+            "sort_label": normalize_query(item["label"]),
+            "sort_initials": choseong(normalize_query(item["label"])),
+            "project_id": item.get("project_id"),
+            "weight": weight or 0,
+            "keys": keys,
+            "item": item,
+        }
+
+    def _remove(self, kind: str, item_id: int) -> None:
+        entry = self._entries.pop((kind, item_id), None)
+        if entry is None:
+            return
+        for key in entry["keys"]:
+            index = bisect_left(self._items, (key, kind, item_id))
+            del self._items[index]
+
+    def _set_page(self, row, bulk: bool = False) -> None:
+        self._set(
+            "page", row.id, [row.title],
+            {"type": "page", "label": row.title, "slug": row.slug, "project_id": row.project_id},
+            row.view_count, bulk,
+        )
+
+    def _set_tag(self, row, bulk: bool = False) -> None:
+        label = row.display_name or row.name
+        self._set(
+            "tag", row.id, [row.name, row.display_name],
+            {"type": "tag", "label": label, "name": row.name},
+            row.usage_count, bulk,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error("suggest_index_refresh_failed", error=str(e), retry_in=RETRY_DELAY)
+                await asyncio.sleep(RETRY_DELAY)
+                continue
+            await self._wakeup.wait()
+
+    async def refresh(self) -> None:
+        """예약된 항목 다시 불러오기 (실패하면 예약을 되돌림)"""
+        self._wakeup.clear()
+        reload_all, self._reload_all = self._reload_all, False
+        page_ids, self._dirty_pages = self._dirty_pages, set()
+        tag_ids, self._dirty_tags = self._dirty_tags, set()
+
+        try:
+            if reload_all:
+                await self._rebuild()
+            elif page_ids or tag_ids:
+                await self._reload(page_ids, tag_ids)
+        except Exception:
+            self._reload_all |= reload_all
+            self._dirty_pages |= page_ids
+            self._dirty_tags |= tag_ids
+            raise
+
+    async def _rebuild(self) -> None:
+        """전체 불러오기 (새 배열을 만든 뒤 교체)"""
+        async with AsyncSessionLocal() as session:
+            pages = (await session.execute(
+                select(Page.id, Page.slug, Page.title, Page.project_id, Page.view_count)
+                .where(Page.status == "active")
+            )).all()
+            tags = (await session.execute(
+                select(Tag.id, Tag.name, Tag.display_name, Tag.usage_count)
+            )).all()
+
+        # 키를 모두 모은 뒤 한 번만 정렬 (항목마다 insort하면 키 수의 제곱에 비례)
+        rebuilt = SuggestIndex()
+        for row in pages:
+            rebuilt._set_page(row, bulk=True)
+        for row in tags:
+            rebuilt._set_tag(row, bulk=True)
+        rebuilt._items.sort()
+
+        self._items, self._entries = rebuilt._items, rebuilt._entries
+        self.ready = True
+        logger.info("suggest_index_built", pages=len(pages), tags=len(tags), keys=len(self._items))
+
+    async def _reload(self, page_ids: set[int], tag_ids: set[int]) -> None:
+        """변경된 항목만 다시 불러오기 (없어지거나 비활성화된 항목은 제거)"""
+        async with AsyncSessionLocal() as session:
+            pages = (await session.execute(
+                select(Page.id, Page.slug, Page.title, Page.project_id, Page.view_count)
+                .where(Page.id.in_(page_ids), Page.status == "active")
+            )).all() if page_ids else []
+            tags = (await session.execute(
+                select(Tag.id, Tag.name, Tag.display_name, Tag.usage_count)
+                .where(Tag.id.in_(tag_ids))
+            )).all() if tag_ids else []
+
+        for page_id in page_ids:
+            self._remove("page", page_id)
+        for tag_id in tag_ids:
+            self._remove("tag", tag_id)
+        for row in pages:
+            self._set_page(row)
+        for row in tags:
+            self._set_tag(row)
+
+
+# 전역 색인 인스턴스
+suggest_index = SuggestIndex()
+
+
+@on_invalidate("pages")
+def _on_pages_changed(event_data: dict) -> None:
+    # 제목/상태가 바뀔 수 있는 변경만 projects를 함께 보냄 (search_cache와 같은 기준)
+    if event_data.get("all"):
+        suggest_index.mark_all()
+    elif "projects" in event_data:
+        suggest_index.mark_pages(event_data.get("ids", ()))
+
+
+@on_invalidate("tags")
+def _on_tags_changed(event_data: dict) -> None:
+    if event_data.get("all"):
+        suggest_index.mark_all()
+    else:
+        suggest_index.mark_tags(event_data.get("ids", ()))
+
+
+@on_invalidate("projects")
+def _on_project_changed(event_data: dict) -> None:
+    # 프로젝트 삭제는 하위 문서까지 지움
+    if event_data.get("all") or event_data.get("deleted"):
+        suggest_index.mark_all()
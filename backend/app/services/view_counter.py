@@ -0,0 +1,122 @@
+"""
+조회수 버퍼 - 문서 조회를 읽기 전용으로 유지
+
+조회마다 UPDATE + COMMIT을 실행하는 대신 프로세스 메모리에 증가분을 모아 두고,
+주기적으로 한 번의 UPDATE로 반영합니다. 정확도는 flush 주기만큼 늦어집니다.
+"""
+import asyncio
+from collections import Counter
+from typing import Optional
+
+from sqlalchemy import text
+import structlog
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+
+logger = structlog.get_logger()
+
+
+class ViewCounter:
+    """문서별 조회수 증가분을 모아서 일괄 반영"""
+
+    def __init__(
+        self,
+        flush_interval: float = settings.VIEW_COUNT_FLUSH_INTERVAL,
+        daily_table: bool = settings.VIEW_COUNT_DAILY_TABLE,
+    ):
+        self.flush_interval = flush_interval
+        self.daily_table = daily_table
+        self._pending: Counter = Counter()
+        # 이 프로세스에서 기록한 누적 조회수 (flush와 무관하게 증가)
+        self._recorded: Counter = Counter()
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, page_id: int) -> None:
+        """조회 1회 기록 (DB 접근 없음)"""
+        self._pending[page_id] += 1
+        self._recorded[page_id] += 1
+
+    def pending(self, page_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수"""
+        return self._pending.get(page_id, 0)
+
+    def recorded(self, page_id: int) -> int:
+        """이 프로세스에서 기록한 누적 조회수 (캐시된 응답의 조회수 보정용)"""
+        return self._recorded.get(page_id, 0)
+
+    def start(self) -> None:
+        """주기적 flush 시작 (앱 시작 시 호출)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """주기적 flush 종료 후 남은 증가분 반영 (앱 종료 시 호출)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        모아 둔 증가분을 한 번의 UPDATE로 반영
+
+        실패하면 증가분을 버퍼에 되돌려 다음 주기에 다시 시도합니다.
+
+        Returns:
+            반영한 조회수 합계
+        """
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, Counter()
+        params = {"ids": list(batch.keys()), "views": list(batch.values())}
+
+        try:
+            async with AsyncSessionLocal() as db:
+                # updated_at은 건드리지 않음 (ORM onupdate 우회)
+                await db.execute(
+                    text("""
+                        UPDATE pages AS p
+                        SET view_count = p.view_count + v.views
+                        FROM unnest(CAST(:ids AS integer[]), CAST(:views AS integer[])) AS v(id, views)
+                        WHERE p.id = v.id
+                    """),
+                    params
+                )
+
+                if self.daily_table:
+                    await db.execute(
+                        text("""
+                            INSERT INTO page_views (page_id, day, views)
+                            SELECT v.id, CURRENT_DATE, v.views
+                            FROM unnest(CAST(:ids AS integer[]), CAST(:views AS integer[])) AS v(id, views)
+                            JOIN pages p ON p.id = v.id
+                            ON CONFLICT (page_id, day)
+                            DO UPDATE SET views = page_views.views + EXCLUDED.views
+                        """),
+                        params
+                    )
+
+                await db.commit()
+        except Exception as e:
+            self._pending.update(batch)
+            logger.error("view_count_flush_failed", pages=len(batch), error=str(e))
+            return 0
+
+        total = sum(batch.values())
+        logger.debug("view_count_flushed", pages=len(batch), views=total)
+        return total
+
+
+# 전역 조회수 버퍼 인스턴스
+view_counter = ViewCounter()
@@ -0,0 +1,205 @@
+"""
+검색 방식 벤치마크 스크립트
+
+실제 문서 제목에서 검색어 형태별 말뭉치를 만들고, 모든 검색 방식(short, fulltext,
+substring, trigram)과 자동 계획(auto)을 같은 검색어로 실행해 형태별로 어느 방식이
+빠르고 결과를 찾는지 비교합니다. 검색 계획(app.services.search_planner) 기준을
+조정할 때 근거로 사용합니다. 검색 결과 캐시는 거치지 않습니다.
+
+검색어 형태:
+    short   제목 첫 단어의 앞 1~2글자
+    prefix  제목 첫 단어
+    infix   한글 단어 중간 3글자 (띄어쓰기 없는 합성어)
+    typo    제목 첫 단어에서 한 글자 누락
+    multi   제목 앞 두 단어
+    choseong 한글 제목 앞 단어들의 초성
+
+자모 오타 재현율:
+    한글 제목의 한 음절 모음을 바꾼 검색어("실버홀드" → "실바홀드")로 trigram과 jamo를
+    실행해, 원래 문서가 결과에 포함되는 비율(recall)과 소요 시간을 비교합니다.
+
+사용법:
+    python scripts/benchmark_search.py                      # 문서 50개에서 말뭉치 생성
+    python scripts/benchmark_search.py --pages 200 --repeat 10
+    python scripts/benchmark_search.py --query 드워프 --query "elf paladin"
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+from collections import defaultdict
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import select
+
+from app.api.search import ENGINES, _run_search, plan_search
+from app.db.database import AsyncSessionLocal
+from app.models.page import Page
+import app.models  # noqa: F401  관계 설정을 위해 전체 모델 로드
+from app.services.search_cache import normalize_query
+from app.services.hangul import JUNGSEONG, SYLLABLE_FIRST, SYLLABLES_PER_CHOSEONG, choseong_key
+from app.services.search_planner import HANGUL_PATTERN, query_words
+
+SHAPES = ["short", "prefix", "infix", "typo", "multi", "choseong", "custom"]
+
+# 자모 오타 재현율 비교 대상
+RECALL_ENGINES = ["trigram", "jamo"]
+
+# 자주 틀리는 모음 (없으면 다음 모음)
+VOWEL_TYPOS = {"ㅏ": "ㅓ", "ㅓ": "ㅏ", "ㅗ": "ㅜ", "ㅜ": "ㅗ", "ㅐ": "ㅔ", "ㅔ": "ㅐ", "ㅡ": "ㅜ", "ㅣ": "ㅢ"}
+
+
+def build_corpus(titles: list[str]) -> dict[str, list[str]]:
+    """문서 제목 → 형태별 검색어 (중복 제거)"""
+    corpus: dict[str, set[str]] = defaultdict(set)
+    for title in titles:
+        words = query_words(normalize_query(title))
+        if not words:
+            continue
+        first = words[0]
+
+        corpus["short"].add(first[:2])
+        if HANGUL_PATTERN.match(first):
+            corpus["short"].add(first[:1])
+        if len(first) >= 3:
+            corpus["prefix"].add(first)
+        if len(first) >= 4:
+            corpus["typo"].add(first[:len(first) // 2] + first[len(first) // 2 + 1:])
+        if len(words) >= 2:
+            corpus["multi"].add(" ".join(words[:2]))
+        if HANGUL_PATTERN.match(first):
+            corpus["choseong"].add(choseong_key(" ".join(words[:2]))[:4])
+        for word in words:
+            if len(word) >= 5 and HANGUL_PATTERN.match(word):
+                corpus["infix"].add(word[1:4])
+                break
+
+    return {shape: sorted(queries) for shape, queries in corpus.items()}
+
+
+def jamo_typo(title: str) -> str | None:
+    """한글 제목 가운데 음절의 모음 하나를 바꾼 오타 (한글 음절이 없으면 None)"""
+    positions = [index for index, char in enumerate(title) if "가" <= char <= "힣"]
+    if not positions:
+        return None
+
+    index = positions[len(positions) // 2]
+    code = ord(title[index]) - SYLLABLE_FIRST
+    initial, vowel, final = code // SYLLABLES_PER_CHOSEONG, code % SYLLABLES_PER_CHOSEONG // 28, code % 28
+    typo = VOWEL_TYPOS.get(JUNGSEONG[vowel], JUNGSEONG[(vowel + 1) % len(JUNGSEONG)])
+    syllable = chr(SYLLABLE_FIRST + (initial * 21 + JUNGSEONG.index(typo)) * 28 + final)
+    return title[:index] + syllable + title[index + 1:]
+
+
+async def time_engine(session, engine, query: str, limit: int, repeat: int) -> tuple[float, int]:
+    """(중앙값 ms, 결과 수)"""
+    timings = []
+    hits = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if engine == "auto":
+            _, results, _, _ = await _run_search(session, query, None, None, limit, "auto", False)
+        else:
+            results, _ = await ENGINES[engine](session, query, None, None, limit)
+        timings.append((time.perf_counter() - started) * 1000)
+        hits = len(results)
+    return statistics.median(timings), hits
+
+
+async def benchmark(sample: int, repeat: int, limit: int, queries: list[str]) -> None:
+    async with AsyncSessionLocal() as session:
+        pages = (await session.execute(
+            select(Page.slug, Page.title).where(Page.status == "active").order_by(Page.id).limit(sample)
+        )).all()
+
+        corpus = build_corpus([page.title for page in pages])
+        if queries:
+            corpus["custom"] = [normalize_query(query) for query in queries]
+
+        engines = [*ENGINES, "auto"]
+        for shape in SHAPES:
+            shape_queries = corpus.get(shape)
+            if not shape_queries:
+                continue
+
+            latency: dict[str, list[float]] = defaultdict(list)
+            found: dict[str, int] = defaultdict(int)
+            wins: dict[str, int] = defaultdict(int)
+            reasons: dict[str, int] = defaultdict(int)
+
+            for query in shape_queries:
+                fastest = None
+                for engine in engines:
+                    ms, hits = await time_engine(session, engine, query, limit, repeat)
+                    latency[engine].append(ms)
+                    if hits:
+                        found[engine] += 1
+                        # 결과를 찾은 방식 중 가장 빠른 방식이 승
+                        if engine != "auto" and (fastest is None or ms < fastest[1]):
+                            fastest = (engine, ms)
+                if fastest:
+                    wins[fastest[0]] += 1
+                plan = await plan_search(session, query)
+                reasons[f"{'>'.join(plan.engines)} ({plan.reason})"] += 1
+
+            print(f"\n[{shape}] 검색어 {len(shape_queries)}개 (예: {', '.join(shape_queries[:3])})")
+            print(f"  {'방식':<10} {'p50 ms':>8} {'max ms':>8} {'결과 있음':>9} {'승':>4}")
+            for engine in engines:
+                values = latency[engine]
+                print(
+                    f"  {engine:<10} {statistics.median(values):>8.2f} {max(values):>8.2f}"
+                    f" {found[engine]:>4}/{len(shape_queries):<4} {wins[engine] if engine != 'auto' else '-':>4}"
+                )
+            for plan_name, count in sorted(reasons.items(), key=lambda item: -item[1]):
+                print(f"  계획 {plan_name}: {count}")
+
+        await benchmark_typo_recall(session, pages, repeat, limit)
+
+
+async def benchmark_typo_recall(session, pages, repeat: int, limit: int) -> None:
+    """자모 오타 검색어로 원래 문서를 찾는 비율과 소요 시간 (trigram vs jamo)"""
+    cases = [(page.slug, typo) for page in pages if (typo := jamo_typo(page.title))]
+    if not cases:
+        return
+
+    latency: dict[str, list[float]] = defaultdict(list)
+    recalled: dict[str, int] = defaultdict(int)
+    for slug, query in cases:
+        query = normalize_query(query)
+        for engine in RECALL_ENGINES:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                results, _ = await ENGINES[engine](session, query, None, None, limit)
+                timings.append((time.perf_counter() - started) * 1000)
+            latency[engine].append(statistics.median(timings))
+            if any(result.slug == slug for result in results):
+                recalled[engine] += 1
+
+    print(f"\n[jamo typo recall] 검색어 {len(cases)}개 (예: {', '.join(query for _, query in cases[:3])})")
+    print(f"  {'방식':<10} {'p50 ms':>8} {'max ms':>8} {'recall':>8}")
+    for engine in RECALL_ENGINES:
+        values = latency[engine]
+        print(
+            f"  {engine:<10} {statistics.median(values):>8.2f} {max(values):>8.2f}"
+            f" {recalled[engine] / len(cases):>8.2%}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 방식 벤치마크")
+    parser.add_argument("--pages", type=int, default=50, help="말뭉치를 만들 문서 수")
+    parser.add_argument("--repeat", type=int, default=5, help="검색어별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--limit", type=int, default=20, help="검색 결과 수")
+    parser.add_argument("--query", action="append", default=[], help="추가 검색어 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.pages, args.repeat, args.limit, args.query))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+문서 색인 백필 스크립트
+
+content_html, n-gram 색인, 초성/자모 등 저장 시점에 계산하는 파생 데이터를 기존 문서에 채웁니다.
+
+사용법:
+    python scripts/reindex_pages.py          # 색인이 비어 있는 문서만
+    python scripts/reindex_pages.py --all    # 전체 문서 다시 계산
+"""
+import argparse
+import asyncio
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import exists, or_, select, update
+from sqlalchemy.orm import undefer_group
+
+from app.db.database import AsyncSessionLocal
+from app.models.page import Page
+from app.models.page_ngram import PageNgram
+import app.models  # noqa: F401  관계 설정을 위해 전체 모델 로드
+from app.services.cache import mark_pages_changed
+from app.services.markdown_render import shutdown_renderer
+from app.services.page_indexer import build_index, replace_ngrams
+
+
+async def reindex(all_pages: bool, batch_size: int) -> int:
+    """id 순서로 batch_size씩 색인 (배치마다 커밋)"""
+    last_id = 0
+    total = 0
+
+    while True:
+        async with AsyncSessionLocal() as session:
+            query = (
+                select(Page)
+                .options(undefer_group("body"))
+                .where(Page.id > last_id)
+                .order_by(Page.id)
+                .limit(batch_size)
+            )
+            if not all_pages:
+                query = query.where(or_(
+                    Page.content_html.is_(None),
+                    Page.title_choseong.is_(None),
+                    Page.title_jamo.is_(None),
+                    ~exists().where(PageNgram.page_id == Page.id),
+                ))
+
+            pages = (await session.execute(query)).scalars().all()
+            if not pages:
+                break
+
+            for page in pages:
+                values = await build_index(page)
+                # 파생 데이터만 바뀌므로 updated_at 유지
+                await session.execute(
+                    update(Page)
+                    .where(Page.id == page.id)
+                    .values(**values, updated_at=Page.updated_at)
+                )
+                await replace_ngrams(session, page.id, page.title, page.content, values["tags_choseong"])
+
+            mark_pages_changed(
+                session,
+                [page.id for page in pages],
+                projects=[page.project_id for page in pages],
+            )
+            await session.commit()
+
+            last_id = pages[-1].id
+            total += len(pages)
+            print(f"  {total}개 문서 색인 완료 (마지막 id={last_id})")
+
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문서 색인 백필")
+    parser.add_argument("--all", action="store_true", help="이미 색인된 문서도 다시 계산")
+    parser.add_argument("--batch-size", type=int, default=100, help="커밋 단위 문서 수")
+    args = parser.parse_args()
+
+    try:
+        total = asyncio.run(reindex(args.all, args.batch_size))
+    finally:
+        shutdown_renderer()
+    print(f"✅ 색인 완료: {total}개 문서")
+
+
+if __name__ == "__main__":
+    main()
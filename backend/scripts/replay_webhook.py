@@ -0,0 +1,60 @@
+"""
+기록된 GitHub 웹훅 재전송 스크립트 (로컬 확인용)
+
+tests/fixtures의 기록된 payload(또는 지정한 JSON 파일)를 GITHUB_WEBHOOK_SECRET으로
+다시 서명해 실행 중인 서버의 /api/sync/webhook으로 보냅니다.
+GitHub 웹훅 설정 화면의 "Recent Deliveries"에서 payload를 복사해 저장하면 실제 전송도 재현할 수 있습니다.
+
+사용법:
+    python scripts/replay_webhook.py                                   # 기록된 push
+    python scripts/replay_webhook.py --event ping tests/fixtures/github_ping.json
+    python scripts/replay_webhook.py --url http://localhost:8000 delivery.json
+"""
+import argparse
+import hashlib
+import hmac
+import sys
+import os
+import uuid
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import httpx
+
+from app.core.config import settings
+
+DEFAULT_PAYLOAD = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests", "fixtures", "github_push.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기록된 GitHub 웹훅 재전송")
+    parser.add_argument("payload", nargs="?", default=DEFAULT_PAYLOAD, help="payload JSON 파일")
+    parser.add_argument("--event", default="push", help="X-GitHub-Event")
+    parser.add_argument("--url", default="http://localhost:8000", help="API 서버 주소")
+    args = parser.parse_args()
+
+    if not settings.GITHUB_WEBHOOK_SECRET:
+        sys.exit("GITHUB_WEBHOOK_SECRET이 설정되지 않았습니다")
+
+    with open(args.payload, "rb") as f:
+        body = f.read()
+    signature = hmac.new(settings.GITHUB_WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+    response = httpx.post(
+        f"{args.url}/api/sync/webhook",
+        content=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-GitHub-Event": args.event,
+            "X-GitHub-Delivery": str(uuid.uuid4()),
+            "X-Hub-Signature-256": f"sha256={signature}",
+        },
+        timeout=30.0,
+    )
+    print(response.status_code, response.text)
+    sys.exit(0 if response.is_success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+GitHub → DB 재동기화 스크립트
+
+GitHub content/ 트리와 DB를 blob SHA로 비교해 달라진 문서만 내려받아 반영합니다.
+(app.api.sync.reconcile, POST /api/sync/github와 같은 동작)
+
+사용법:
+    python scripts/resync_github.py --dry-run      # 변경 예정 목록만 출력
+    python scripts/resync_github.py                # 생성/수정 반영
+    python scripts/resync_github.py --prune        # GitHub에 없는 문서도 삭제
+    python scripts/resync_github.py --resolve theirs  # 보류된 반영 작업을 GitHub 내용으로 해결 후 재동기화
+    python scripts/resync_github.py --resolve mine    # 보류된 반영 작업을 DB 내용으로 다시 반영 후 재동기화
+"""
+import argparse
+import asyncio
+import sys
+import os
+from typing import Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app.api.sync import reconcile, resolve_held
+from app.core.config import settings
+import app.models  # noqa: F401  관계 설정을 위해 전체 모델 로드
+from app.services.github_client import github_client
+from app.services.markdown_render import shutdown_renderer
+
+
+async def run(dry_run: bool, prune: bool, concurrency: int, batch_size: int, resolve: Optional[str] = None) -> int:
+    try:
+        if resolve:
+            # 보류된 작업이 있는 문서는 재동기화에서 건너뛰므로 먼저 해결
+            for resolution in await resolve_held(resolve):
+                if resolution.strategy == "mine":
+                    print(f"해결 #{resolution.id}: 다시 반영 (기준 {resolution.base_sha or '새 파일'})")
+                else:
+                    print(f"해결 #{resolution.id}: 작업 {len(resolution.discarded)}개 버림, "
+                          f"GitHub 내용 반영 {', '.join(resolution.updated + resolution.deleted) or '-'}")
+        report = await reconcile(dry_run=dry_run, prune=prune, concurrency=concurrency, batch_size=batch_size)
+    finally:
+        await github_client.close()
+        shutdown_renderer()
+
+    if report is None:
+        print("다른 재동기화가 실행 중입니다")
+        return 1
+
+    print(f"트리 {report.tree_sha[:7]}: 파일 {report.files}개, 변경 없음 {report.unchanged}개"
+          f"{' (잘린 트리, prune 생략)' if report.truncated else ''}")
+    for label, slugs in (
+        ("생성", report.created), ("수정", report.updated), ("삭제", report.deleted),
+        ("DB에만 있음", report.missing), ("건너뜀", report.skipped),
+    ):
+        if slugs:
+            print(f"  {label} {len(slugs)}: {', '.join(slugs[:20])}{' ...' if len(slugs) > 20 else ''}")
+    for slug, error in report.failed.items():
+        print(f"  실패 {slug}: {error}")
+    print(f"{'(dry run) ' if report.dry_run else ''}{report.elapsed_ms}ms")
+    return 1 if report.failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GitHub → DB 재동기화")
+    parser.add_argument("--dry-run", action="store_true", help="비교 결과만 출력")
+    parser.add_argument("--prune", action="store_true", help="GitHub에 없는 문서를 DB에서 삭제")
+    parser.add_argument("--concurrency", type=int, default=settings.GITHUB_SYNC_CONCURRENCY, help="동시 다운로드 수")
+    parser.add_argument("--batch-size", type=int, default=settings.GITHUB_SYNC_BATCH_SIZE, help="커밋 단위 문서 수")
+    parser.add_argument("--resolve", choices=("theirs", "mine"),
+                        help="보류된(conflict/failed) 반영 작업 해결: theirs는 GitHub 내용, mine은 DB 내용")
+    args = parser.parse_args()
+    if args.resolve and args.dry_run:
+        parser.error("--resolve는 --dry-run과 함께 쓸 수 없습니다")
+
+    sys.exit(asyncio.run(run(args.dry_run, args.prune, args.concurrency, args.batch_size, args.resolve)))
+
+
+if __name__ == "__main__":
+    main()
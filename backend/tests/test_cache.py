@@ -0,0 +1,53 @@
+"""
+Test Cache - 문서 상세 LRU/TTL 캐시
+"""
+import time
+
+from app.services.cache import LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    """
+    Test 1: 최대 크기를 넘으면 가장 오래 쓰지 않은 항목부터 밀려남
+    """
+    cache = LRUCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expires_entries(monkeypatch):
+    """
+    Test 2: TTL이 지나면 미스로 처리
+    """
+    now = time.monotonic()
+    cache = LRUCache(maxsize=10, ttl=5)
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("a", 1)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["misses"] == 1
+
+
+def test_stale_set_after_invalidation_is_ignored():
+    """
+    Test 3: 읽기 도중 무효화가 있었으면 읽은 값을 저장하지 않음
+    """
+    cache = LRUCache(maxsize=10, ttl=60)
+    generation = cache.generation
+
+    cache.discard_where(lambda key, value: key == "a")
+
+    assert cache.set("a", "old", generation=generation) is False
+    assert cache.get("a") is None
+    assert cache.set("a", "new", generation=cache.generation) is True
@@ -0,0 +1,215 @@
+"""
+Test GitHub Client - REST 호출 / 배치 커밋 (httpx.MockTransport + 메모리 저장소)
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from github import GithubException
+
+from app.services.github_client import GITHUB_API_URL, REF_UPDATE_RETRIES, GitHubClient, git_blob_sha, is_conflict
+
+
+class FakeRepository:
+    """브랜치 하나짜리 저장소 (commit_tree가 쓰는 엔드포인트만 흉내)"""
+
+    def __init__(self, files: dict[str, str]):
+        self.trees = {"t0": {path: git_blob_sha(content) for path, content in files.items()}}
+        self.commits = {"c0": "t0"}
+        self.head = "c0"
+        self.posted_trees: list[list[dict]] = []
+        # 남은 횟수만큼 ref 갱신 직전에 다른 커밋이 먼저 들어온 것처럼 422로 거부
+        self.concurrent_pushes: list[dict[str, str]] = []
+
+    async def request(self, method: str, url: str, **kwargs) -> dict:
+        if method == "GET" and url.startswith("/git/ref/heads/"):
+            return {"object": {"sha": self.head}}
+        if method == "GET" and url.startswith("/git/commits/"):
+            return {"tree": {"sha": self.commits[url.rsplit("/", 1)[1]]}}
+        if method == "GET" and url.startswith("/git/trees/"):
+            blobs = self.trees[url.rsplit("/", 1)[1]]
+            return {"tree": [{"path": path, "type": "blob", "sha": sha} for path, sha in blobs.items()]}
+        if method == "POST" and url == "/git/trees":
+            entries = kwargs["json"]["tree"]
+            self.posted_trees.append(entries)
+            blobs = dict(self.trees[kwargs["json"]["base_tree"]])
+            for entry in entries:
+                if "content" in entry:
+                    blobs[entry["path"]] = git_blob_sha(entry["content"])
+                elif entry["sha"] is None:
+                    assert entry["path"] in blobs, "GitHub은 없는 경로 삭제를 422로 거부"
+                    del blobs[entry["path"]]
+                else:
+                    blobs[entry["path"]] = entry["sha"]
+            tree_sha = f"t{len(self.trees)}"
+            self.trees[tree_sha] = blobs
+            return {"sha": tree_sha}
+        if method == "POST" and url == "/git/commits":
+            commit_sha = f"c{len(self.commits)}"
+            self.commits[commit_sha] = kwargs["json"]["tree"]
+            return {"sha": commit_sha}
+        if method == "PATCH" and url.startswith("/git/refs/heads/"):
+            if self.concurrent_pushes:
+                self._push(self.concurrent_pushes.pop(0))
+                raise GithubException(422, {"message": "Update is not a fast forward"})
+            self.head = kwargs["json"]["sha"]
+            return {}
+        raise AssertionError(f"unexpected request: {method} {url}")
+
+    def _push(self, files: dict[str, str]) -> None:
+        blobs = dict(self.files())
+        blobs.update({path: git_blob_sha(content) for path, content in files.items()})
+        tree_sha = f"t{len(self.trees)}"
+        self.trees[tree_sha] = blobs
+        self.head = f"c{len(self.commits)}"
+        self.commits[self.head] = tree_sha
+
+    def files(self) -> dict[str, str]:
+        return self.trees[self.commits[self.head]]
+
+
+def _transport_client(handler) -> GitHubClient:
+    """handler(httpx.Request) → httpx.Response로 응답하는 클라이언트 (실제 _request 경로 사용)"""
+    client = GitHubClient()
+    client._client = httpx.AsyncClient(
+        base_url=f"{GITHUB_API_URL}/repos/{client.repo_name}",
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def _client(repository: FakeRepository) -> GitHubClient:
+    prefix = f"/repos/{GitHubClient().repo_name}"
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        kwargs = {"json": json.loads(request.content)} if request.content else {}
+        try:
+            data = await repository.request(request.method, request.url.path.removeprefix(prefix), **kwargs)
+        except GithubException as e:
+            return httpx.Response(e.status, json=e.data)
+        return httpx.Response(200, json=data)
+
+    return _transport_client(handler)
+
+
+def test_request_maps_error_responses():
+    """
+    Test 4: 2xx 이외 응답은 상태 코드와 본문을 담은 GithubException, 네트워크 오류는 502
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "/missing" in request.url.path:
+            return httpx.Response(404, json={"message": "Not Found"})
+        if request.url.path.endswith("/broken"):
+            return httpx.Response(500, text="upstream error")
+        if request.url.path.endswith("/offline"):
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(204)
+
+    client = _transport_client(handler)
+
+    async def call(url: str):
+        try:
+            return await client._request("GET", url)
+        except GithubException as e:
+            return e.status, e.data
+
+    assert asyncio.run(call("/missing")) == (404, {"message": "Not Found"})
+    assert asyncio.run(call("/broken")) == (500, {"message": "upstream error"})
+    assert asyncio.run(call("/offline")) == (502, {"message": "connection refused"})
+    assert asyncio.run(call("/empty")) == {}
+    # get_file은 404를 None으로 처리
+    assert asyncio.run(client.get_file("missing")) is None
+
+
+def test_batch_skips_delete_of_missing_file():
+    """
+    Test 1: 이미 없는 파일의 삭제는 빼고 나머지 변경만 커밋
+    """
+    repository = FakeRepository({"content/a.md": "A", "content/b.md": "B"})
+    batch = _client(repository).batch()
+    batch.put("a", "A2").delete("b").delete("gone")
+
+    asyncio.run(batch.commit("Update"))
+
+    assert repository.files() == {"content/a.md": git_blob_sha("A2")}
+    assert "content/gone.md" not in [entry["path"] for entry in repository.posted_trees[0]]
+
+
+def test_batch_with_only_missing_deletes_makes_no_commit():
+    """
+    Test 2: 삭제할 파일이 모두 없으면 커밋하지 않음
+    """
+    repository = FakeRepository({"content/a.md": "A"})
+    result = asyncio.run(_client(repository).batch().delete("gone").commit("Delete"))
+
+    assert result["commit_sha"] == "c0"
+    assert repository.posted_trees == []
+
+
+def test_batch_expectation_mismatch_commits_nothing():
+    """
+    Test 3: 배치 이전 GitHub 파일이 예상 SHA와 다르면 conflict, 커밋하지 않음
+    """
+    repository = FakeRepository({"content/a.md": "edited on GitHub", "content/b.md": "B"})
+    batch = _client(repository).batch()
+    batch.expect("a", git_blob_sha("A")).put("a", "A2")
+    batch.expect("b", git_blob_sha("B")).put("b", "B2")
+    # 같은 배치에서 먼저 바꾼 경로는 다시 검사하지 않음
+    batch.expect("b", "ignored")
+
+    with pytest.raises(GithubException) as raised:
+        asyncio.run(batch.commit("Update"))
+
+    assert is_conflict(raised.value)
+    assert raised.value.data["conflicts"] == {"content/a.md": git_blob_sha("edited on GitHub")}
+    assert repository.posted_trees == []
+    assert repository.head == "c0"
+
+
+def test_commit_tree_retries_rejected_ref_update():
+    """
+    Test 5: ref 갱신이 422(fast-forward 불가)면 최신 head 기준으로 다시 커밋
+    """
+    repository = FakeRepository({"content/a.md": "A"})
+    repository.concurrent_pushes.append({"content/other.md": "pushed meanwhile"})
+
+    result = asyncio.run(_client(repository).batch().put("a", "A2").commit("Update"))
+
+    assert result["commit_sha"] == repository.head
+    assert repository.files() == {
+        "content/a.md": git_blob_sha("A2"),
+        "content/other.md": git_blob_sha("pushed meanwhile"),
+    }
+    assert len(repository.posted_trees) == 2
+
+
+def test_commit_tree_gives_up_after_retries():
+    """
+    Test 6: REF_UPDATE_RETRIES번 모두 거부되면 422를 그대로 올림 (head는 다른 커밋만 반영)
+    """
+    repository = FakeRepository({"content/a.md": "A"})
+    repository.concurrent_pushes.extend({f"content/p{i}.md": str(i)} for i in range(REF_UPDATE_RETRIES))
+
+    with pytest.raises(GithubException) as raised:
+        asyncio.run(_client(repository).batch().put("a", "A2").commit("Update"))
+
+    assert raised.value.status == 422
+    assert not is_conflict(raised.value)
+    assert repository.files()["content/a.md"] == git_blob_sha("A")
+    assert len(repository.posted_trees) == REF_UPDATE_RETRIES
+
+
+def test_batch_expectation_match_commits():
+    """
+    Test 7: 배치 이전 GitHub 파일이 예상 SHA와 같으면 커밋
+    """
+    repository = FakeRepository({"content/a.md": "A"})
+    batch = _client(repository).batch()
+    batch.expect("a", git_blob_sha("A")).put("a", "A2")
+    batch.expect("new", None).put("new", "N")
+
+    result = asyncio.run(batch.commit("Update"))
+
+    assert result["files"]["a"]["sha"] == git_blob_sha("A2")
+    assert repository.files() == {"content/a.md": git_blob_sha("A2"), "content/new.md": git_blob_sha("N")}
@@ -0,0 +1,56 @@
+"""
+Test Hangul - 초성 변환
+"""
+from app.services.hangul import (
+    choseong, choseong_key, choseong_ngrams, choseong_query, decompose, jamo_key, tags_choseong,
+)
+
+
+def test_choseong_projection():
+    """
+    Test 1: 음절은 초성으로, 나머지 글자는 소문자로 유지 / 색인 값은 공백 제거
+    """
+    assert choseong("엘론 실버스트라이드") == "ㅇㄹ ㅅㅂㅅㅌㄹㅇㄷ"
+    assert choseong_key("엘론 실버스트라이드") == "ㅇㄹㅅㅂㅅㅌㄹㅇㄷ"
+    assert choseong_key("Mithril 갑옷") == "mithrilㄱㅇ"
+    assert tags_choseong("종족 엘프 클래스 팔라딘") == "ㅈㅈ ㅇㅍ ㅋㄹㅅ ㅍㄹㄷ"
+
+
+def test_choseong_query_detection():
+    """
+    Test 2: 초성으로만 이루어진 검색어만 초성 검색 (공백 무시, 첫가끝 자모 허용)
+    """
+    assert choseong_query("ㅅㅂ ㅎㄷ") == "ㅅㅂㅎㄷ"
+    assert choseong_query("ᄋᄅ") == "ㅇㄹ"
+    assert choseong_query("엘ㄹ") is None
+    assert choseong_query("elf") is None
+    assert choseong_query("!!") is None
+
+
+def test_jamo_decomposition():
+    """
+    Test 3: 음절을 호환 자모로 분해 (받침/초성 같은 자모, 단어 구분 유지)
+    """
+    assert decompose("엘론") == "ㅇㅔㄹㄹㅗㄴ"
+    # 연음 오타도 자모 순서는 거의 같음
+    assert decompose("먹어") == "ㅁㅓㄱㅇㅓ"
+    assert decompose("머거") == "ㅁㅓㄱㅓ"
+    assert jamo_key(" 실버홀드  Elf ") == "ㅅㅣㄹㅂㅓㅎㅗㄹㄷㅡ elf"
+    assert jamo_key("") is None
+
+
+def test_choseong_ngrams():
+    """
+    Test 4: 초성 색인 값의 unigram/bigram (영문과 걸친 n-gram, 태그 단어 경계를 넘는 bigram 제외)
+    """
+    grams = choseong_ngrams(choseong_key("엘론 실버"))
+    assert grams["ㅇㄹ"] == 1
+    assert grams["ㄹㅅ"] == 1
+    assert grams["ㅇ"] == 1
+
+    tag_grams = choseong_ngrams(tags_choseong("종족 엘프"))
+    assert tag_grams["ㅇㅍ"] == 1
+    assert "ㅈㅇ" not in tag_grams
+
+    assert set(choseong_ngrams("mithrilㄱㅇ")) == {"ㄱ", "ㅇ", "ㄱㅇ"}
+    assert not choseong_ngrams(None)
@@ -0,0 +1,34 @@
+"""
+Test HTTP Cache - 목록 조건부 요청 검증 헤더
+"""
+from datetime import datetime, timezone
+
+from app.services.http_cache import format_http_date, http_date_settled, is_not_modified, make_etag
+
+
+def test_last_modified_only_after_its_second_passes():
+    """
+    Test 1: 같은 초 안에서는 이후 변경과 구분할 수 없으므로 Last-Modified를 보내지 않음
+    """
+    changed = datetime(2026, 10, 18, 12, 0, 0, 300_000, tzinfo=timezone.utc)
+
+    assert not http_date_settled(changed, now=datetime(2026, 10, 18, 12, 0, 0, 900_000, tzinfo=timezone.utc))
+    assert http_date_settled(changed, now=datetime(2026, 10, 18, 12, 0, 1, tzinfo=timezone.utc))
+
+
+def test_etag_distinguishes_edits_within_one_second():
+    """
+    Test 2: 같은 초의 재수정은 ETag가 달라 304가 아님, If-None-Match가 있으면 If-Modified-Since 무시
+    """
+    first = datetime(2026, 10, 18, 12, 0, 0, 300_000, tzinfo=timezone.utc)
+    second = first.replace(microsecond=800_000)
+    old_etag = make_etag("pages", first.isoformat())
+    new_etag = make_etag("pages", second.isoformat())
+    headers = {"if-none-match": old_etag, "if-modified-since": format_http_date(first)}
+
+    assert old_etag != new_etag
+    assert is_not_modified(headers, old_etag, first)
+    assert not is_not_modified(headers, new_etag, second)
+
+    # ETag가 없는 클라이언트는 초 단위 If-Modified-Since로 판정
+    assert is_not_modified({"if-modified-since": format_http_date(first)}, new_etag, first)
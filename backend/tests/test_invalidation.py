@@ -0,0 +1,84 @@
+"""
+Test Invalidation - LISTEN/NOTIFY 캐시 무효화 이벤트
+"""
+import asyncio
+import json
+
+import pytest
+
+from app.services import invalidation
+from app.services.cache import page_cache
+from app.services.invalidation import RECONNECT_DELAY, WORKER_ID, InvalidationListener, encode_payload
+
+
+def _cached_page(page_id: int, related_ids=()) -> tuple:
+    payload = {"id": page_id, "view_count": 0, "related_pages": [{"id": rid} for rid in related_ids]}
+    return ("etag", payload, 0)
+
+
+def test_oversized_payload_falls_back_to_full_invalidation():
+    """
+    Test 1: NOTIFY 상한을 넘는 이벤트는 종류별 전체 무효화로 대체
+    """
+    payload = json.loads(encode_payload([{"kind": "pages", "ids": list(range(5000)), "slugs": []}]))
+
+    assert payload["events"] == [{"kind": "pages", "all": True}]
+
+
+def test_remote_event_invalidates_local_cache():
+    """
+    Test 2: 다른 워커의 이벤트는 해당 문서와 그 문서를 관련 문서로 가진 항목을 지움
+    """
+    page_cache.clear()
+    page_cache.set("a", _cached_page(1))
+    page_cache.set("b", _cached_page(2, related_ids=[1]))
+    page_cache.set("c", _cached_page(3))
+
+    message = json.dumps({"w": "other-worker", "events": [{"kind": "pages", "ids": [1], "slugs": []}]})
+    InvalidationListener()._on_notify(None, 0, "xperion_invalidate", message)
+
+    assert page_cache.get("a") is None
+    assert page_cache.get("b") is None
+    assert page_cache.get("c") is not None
+
+
+def test_own_event_is_ignored():
+    """
+    Test 3: 자기 워커가 보낸 이벤트는 after_commit에서 이미 처리했으므로 무시
+    """
+    page_cache.clear()
+    page_cache.set("a", _cached_page(1))
+
+    message = json.dumps({"w": WORKER_ID, "events": [{"kind": "pages", "ids": [1], "slugs": []}]})
+    InvalidationListener()._on_notify(None, 0, "xperion_invalidate", message)
+
+    assert page_cache.get("a") is not None
+
+
+def test_reconnect_delay_resets_after_successful_listen(monkeypatch):
+    """
+    Test 4: 연결 실패가 이어지면 대기 시간이 늘고, LISTEN에 성공했던 연결이 끊기면 기본값으로 돌아감
+    """
+    listener = InvalidationListener()
+    # 실패, 실패, 성공 후 끊김, 성공 후 끊김, 실패
+    outcomes = iter([False, False, True, True, False])
+    delays = []
+
+    async def fake_listen():
+        if next(outcomes):
+            listener._listening = True
+        raise ConnectionError("closed")
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) == 5:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(listener, "_listen", fake_listen)
+    monkeypatch.setattr(invalidation.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(invalidation, "dispatch_all", lambda: None)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(listener._run())
+
+    assert delays == [RECONNECT_DELAY, RECONNECT_DELAY * 2, RECONNECT_DELAY, RECONNECT_DELAY, RECONNECT_DELAY * 2]
@@ -0,0 +1,206 @@
+"""
+Test Loader Strategies - 엔드포인트별 DB 로드량 회귀 테스트
+
+태그/문서 관계가 암묵적으로 로드되어 응답 하나에 문서 본문 전체가
+딸려오는 문제(selectin fan-out)가 다시 생기지 않는지 확인합니다.
+"""
+from collections import Counter
+from contextlib import contextmanager
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.db.database import engine
+from app.main import app
+from app.services.cache import page_cache
+
+
+# 본문을 제외한 문서 한 건의 문자열 바이트 상한 (제목, 요약, 색인 컬럼 등)
+PAGE_BYTES_BUDGET = 4096
+# fields=title 목록의 문서 한 건 바이트 상한 (slug, title)
+SPARSE_PAGE_BYTES_BUDGET = 1024
+BODY_COLUMNS = {"content", "content_html"}
+
+
+class LoadRecorder:
+    """요청 중 실행된 SQL 문, 로드된 ORM 객체 수, 로드된 문자열 바이트 수, 로드된 컬럼 기록"""
+
+    def __init__(self):
+        self.statements: list[str] = []
+        self.rows: Counter = Counter()
+        self.bytes: Counter = Counter()
+        self.columns: dict[str, set[str]] = {}
+
+    def on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def on_load(self, session, instance):
+        name = type(instance).__name__
+        self.rows[name] += 1
+        self.bytes[name] += sum(
+            len(value.encode("utf-8"))
+            for value in vars(instance).values()
+            if isinstance(value, str)
+        )
+        self.columns.setdefault(name, set()).update(
+            key for key in vars(instance) if not key.startswith("_")
+        )
+
+
+@contextmanager
+def record_loads():
+    recorder = LoadRecorder()
+    event.listen(engine.sync_engine, "before_cursor_execute", recorder.on_execute)
+    event.listen(Session, "loaded_as_persistent", recorder.on_load)
+    try:
+        yield recorder
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", recorder.on_execute)
+        event.remove(Session, "loaded_as_persistent", recorder.on_load)
+
+
+@pytest.mark.asyncio
+async def test_tag_list_never_loads_pages():
+    """
+    Test 1: 태그 목록은 문서를 한 건도 불러오지 않아야 함
+
+    Expected: Page 로드 0건, pages 테이블 조회 없음
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        with record_loads() as loads:
+            response = await ac.get("/api/tags")
+
+    assert response.status_code == 200
+    tags = response.json()
+
+    assert loads.rows["Page"] == 0
+    assert loads.rows["Tag"] == len(tags)
+    assert not any("FROM pages" in sql for sql in loads.statements)
+    # 태그당 수백 바이트 이내 (문서 본문이 섞이면 크게 초과)
+    assert len(response.content) <= 300 * max(len(tags), 1)
+
+
+@pytest.mark.asyncio
+async def test_page_list_loads_only_requested_rows():
+    """
+    Test 2: 문서 목록은 limit(+1)건과 그 태그만 로드해야 함
+
+    Expected: Page 로드 ≤ limit + 1, SQL 문 수 고정 (Last-Modified + count + 목록 + 태그)
+    """
+    limit = 5
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        with record_loads() as loads:
+            response = await ac.get("/api/pages", params={"limit": limit})
+
+    assert response.status_code == 200
+
+    assert loads.rows["Page"] <= limit + 1
+    # 첫 SQL은 조건부 요청용 목록 버전 조회 (pages_version)
+    assert len(loads.statements) <= 4
+    # 목록은 본문을 불러오지도, 응답하지도 않음
+    assert not any("pages.content" in sql for sql in loads.statements)
+    assert not loads.columns.get("Page", set()) & BODY_COLUMNS
+    assert loads.bytes["Page"] <= PAGE_BYTES_BUDGET * (limit + 1)
+    assert all("content" not in p for p in response.json()["pages"])
+
+
+@pytest.mark.asyncio
+async def test_page_list_sparse_fields():
+    """
+    Test 2-1: fields 파라미터로 요청한 필드만 응답
+
+    Expected: id, slug, title만 포함 / 태그 조회 SQL 없음 (Last-Modified + 목록)
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        with record_loads() as loads:
+            response = await ac.get("/api/pages", params={"limit": 5, "fields": "title", "count": "none"})
+
+    assert response.status_code == 200
+    for item in response.json()["pages"]:
+        assert set(item) == {"id", "slug", "title"}
+    # Last-Modified 조회 1건 + 목록 1건
+    assert len(loads.statements) == 2
+    # 요청한 컬럼만 로드 (본문, 요약 등 제외)
+    assert not loads.columns.get("Page", set()) & (BODY_COLUMNS | {"summary"})
+    assert loads.bytes["Page"] <= SPARSE_PAGE_BYTES_BUDGET * 6
+
+
+@pytest.mark.asyncio
+async def test_tag_pages_does_not_fan_out():
+    """
+    Test 3: 태그별 문서 목록에서 태그 → 문서 → 태그 연쇄 로드가 없어야 함
+
+    Expected: Tag 로드는 조회한 태그 + 목록 문서들의 태그뿐
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        tags = (await ac.get("/api/tags")).json()
+        if not tags:
+            pytest.skip("태그 데이터 없음")
+
+        with record_loads() as loads:
+            response = await ac.get(f"/api/tags/{tags[0]['name']}/pages", params={"limit": 5})
+
+    assert response.status_code == 200
+    pages = response.json()["pages"]
+
+    assert loads.rows["Page"] <= 6
+    assert loads.rows["Tag"] <= 1 + sum(len(p["tags"]) for p in pages)
+    assert len(loads.statements) <= 4
+
+
+@pytest.mark.asyncio
+async def test_page_detail_reads_precomputed_related():
+    """
+    Test 4: 문서 상세의 관련 문서는 page_related 조회 한 번으로 끝나야 함
+
+    Expected: 실시간 GROUP BY 집계 없음, SQL 문 수 고정
+              (ETag 버전 + 문서 + 태그 + 관련 문서 + 관련 문서 태그)
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        pages = (await ac.get("/api/pages", params={"limit": 1, "count": "none"})).json()["pages"]
+        if not pages:
+            pytest.skip("문서 데이터 없음")
+
+        with record_loads() as loads:
+            response = await ac.get(f"/api/pages/{pages[0]['slug']}")
+
+    assert response.status_code == 200
+    assert len(response.json()["related_pages"]) <= 5
+    assert not any("GROUP BY" in sql for sql in loads.statements)
+    assert len(loads.statements) <= 5
+
+
+@pytest.mark.asyncio
+async def test_page_detail_not_modified():
+    """
+    Test 5: If-None-Match가 현재 ETag와 같으면 본문 조회 없이 304
+
+    Expected: 304, 빈 본문
+              캐시 적중 시 SQL 0건, 캐시가 없으면 버전 조회 SQL 1건
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        pages = (await ac.get("/api/pages", params={"limit": 1, "count": "none"})).json()["pages"]
+        if not pages:
+            pytest.skip("문서 데이터 없음")
+
+        first = await ac.get(f"/api/pages/{pages[0]['slug']}")
+        etag = first.headers["etag"]
+
+        # 첫 조회가 page_cache에 저장되므로 재검증은 캐시가 304로 응답
+        with record_loads() as cached_loads:
+            cached = await ac.get(f"/api/pages/{pages[0]['slug']}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached_loads.statements == []
+
+        # 캐시가 없으면 버전 조회만으로 304
+        page_cache.clear()
+        with record_loads() as loads:
+            response = await ac.get(f"/api/pages/{pages[0]['slug']}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert len(loads.statements) == 1
+    assert not any("pages.content" in sql for sql in loads.statements)
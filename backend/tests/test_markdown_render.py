@@ -0,0 +1,32 @@
+"""
+Test Markdown Render - content_html 렌더링
+"""
+from app.services.markdown_render import render_markdown
+
+
+def test_headings_get_unicode_anchors():
+    """
+    Test 1: 한글 제목에도 앵커 id가 붙음
+    """
+    html = render_markdown("# 엘론 실버스트라이드\n\n## 기본 정보\n\n## 기본 정보\n")
+
+    assert '<h1 id="엘론-실버스트라이드">' in html
+    assert '<h2 id="기본-정보">' in html
+    assert '<h2 id="기본-정보_1">' in html
+
+
+def test_dangerous_markup_is_removed():
+    """
+    Test 2: 스크립트, 이벤트 핸들러, javascript: 링크 제거 / 코드 언어 class 유지
+    """
+    html = render_markdown(
+        "<script>alert(1)</script>\n\n"
+        "<img src=\"x.png\" onerror=\"alert(1)\">\n\n"
+        "[link](javascript:alert(1))\n\n"
+        "```python\nprint(1)\n```\n"
+    )
+
+    assert "<script" not in html
+    assert "onerror" not in html
+    assert "javascript:" not in html
+    assert '<code class="language-python">' in html
@@ -0,0 +1,27 @@
+"""
+Test Ngrams - 짧은 검색어용 n-gram 추출
+"""
+from app.services.ngrams import extract_ngrams, query_gram
+
+
+def test_extract_ngrams_within_words():
+    """
+    Test 1: 한글 unigram + 단어 내부 bigram만 추출 (공백을 넘는 bigram 없음)
+    """
+    grams = extract_ngrams("엘프 검술, 엘프")
+
+    assert grams["엘프"] == 2
+    assert grams["검술"] == 1
+    assert grams["엘"] == 2
+    assert "프검" not in grams
+
+
+def test_query_gram():
+    """
+    Test 2: 검색어 정규화 / 색인되지 않는 검색어는 None
+    """
+    assert query_gram("엘프") == "엘프"
+    assert query_gram("엘 프") == "엘프"
+    assert query_gram("AI") == "ai"
+    assert query_gram("a") is None
+    assert query_gram("엘프족") is None
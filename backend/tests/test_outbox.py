@@ -0,0 +1,240 @@
+"""
+Test Outbox - GitHub 반영 작업의 버전 충돌 처리 (GitHub 호출은 monkeypatch)
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from github import GithubException
+
+from app.api import sync
+from app.core.config import settings
+from app.models.outbox import GitHubOutbox
+from app.services import outbox
+from app.services.github_client import git_blob_sha, is_conflict
+
+
+def _entry(content: str, base_sha: str) -> GitHubOutbox:
+    return GitHubOutbox(
+        id=1, operation="upsert", path="인물/엘론", content=content, base_sha=base_sha,
+        message="Update 엘론", attempts=0, status="pending",
+    )
+
+
+def _github(monkeypatch, current_sha: str) -> list:
+    """update_file은 SHA 불일치(409), get_file은 current_sha를 돌려주는 GitHub"""
+    writes = []
+
+    async def update_file(**kwargs):
+        writes.append(kwargs)
+        raise GithubException(409, {"message": "does not match"})
+
+    async def get_file(path):
+        return {"content": "", "sha": current_sha, "url": f"https://github.com/x/{path}"}
+
+    monkeypatch.setattr(outbox.github_client, "update_file", update_file)
+    monkeypatch.setattr(outbox.github_client, "get_file", get_file)
+    return writes
+
+
+def test_upsert_does_not_overwrite_github_edit(monkeypatch):
+    """
+    Test 1: GitHub 파일이 base_sha와 다르면 덮어쓰지 않고 conflict로 보류 (재시도 없음)
+    """
+    writes = _github(monkeypatch, current_sha="edited-on-github")
+    entry = _entry("새 내용", base_sha="base")
+    dispatcher = outbox.OutboxDispatcher()
+
+    with pytest.raises(GithubException) as raised:
+        asyncio.run(dispatcher._push_upsert(entry))
+    assert is_conflict(raised.value)
+    assert raised.value.data["conflicts"] == {"인물/엘론": "edited-on-github"}
+    # 최신 SHA로 다시 쓰지 않음
+    assert [write["sha"] for write in writes] == ["base"]
+
+    blocked: set[str] = set()
+    dispatcher._record_failure(entry, raised.value, blocked)
+    assert entry.status == "conflict"
+    assert blocked == {"인물/엘론"}
+
+
+def test_upsert_already_applied_is_success(monkeypatch):
+    """
+    Test 2: GitHub에 이미 같은 내용이 있으면 (이전 시도가 반영됨) 성공으로 처리
+    """
+    _github(monkeypatch, current_sha=git_blob_sha("새 내용"))
+
+    result = asyncio.run(outbox.OutboxDispatcher()._push_upsert(_entry("새 내용", base_sha="base")))
+
+    assert result["sha"] == git_blob_sha("새 내용")
+
+
+def test_prune_done_entries_throttled(monkeypatch):
+    """
+    Test 3: 보관 기간이 지난 done/discarded 작업만 삭제 (최근 삭제 작업 유지), PRUNE_INTERVAL_SECONDS마다 한 번
+    """
+    executed = []
+
+    class Result:
+        rowcount = 3
+
+    class Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def execute(self, statement, params=None):
+            executed.append((str(statement), params))
+            return Result()
+
+        async def commit(self):
+            executed.append(("COMMIT", None))
+
+    monkeypatch.setattr(outbox, "AsyncSessionLocal", Session)
+    dispatcher = outbox.OutboxDispatcher()
+
+    assert asyncio.run(dispatcher._prune_if_due()) == 3
+    [(sql, params), (commit, _)] = executed
+    assert "DELETE FROM github_outbox" in sql
+    assert "status IN ('done', 'discarded')" in sql
+    assert "SELECT max(id) FROM github_outbox WHERE operation = 'delete'" in sql
+    assert params["cutoff"] < datetime.now(timezone.utc) - timedelta(days=settings.OUTBOX_RETENTION_DAYS - 1)
+    assert commit == "COMMIT"
+
+    # 주기 안에서는 다시 실행하지 않음
+    assert asyncio.run(dispatcher._prune_if_due()) == 0
+    assert len(executed) == 2
+
+
+def test_failed_entry_keeps_blocking_path(monkeypatch):
+    """
+    Test 4: 재시도 횟수를 넘겨 failed가 된 작업도 경로를 막아, 이후 작업이 오래된 base_sha로 반영되지 않음
+    """
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 1)
+    entry = _entry("새 내용", base_sha="base")
+
+    blocked: set[str] = set()
+    outbox.OutboxDispatcher()._record_failure(entry, GithubException(502, {"message": "bad gateway"}), blocked)
+
+    assert entry.status == "failed"
+    assert blocked == {"인물/엘론"}
+    assert "failed" in outbox.HELD_STATUSES
+
+
+class _ResolveSession:
+    """resolve_conflict가 여는 세션 (entry를 돌려주고 실행한 SQL을 기록)"""
+
+    def __init__(self, entry: GitHubOutbox, log: list, discarded=()):
+        self.entry = entry
+        self.log = log
+        self.discarded = list(discarded)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get(self, model, entry_id):
+        return self.entry if entry_id == self.entry.id else None
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.log.append(sql)
+        rows = self.discarded if sql.startswith("UPDATE github_outbox") else []
+        return _Result(self.entry if "FOR UPDATE" in sql else None, rows)
+
+    async def commit(self):
+        self.log.append("COMMIT")
+
+
+class _Result:
+    def __init__(self, scalar, rows):
+        self.scalar = scalar
+        self.rows = rows
+
+    def scalar_one_or_none(self):
+        return self.scalar
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+def test_conflict_resolved_mine_dispatches_against_current_sha(monkeypatch):
+    """
+    Test 5: conflict → mine 해결 → 다음 반영은 GitHub의 현재 SHA 기준으로 덮어씀
+    """
+    writes = _github(monkeypatch, current_sha="edited-on-github")
+    entry = _entry("새 내용", base_sha="base")
+    dispatcher = outbox.OutboxDispatcher()
+
+    with pytest.raises(GithubException) as raised:
+        asyncio.run(dispatcher._push_upsert(entry))
+    dispatcher._record_failure(entry, raised.value, set())
+    assert entry.status == "conflict"
+
+    log: list = []
+    notified = []
+    monkeypatch.setattr(sync, "AsyncSessionLocal", lambda: _ResolveSession(entry, log))
+    monkeypatch.setattr(outbox.outbox_dispatcher, "notify", lambda: notified.append(True))
+
+    resolution = asyncio.run(sync.resolve_conflict(1, "mine"))
+
+    assert resolution.base_sha == "edited-on-github"
+    assert (entry.status, entry.attempts, entry.last_error) == ("pending", 0, None)
+    assert entry.base_sha == "edited-on-github"
+    assert log[-1] == "COMMIT"
+    assert notified == [True]
+
+    async def update_file(**kwargs):
+        writes.append(kwargs)
+        return {"sha": git_blob_sha(kwargs["content"]), "url": "https://github.com/x/인물/엘론"}
+
+    monkeypatch.setattr(outbox.github_client, "update_file", update_file)
+    result = asyncio.run(dispatcher._push_upsert(entry))
+
+    assert result["sha"] == git_blob_sha("새 내용")
+    assert [write["sha"] for write in writes] == ["base", "edited-on-github"]
+
+    # 이미 해결된 작업은 다시 해결하지 않음
+    assert asyncio.run(sync.resolve_conflict(1, "mine")) is None
+
+
+def test_conflict_resolved_theirs_discards_and_imports(monkeypatch):
+    """
+    Test 6: theirs 해결은 같은 경로의 대기 작업을 먼저 discarded로 바꾼 뒤 GitHub 파일을 반영
+    """
+    entry = _entry("새 내용", base_sha="base")
+    entry.status = "conflict"
+    log: list = []
+    monkeypatch.setattr(sync, "AsyncSessionLocal", lambda: _ResolveSession(entry, log, discarded=[3, 1]))
+
+    async def get_file(path):
+        return {"content": "---\ntitle: 엘론\n---\nGitHub 본문", "sha": "edited-on-github", "url": ""}
+
+    async def upsert(db, rows, changes):
+        log.append(("upsert", rows))
+        return {row["slug"]: False for row in rows}
+
+    monkeypatch.setattr(sync.github_client, "get_file", get_file)
+    monkeypatch.setattr(sync, "_upsert", upsert)
+
+    resolution = asyncio.run(sync.resolve_conflict(1, "theirs"))
+
+    assert resolution.discarded == [1, 3]
+    assert resolution.updated == ["인물/엘론"]
+    assert resolution.deleted == []
+
+    discard = next(i for i, item in enumerate(log) if str(item).startswith("UPDATE github_outbox"))
+    [(upsert_at, rows)] = [(i, item[1]) for i, item in enumerate(log) if isinstance(item, tuple)]
+    # 먼저 버려야 _upsert의 _unsynced 조건에 걸리지 않음
+    assert discard < upsert_at
+    assert "github_outbox.new_path IN" in log[discard]
+    assert rows[0]["github_sha"] == "edited-on-github"
+    assert rows[0]["content"].strip() == "GitHub 본문"
+    assert log[-1] == "COMMIT"
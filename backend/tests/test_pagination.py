@@ -0,0 +1,129 @@
+"""
+Test Pagination - keyset 커서 인코딩/디코딩
+"""
+import asyncio
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.services.pagination import apply_keyset, count_rows, decode_cursor, encode_cursor
+
+pages = Table(
+    "pages",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("title", String),
+    Column("category", String),
+    Column("updated_at", DateTime(timezone=True)),
+    Column("view_count", Integer),
+)
+
+
+def test_cursor_round_trip_datetime():
+    """
+    Test 1: datetime 정렬 값이 커서를 거쳐 그대로 복원되는지 확인
+    """
+    updated = datetime(2026, 1, 16, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor("updated_at", "desc", updated, 42)
+
+    value, row_id = decode_cursor(cursor, "updated_at", "desc", pages.c.updated_at)
+
+    assert value == updated
+    assert row_id == 42
+
+
+def test_cursor_rejects_other_sort():
+    """
+    Test 2: 다른 정렬 조건으로 만든 커서는 거부
+    """
+    cursor = encode_cursor("title", "asc", "엘론", 7)
+
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, "updated_at", "desc", pages.c.updated_at)
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", "title", "asc", pages.c.title)
+
+
+
+def test_apply_keyset_uses_row_comparison():
+    """
+    Test 3: 커서 이후 조건이 OFFSET 없이 (정렬 컬럼, id) 비교로 생성되는지 확인
+    """
+    query = apply_keyset(select(pages), pages.c.title, pages.c.id, "desc", ("엘론", 7))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "(pages.title, pages.id) < (" in sql
+    assert "ORDER BY pages.title DESC, pages.id DESC" in sql
+    assert "OFFSET" not in sql
+
+
+class FakeExplainSession:
+    """count_rows(estimated)가 보내는 드라이버 SQL과 파라미터를 기록"""
+
+    class _Bind:
+        dialect = asyncpg.dialect()
+
+    class _Result:
+        def scalar_one(self):
+            return '[{"Plan": {"Plan Rows": 12}}]'
+
+    def __init__(self):
+        self.executed = []
+
+    def get_bind(self):
+        return self._Bind()
+
+    async def connection(self):
+        return self
+
+    async def exec_driver_sql(self, statement, parameters):
+        self.executed.append((statement, parameters))
+        return self._Result()
+
+
+def test_estimated_count_binds_filter_values():
+    """
+    Test 4: 추정 개수의 EXPLAIN은 필터 값을 SQL에 넣지 않고 파라미터로 전달 (콜론·따옴표가 들어간 값)
+    """
+    category = "a :x b's"
+    session = FakeExplainSession()
+
+    total = asyncio.run(count_rows(session, select(pages).where(pages.c.category == category), "estimated"))
+
+    assert total == 12
+    [(statement, parameters)] = session.executed
+    assert statement.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert category not in statement
+    assert ":x" not in statement
+    assert parameters == (category,)
+
+
+def _tampered(sort: str, order: str, value, row_id) -> str:
+    payload = json.dumps({"s": sort, "o": order, "v": value, "id": row_id})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def test_cursor_rejects_tampered_values():
+    """
+    Test 5: 정렬 컬럼 타입과 맞지 않는 값은 SQL에 가기 전에 ValueError (API에서 400)
+    """
+    bad_cursors = [
+        ("updated_at", pages.c.updated_at, 12345, 1),
+        ("updated_at", pages.c.updated_at, "not-a-date", 1),
+        ("view_count", pages.c.view_count, "many", 1),
+        ("view_count", pages.c.view_count, 2**40, 1),
+        ("view_count", pages.c.view_count, True, 1),
+        ("title", pages.c.title, ["엘론"], 1),
+        ("title", pages.c.title, "엘론", "7"),
+    ]
+    for sort, column, value, row_id in bad_cursors:
+        with pytest.raises(ValueError):
+            decode_cursor(_tampered(sort, "desc", value, row_id), sort, "desc", column)
+
+    assert decode_cursor(encode_cursor("view_count", "desc", 30, 7), "view_count", "desc", pages.c.view_count) == (30, 7)
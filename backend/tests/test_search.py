@@ -0,0 +1,106 @@
+"""
+Test Search - 검색어 처리
+"""
+import asyncio
+
+from app.api.search import _build_prefix_tsquery, _parse_headline, _read_facets, _search_choseong
+from app.services.search_planner import choose_engines, needs_estimate
+
+
+def test_prefix_tsquery_matches_particles():
+    """
+    Test 1: 각 단어를 접두사 매칭으로 AND 결합 ("엘프" 검색 시 "엘프는"도 매칭)
+    """
+    assert _build_prefix_tsquery("엘프 팔라딘") == "'엘프':* & '팔라딘':*"
+
+
+def test_prefix_tsquery_strips_syntax():
+    """
+    Test 2: tsquery 문법 문자는 제거 (사용자 입력으로 쿼리 구문 오류가 나지 않도록)
+    """
+    assert _build_prefix_tsquery("O'Brien & (팔라딘)") == "'o':* & 'brien':* & '팔라딘':*"
+    assert _build_prefix_tsquery("&|!") is None
+
+
+def test_parse_headline_fragments():
+    """
+    Test 3: ts_headline 조각을 평문 snippet + 조각별 매칭 오프셋으로 변환
+    """
+    headline = "하이\x01엘프\x02 팔라딘\x03북부의 \x01엘프\x02 \x01왕국\x02"
+
+    snippet, highlights = _parse_headline(headline)
+
+    assert snippet == "하이엘프 팔라딘 ... 북부의 엘프 왕국"
+    assert highlights[0].text == "하이엘프 팔라딘"
+    assert highlights[0].matches == [[2, 4]]
+    assert highlights[1].matches == [[4, 6], [7, 9]]
+
+
+def test_read_facets():
+    """
+    Test 4: 패싯 JSON은 첫 행에서 읽고, 결과가 없으면 빈 패싯
+    """
+    class Row:
+        facets = '{"category": {"characters/player": 2}, "tag": {"종족/엘프": 1}}'
+
+    assert _read_facets([Row()], True) == {"category": {"characters/player": 2}, "tag": {"종족/엘프": 1}}
+    assert _read_facets([], True) == {}
+    assert _read_facets([Row()], False) is None
+
+
+def test_planner_orders_engines_by_query_shape():
+    """
+    Test 5: 검색어 형태와 후보 수에 따라 검색 방식 순서 결정
+    """
+    assert choose_engines("엘프") == (["short"], "short_query")
+    assert choose_engines("ㅇㄹ") == (["choseong"], "choseong")
+    # 영문 한 글자는 n-gram 색인에 없으므로 부분 일치
+    assert choose_engines("a") == (["substring"], "short_unindexed")
+    assert choose_engines("7") == (["substring"], "short_unindexed")
+    assert choose_engines("el") == (["short"], "short_query")
+    assert choose_engines("elf paladin")[0] == ["fulltext", "trigram"]
+    # 한글 단어는 후보가 적을 때만 단어 중간 일치(ILIKE) 시도
+    assert choose_engines("드워프", candidates=12)[0] == ["fulltext", "substring", "trigram"]
+    assert "substring" not in choose_engines("드워프", candidates=0)[0]
+    assert "substring" not in choose_engines("드워프", candidates=10_000)[0]
+
+    assert needs_estimate("드워프")
+    assert not needs_estimate("dwarf")
+    assert not needs_estimate("하이 엘프")
+    assert not needs_estimate("ㅅㅂㅎㄷ")
+
+
+class RecordingSession:
+    """실행한 SQL과 파라미터를 기록하고 빈 결과를 돌려주는 세션"""
+
+    class _Result:
+        def fetchall(self):
+            return []
+
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        return self._Result()
+
+
+def test_short_choseong_uses_ngram_index():
+    """
+    Test 6: 1~2자 초성은 trigram 인덱스를 쓸 수 없으므로 page_ngrams 조회, 3자 이상은 LIKE
+    """
+    session = RecordingSession()
+    asyncio.run(_search_choseong(session, "ㅇㄹ", None, None, 10))
+
+    [(sql, params)] = session.executed
+    assert "FROM page_ngrams g" in sql
+    assert "g.gram = :needle" in sql
+    assert "LIKE" not in sql
+    assert params["needle"] == "ㅇㄹ"
+
+    session = RecordingSession()
+    asyncio.run(_search_choseong(session, "ㅅㅂㅎㄷ", None, None, 10))
+
+    [(sql, params)] = session.executed
+    assert "page_ngrams" not in sql
+    assert "p.title_choseong LIKE :pattern" in sql
@@ -0,0 +1,38 @@
+"""
+Test Search Cache - 검색어 정규화와 generation 무효화
+"""
+
+from app.services import invalidation
+from app.services.search_cache import cache_key, normalize_query
+
+
+def test_normalize_query_unifies_forms():
+    """
+    Test 1: 조합형/완성형 한글, 대소문자, 공백 차이는 같은 검색어
+    """
+    decomposed = "간달프"  # 간달프 (NFD)
+    assert normalize_query(decomposed) == "간달프"
+    assert normalize_query("  Middle   EARTH ") == "middle earth"
+
+
+def test_write_changes_only_affected_scope():
+    """
+    Test 2: 문서가 바뀌면 해당 프로젝트와 통합 검색 키만 바뀜
+    """
+    options = (None, 20, "auto", False)  # category, limit, mode, facets
+    unfiltered = cache_key("간달프", None, *options)
+    in_project = cache_key("간달프", "lotr", *options)
+    other_project = cache_key("간달프", "witcher", *options)
+
+    invalidation.dispatch({"kind": "pages", "ids": [1], "slugs": ["gandalf"], "projects": ["lotr"]})
+
+    assert cache_key("간달프", None, *options) != unfiltered
+    assert cache_key("간달프", "lotr", *options) != in_project
+    assert cache_key("간달프", "witcher", *options) == other_project
+
+    # 검색 결과와 무관한 이벤트 (projects 없음)는 키를 바꾸지 않음
+    invalidation.dispatch({"kind": "pages", "ids": [1], "slugs": []})
+    assert cache_key("간달프", "witcher", *options) == other_project
+    # 범위를 모르는 전체 무효화는 모든 프로젝트 키를 바꿈
+    invalidation.dispatch({"kind": "pages", "all": True})
+    assert cache_key("간달프", "witcher", *options) != other_project
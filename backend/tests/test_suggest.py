@@ -0,0 +1,74 @@
+"""
+Test Suggest - 자동완성 접두사 색인
+"""
+from types import SimpleNamespace
+
+from app.services.suggest_index import SuggestIndex, index_keys
+
+
+def _page(id, title, project_id="lotr", view_count=0):
+    return SimpleNamespace(id=id, slug=f"p/{id}", title=title, project_id=project_id, view_count=view_count)
+
+
+def test_index_keys_cover_word_starts():
+    """
+    Test 1: 전체 이름과 각 단어 시작 위치부터의 문자열을 키로 사용 (한글은 초성 키 포함)
+    """
+    assert index_keys("Mirkwood Elves") == {"mirkwood elves", "elves"}
+    assert index_keys("엘론 실버스트라이드") == {
+        "엘론 실버스트라이드", "실버스트라이드",
+        "ㅇㄹ ㅅㅂㅅㅌㄹㅇㄷ", "ㅅㅂㅅㅌㄹㅇㄷ", "ㅇㄹㅅㅂㅅㅌㄹㅇㄷ",
+    }
+    assert {"종족/엘프", "엘프"} <= index_keys("종족/엘프")
+
+
+def test_suggest_ranks_and_updates():
+    """
+    Test 2: 이름이 접두사로 시작하는 항목 우선, 교체/삭제 즉시 반영
+    """
+    index = SuggestIndex()
+    index._set_page(_page(1, "엘론 실버스트라이드", view_count=3))
+    index._set_page(_page(2, "하이 엘프 왕국", view_count=50))
+    index._set_page(_page(3, "엘프의 숲", project_id="witcher"))
+    index._set_tag(SimpleNamespace(id=7, name="종족/엘프", display_name="엘프", usage_count=10))
+
+    labels = [item["label"] for item in index.suggest("엘프")]
+    assert labels == ["엘프", "엘프의 숲", "하이 엘프 왕국"]
+    assert [item["label"] for item in index.suggest("엘", project_id="lotr")] == ["엘프", "엘론 실버스트라이드", "하이 엘프 왕국"]
+
+    index._set_page(_page(3, "숲의 요정", project_id="witcher"))
+    assert "엘프의 숲" not in [item["label"] for item in index.suggest("엘프")]
+    index._remove("tag", 7)
+    assert [item["label"] for item in index.suggest("종족")] == []
+    assert index.stats()["entries"] == 3
+
+
+def test_suggest_matches_choseong():
+    """
+    Test 3: 초성 입력 (띄어쓰기 유무, 첫가끝 자모 모두)
+    """
+    index = SuggestIndex()
+    index._set_page(_page(1, "엘론 실버스트라이드"))
+    index._set_page(_page(2, "실버홀드"))
+
+    assert [item["label"] for item in index.suggest("ㅅㅂ")] == ["실버홀드", "엘론 실버스트라이드"]
+    assert [item["label"] for item in index.suggest("ㅇㄹㅅㅂ")] == ["엘론 실버스트라이드"]
+    assert [item["label"] for item in index.suggest("ᄋᄅ")] == ["엘론 실버스트라이드"]
+
+
+def test_bulk_build_matches_incremental():
+    """
+    Test 4: 전체 불러오기(키 모은 뒤 한 번 정렬)와 항목별 insort 결과가 같음
+    """
+    pages = [_page(1, "엘론 실버스트라이드"), _page(2, "실버홀드"), _page(3, "Mirkwood Elves")]
+
+    incremental = SuggestIndex()
+    bulk = SuggestIndex()
+    for page in pages:
+        incremental._set_page(page)
+        bulk._set_page(page, bulk=True)
+    bulk._items.sort()
+
+    assert bulk._items == incremental._items
+    bulk._set_page(_page(2, "실버 요새"))
+    assert [item["label"] for item in bulk.suggest("실버")] == ["실버 요새", "엘론 실버스트라이드"]
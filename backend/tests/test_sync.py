@@ -0,0 +1,191 @@
+"""
+GitHub 재동기화 테스트 - 경로/frontmatter → 문서 행 변환, push 웹훅 (DB 불필요)
+"""
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app.api.sync import _Changes, _delete, head_files, page_values, plan_push, slug_from_path, touched_slugs, verify_signature
+from app.core.config import settings
+from app.main import app
+from app.services.github_client import github_client
+
+
+def test_slug_from_path_only_content_markdown():
+    """
+    Test 1: content/ 아래 Markdown 파일만 문서로 취급
+    """
+    assert slug_from_path("content/종족/엘프.md") == "종족/엘프"
+    assert slug_from_path("content/archived/old.md") == "archived/old"
+    assert slug_from_path("images/map.png") is None
+    assert slug_from_path("content/notes.txt") is None
+    assert slug_from_path("README.md") is None
+
+
+def test_page_values_fills_missing_metadata_from_path():
+    """
+    Test 2: frontmatter에 없는 값은 경로에서 추정, 알 수 없는 프로젝트/상태는 무시
+    """
+    markdown = "---\ntitle: 엘프\ntags: [종족/엘프]\nproject_id: ghost\nstatus: bogus\n---\n본문"
+    values = page_values("종족/엘프", "a" * 40, markdown, project_ids={"main"})
+
+    assert values["title"] == "엘프"
+    assert values["category"] == "종족"
+    assert values["content"].strip() == "본문"
+    assert values["tags"] == ["종족/엘프"]
+    assert values["project_id"] is None
+    assert values["status"] == "active"
+
+    archived = page_values("archived/세계관/연표", "b" * 40, "본문만", project_ids=set())
+    assert archived["title"] == "연표"
+    assert archived["category"] == "세계관"
+    assert archived["status"] == "archived"
+
+
+# 기록된 웹훅 전송 (tests/fixtures, 서명 키: WEBHOOK_SECRET)
+FIXTURES = Path(__file__).parent / "fixtures"
+WEBHOOK_SECRET = "test-webhook-secret"
+
+
+def load_delivery(name: str) -> tuple[bytes, dict]:
+    body = (FIXTURES / f"{name}.json").read_bytes()
+    headers = json.loads((FIXTURES / f"{name}.headers.json").read_text())
+    return body, headers
+
+
+def test_verify_signature_on_recorded_delivery():
+    """
+    Test 3: 기록된 서명은 원본 본문과 키가 모두 같을 때만 통과
+    """
+    body, headers = load_delivery("github_push")
+    signature = headers["X-Hub-Signature-256"]
+
+    assert verify_signature(WEBHOOK_SECRET, body, signature)
+    assert not verify_signature("other-secret", body, signature)
+    assert not verify_signature(WEBHOOK_SECRET, body.replace(b"main", b"evil"), signature)
+    assert not verify_signature(WEBHOOK_SECRET, body, signature.removeprefix("sha256="))
+    assert not verify_signature(WEBHOOK_SECRET, body, None)
+
+
+def test_touched_slugs_from_recorded_push():
+    """
+    Test 4: push의 모든 커밋에서 content/ 아래 Markdown만 모음 (이미지, README 제외)
+    """
+    body, _ = load_delivery("github_push")
+
+    assert touched_slugs(json.loads(body)) == {
+        "세계관/실버홀드",
+        "인물/엘론 실버스트라이드",
+        "archived/세션/1회차",
+        "세션/1회차",
+    }
+    assert touched_slugs({"commits": []}) == set()
+
+
+def test_webhook_rejects_unsigned_and_acknowledges_ping(monkeypatch):
+    """
+    Test 5: 서명이 틀리면 401, push 이외의 이벤트는 DB 접근 없이 ignored
+    """
+    monkeypatch.setattr(settings, "GITHUB_WEBHOOK_SECRET", WEBHOOK_SECRET)
+    client = TestClient(app)
+
+    body, headers = load_delivery("github_ping")
+    response = client.post("/api/sync/webhook", content=body, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "ignored"
+
+    body, headers = load_delivery("github_push")
+    headers["X-Hub-Signature-256"] = "sha256=" + "0" * 64
+    response = client.post("/api/sync/webhook", content=body, headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"]["code"] == "INVALID_SIGNATURE"
+
+
+def test_stale_push_resolves_against_branch_head(monkeypatch):
+    """
+    Test 6: 늦게 도착한 push도 push 시점(after)이 아닌 현재 head 트리로 판단
+    """
+    body, _ = load_delivery("github_push")
+    payload = json.loads(body)
+    trees = {
+        # 늦게 도착한 push 시점: 엘론 수정, 1회차 존재
+        payload["after"]: {"content/인물/엘론 실버스트라이드.md": "old", "content/세션/1회차.md": "s1"},
+        # 이후 push: 엘론 다시 수정, 1회차 삭제
+        "c2": {"content/인물/엘론 실버스트라이드.md": "new", "content/세계관/실버홀드.md": "h1"},
+    }
+    requested = []
+
+    async def request(method: str, url: str, **kwargs) -> dict:
+        requested.append(url)
+        if url.startswith("/git/ref/heads/"):
+            return {"object": {"sha": "c2"}}
+        blobs = trees[url.rsplit("/", 1)[1]]
+        return {"tree": [{"path": path, "type": "blob", "sha": sha} for path, sha in blobs.items()]}
+
+    monkeypatch.setattr(github_client, "_request", request)
+
+    head_sha, files, truncated = asyncio.run(head_files(touched_slugs(payload)))
+
+    assert head_sha == "c2"
+    assert f"/git/trees/{payload['after']}" not in requested
+    assert files == {"인물/엘론 실버스트라이드": "new", "세계관/실버홀드": "h1"}
+    assert not truncated
+    assert asyncio.run(head_files(set())) == (None, {}, False)
+
+
+def test_plan_push_deletes_missing_files_and_keeps_unsynced():
+    """
+    Test 7: 트리에 없는 문서는 삭제, 반영 대기 중인 문서와 잘린 트리는 건드리지 않음
+    """
+    files = {"a": "a2", "b": "b1", "d": "d2"}
+    known = {"a": "a1", "b": "b1", "c": "c1", "d": "d1", "e": "e1"}
+    unsynced = {"d", "e"}
+
+    changed, removed = plan_push(files, known, unsynced, truncated=False)
+    assert changed == {"a": "a2"}
+    assert removed == ["c"]
+
+    changed, removed = plan_push(files, known, unsynced, truncated=True)
+    assert changed == {"a": "a2"}
+    assert removed == []
+
+    # 이후 push에서 지워진 새 문서: head에 없고 DB에도 없으므로 다시 만들지 않음
+    assert plan_push({}, {}, set(), truncated=False) == ({}, [])
+
+
+def test_delete_decrements_tag_counts():
+    """
+    Test 8: GitHub에서 지워진 문서 삭제는 같은 문장에서 usage_count를 줄이고 tags 무효화를 등록
+    """
+    executed = []
+
+    class Result:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def all(self):
+            return self.rows
+
+    class Session:
+        async def execute(self, statement, params=None):
+            executed.append(str(statement))
+            if len(executed) == 1:
+                return Result([
+                    SimpleNamespace(id=1, slug="a", project_id="p", tag_ids=[10, 11]),
+                    SimpleNamespace(id=2, slug="b", project_id=None, tag_ids=[10, 11]),
+                ])
+            return Result([])
+
+    changes = _Changes()
+    deleted = asyncio.run(_delete(Session(), ["a", "b"], changes))
+
+    assert deleted == ["a", "b"]
+    assert "DELETE FROM pages" in executed[0]
+    assert "UPDATE tags SET usage_count" in executed[0]
+    assert "JOIN deleted_pages ON page_tags.page_id = deleted_pages.id" in executed[0]
+    assert "INSERT INTO github_outbox" in executed[1]
+    assert changes.tag_ids == {10, 11}
+    assert changes.page_ids == {1, 2}
@@ -0,0 +1,109 @@
+"""
+Test View Counter - 조회수 버퍼링과 일괄 반영 (DB 세션은 monkeypatch)
+"""
+import asyncio
+
+from app.services import view_counter
+from app.services.view_counter import ViewCounter
+
+
+class FakeSession:
+    """실행한 SQL을 기록하는 세션 (fail_on: 이 이름의 단계에서 예외)"""
+
+    def __init__(self, log: list, fail_on=None, on_execute=None):
+        self.log = log
+        self.fail_on = fail_on
+        self.on_execute = on_execute
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, params=None):
+        if self.on_execute:
+            self.on_execute()
+        if self.fail_on == "execute":
+            raise RuntimeError("connection lost")
+        self.log.append((str(statement), params))
+
+    async def commit(self):
+        if self.fail_on == "commit":
+            raise RuntimeError("commit failed")
+        self.log.append(("COMMIT", None))
+
+
+def _sessions(monkeypatch, fail_on=None, on_execute=None) -> list:
+    log: list = []
+    monkeypatch.setattr(
+        view_counter, "AsyncSessionLocal", lambda: FakeSession(log, fail_on, on_execute)
+    )
+    return log
+
+
+def test_flush_applies_buffer_in_one_update(monkeypatch):
+    """
+    Test 1: 조회는 메모리에만 기록되고, flush는 unnest UPDATE 1회 + COMMIT으로 반영
+    """
+    log = _sessions(monkeypatch)
+    counter = ViewCounter(daily_table=False)
+    for page_id in (1, 2, 1, 1):
+        counter.record(page_id)
+
+    assert log == []
+    assert counter.pending(1) == 3
+
+    assert asyncio.run(counter.flush()) == 4
+
+    [(sql, params), (commit, _)] = log
+    assert "unnest(CAST(:ids AS integer[]), CAST(:views AS integer[]))" in sql
+    assert sql.strip().startswith("UPDATE pages")
+    assert dict(zip(params["ids"], params["views"])) == {1: 3, 2: 1}
+    assert commit == "COMMIT"
+    assert counter.pending(1) == 0
+    # 누적 조회수는 flush 이후에도 유지 (캐시 응답 보정용)
+    assert counter.recorded(1) == 3
+
+    # 반영할 것이 없으면 세션을 열지 않음
+    assert asyncio.run(counter.flush()) == 0
+    assert len(log) == 2
+
+
+def test_flush_daily_table(monkeypatch):
+    """
+    Test 2: daily_table이면 같은 트랜잭션에서 page_views도 증가
+    """
+    log = _sessions(monkeypatch)
+    counter = ViewCounter(daily_table=True)
+    counter.record(5)
+
+    asyncio.run(counter.flush())
+
+    assert [sql.strip().split()[0] for sql, _ in log] == ["UPDATE", "INSERT", "COMMIT"]
+    assert "ON CONFLICT (page_id, day)" in log[1][0]
+
+
+def test_failed_flush_requeues_once(monkeypatch):
+    """
+    Test 3: 반영에 실패하면 증가분을 버퍼에 되돌리고, 그 사이 들어온 조회와 합쳐 다음 flush에 한 번만 반영
+    """
+    counter = ViewCounter(daily_table=False)
+    counter.record(1)
+    counter.record(1)
+    counter.record(2)
+
+    _sessions(monkeypatch, fail_on="execute", on_execute=lambda: counter.record(1))
+    assert asyncio.run(counter.flush()) == 0
+    assert counter.pending(1) == 3
+    assert counter.pending(2) == 1
+
+    _sessions(monkeypatch, fail_on="commit")
+    assert asyncio.run(counter.flush()) == 0
+    assert counter.pending(1) == 3
+
+    log = _sessions(monkeypatch)
+    assert asyncio.run(counter.flush()) == 4
+    assert dict(zip(log[0][1]["ids"], log[0][1]["views"])) == {1: 3, 2: 1}
+    assert counter.pending(1) == 0
+    assert counter.recorded(1) == 3
@@ -153,7 +153,7 @@ export const createPage = async (data) => {
  * @param {string} data.summary - Page summary
  * @param {string[]} data.tags - Page tags
  * @param {string} data.expected_sha - Expected GitHub SHA for conflict detection
- * @param {boolean} data.force - Force update even if conflict
+ * @param {boolean} data.force - Skip the expected_sha check (files edited on GitHub are held as outbox conflicts, not overwritten)
  */
 export const updatePage = async (slug, data) => {
   const response = await apiClient.put(`/pages/${slug}`, data);